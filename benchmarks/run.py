@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    benchmarks/run.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent / "src"))
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from bs4 import BeautifulSoup
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from server import SyntheticWordPress, start_server
+from staticwordpress.core.constants import HOST, PROJECT, REDIRECTS, SOURCE, URL
+from staticwordpress.core.crawler import Crawler
+from staticwordpress.core.project import Project
+from staticwordpress.core.redirects import Redirect, Redirects
+from staticwordpress.core.search import Search
+from staticwordpress.core.utils import (
+    get_remote_content,
+    stream_zip_file,
+    update_links,
+)
+from staticwordpress.core.workflow import Workflow
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+BASELINES_PATH = BENCHMARKS_DIR / "baselines.json"
+BENCHMARKS = {}
+
+
+def benchmark(name_: str, repeat_: int = 3):
+    """Register a benchmark. The decorated function receives a fresh temporary
+    folder and returns the callable to be timed (setup is not measured)."""
+
+    def decorator(func):
+        BENCHMARKS[name_] = {"setup": func, "repeat": repeat_}
+        return func
+
+    return decorator
+
+
+def new_project(output_: Path, url_: str, src_type_: SOURCE) -> Project:
+    (output_ / "_data").mkdir(parents=True, exist_ok=True)
+    project = Project(output_ / "_data" / ".project.json")
+    project.status = PROJECT.NEW
+    project.name = "benchmark"
+    project.src_type = src_type_
+    project.src_url = url_
+    project.dst_url = "https://www.example.com"
+    project.output = output_
+    project.delay = 0
+    project.host = HOST.NETLIFY
+    return project
+
+
+def export_workflow(output_: Path, url_: str, src_type_: SOURCE) -> callable:
+    def run():
+        shutil.rmtree(output_, ignore_errors=True)
+        get_remote_content.cache_clear()
+        project = new_project(output_, url_, src_type_)
+        if src_type_ == SOURCE.ZIP:
+            project.redirects = REDIRECTS.REDIRECTION
+            project.wp_user = "benchmark"
+            project.wp_api_token = "benchmark"
+        workflow = Workflow()
+        workflow.set_project(project_=project)
+        workflow.export()
+        return workflow.stats.summary()
+
+    return run
+
+
+# End-to-end workflow runs against the synthetic website
+@benchmark("workflow.crawl", repeat_=3)
+def workflow_crawl(tmp_path_: Path, url_: str) -> callable:
+    return export_workflow(tmp_path_ / "crawl", url_, SOURCE.CRAWL)
+
+
+@benchmark("workflow.zip", repeat_=3)
+def workflow_zip(tmp_path_: Path, url_: str) -> callable:
+    return export_workflow(tmp_path_ / "zip", url_, SOURCE.ZIP)
+
+
+# Micro benchmarks of individual functions
+@benchmark("crawler.init", repeat_=5)
+def crawler_init(tmp_path_: Path, url_: str) -> callable:
+    locations = [f"{url_}/page-{index}/" for index in range(5000)]
+    return lambda: [Crawler(loc_=loc, typ_=URL.FOLDER) for loc in locations]
+
+
+@benchmark("update_links", repeat_=5)
+def update_links_page(tmp_path_: Path, url_: str) -> callable:
+    website = SyntheticWordPress(links=50, paragraphs=50)
+    pages = [website.page(url_, index) for index in range(5000)]
+    return lambda: [
+        update_links(page, url_, "https://www.example.com") for page in pages
+    ]
+
+
+@benchmark("search.add", repeat_=5)
+def search_add(tmp_path_: Path, url_: str) -> callable:
+    website = SyntheticWordPress()
+    soups = [BeautifulSoup(website.page(url_, index), "lxml") for index in range(200)]
+
+    def run():
+        search = Search(dst_url_="https://www.example.com")
+        for index, soup in enumerate(soups):
+            search.add(soup_=soup, url_path_=f"page-{index}")
+
+    return run
+
+
+@benchmark("redirects.consolidate_save", repeat_=5)
+def redirects_consolidate_save(tmp_path_: Path, url_: str) -> callable:
+    rules = [
+        Redirect(
+            from_=f"/old/section-{index % 100}/post-{index}/",
+            to_=f"/new/section-{index % 100}/post-{index}/",
+            query_=None,
+            status_=301,
+            force_=False,
+            source_=REDIRECTS.REDIRECTION.value,
+        )
+        for index in range(10000)
+    ]
+
+    def run():
+        redirects = Redirects()
+        redirects.add_redirects(rules)
+        redirects.consolidate()
+        redirects.save(tmp_path_ / "_redirects", HOST.LOCALHOST)
+
+    return run
+
+
+@benchmark("stream_zip_file", repeat_=3)
+def stream_zip(tmp_path_: Path, url_: str) -> callable:
+    website = SyntheticWordPress(pages=500)
+    zip_path = tmp_path_ / "archive.zip"
+    zip_path.write_bytes(website.archive(url_))
+    output = tmp_path_ / "extracted"
+
+    def run():
+        shutil.rmtree(output, ignore_errors=True)
+        output.mkdir()
+        stream_zip_file(zip_path, output_location_=output)
+
+    return run
+
+
+def measure(name_: str, url_: str, repeat_: int = None) -> dict:
+    """Best, mean and worst wall time of repeated runs of a benchmark"""
+    timings = []
+    repeat_ = repeat_ or BENCHMARKS[name_]["repeat"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run = BENCHMARKS[name_]["setup"](Path(tmp_dir), url_)
+        for _ in range(repeat_):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+
+    return {
+        "best": round(min(timings), 4),
+        "mean": round(sum(timings) / len(timings), 4),
+        "worst": round(max(timings), 4),
+    }
+
+
+def compare(results_: dict, baselines_: dict, tolerance_: float) -> list:
+    """Names of benchmarks whose best time exceeds the baseline by more than
+    tolerance_ (fraction)"""
+    return [
+        name
+        for name, result in results_.items()
+        if name in baselines_
+        and result["best"] > baselines_[name]["best"] * (1 + tolerance_)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="static-wordpress benchmarks")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=None)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    names = arguments.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    baselines = (
+        json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    )
+    server, url = start_server(pages=arguments.pages)
+    results = {}
+    try:
+        for name in names:
+            results[name] = measure(name, url, arguments.repeat)
+            baseline = baselines.get("results", {}).get(name, {}).get("best")
+            change = (
+                f"{100 * (results[name]['best'] / baseline - 1):+.1f}%"
+                if baseline
+                else "-"
+            )
+            print(
+                f"{name:<30} best {results[name]['best']:>8.4f}s "
+                f"mean {results[name]['mean']:>8.4f}s  baseline {change}"
+            )
+    finally:
+        server.shutdown()
+
+    if arguments.update_baseline:
+        baselines = {
+            "machine": f"{platform.system()} {platform.machine()} "
+            f"python {platform.python_version()}",
+            "results": {**baselines.get("results", {}), **results},
+        }
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=4) + "\n")
+        print(f"Baselines written to {BASELINES_PATH}")
+        return 0
+
+    regressions = compare(results, baselines.get("results", {}), arguments.tolerance)
+    for name in regressions:
+        print(
+            f"REGRESSION {name}: slower than baseline by more than "
+            f"{100 * arguments.tolerance:.0f}%"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    benchmarks/server.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import io
+import json
+import re
+import threading
+from zipfile import ZipFile, ZIP_DEFLATED
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+ARCHIVE_NAME = "simply-static-1-1700000000"
+ARCHIVE_FOLDER = "/wp-content/uploads/simply-static/temp-files/"
+
+DEFAULT_SITE = {
+    "pages": 200,  # number of pages
+    "links": 10,  # internal links per page
+    "assets": 2,  # images per page
+    "asset_size": 16384,  # bytes per image
+    "redirects": 20,  # /old-page-N/ -> /page-N/ (301)
+    "sitemaps": 4,  # sub-sitemaps listed in sitemap_index.xml
+    "paragraphs": 5,  # text paragraphs per page
+}
+
+
+class SyntheticWordPress:
+    """Deterministic WordPress-like website: pages with internal links and
+    images, sitemap index, 301 redirects, a search page, the Redirection
+    plugin API and a Simply Static ZIP archive (served with Range support)."""
+
+    def __init__(self, **site_) -> None:
+        self._site = {**DEFAULT_SITE, **site_}
+        self._asset = bytes(range(256)) * (self._site["asset_size"] // 256 + 1)
+        self._asset = self._asset[: self._site["asset_size"]]
+        self._archive = None
+        self._lock = threading.Lock()
+
+    @property
+    def site(self) -> dict:
+        return self._site
+
+    def page(self, host_: str, index_: int) -> str:
+        pages = self._site["pages"]
+        links = "".join(
+            f'<li><a href="{host_}/page-{(index_ * 7 + step * 13 + 1) % pages}/">'
+            f"Page {(index_ * 7 + step * 13 + 1) % pages}</a></li>"
+            for step in range(self._site["links"])
+        )
+        images = "".join(
+            f'<img src="{host_}/wp-content/uploads/img-{index_}-{asset}.png">'
+            for asset in range(self._site["assets"])
+        )
+        paragraphs = "".join(
+            f"<p>Paragraph {paragraph} of page {index_}: static wordpress "
+            f"benchmark content lorem ipsum dolor sit amet.</p>"
+            for paragraph in range(self._site["paragraphs"])
+        )
+        return (
+            f"<!DOCTYPE html><html><head><title>Page {index_}</title>"
+            f'<link rel="stylesheet" href="{host_}/wp-content/themes/style.css">'
+            f"</head><body><h1>Page {index_}</h1>{paragraphs}{images}"
+            f"<ul>{links}</ul></body></html>"
+        )
+
+    def home(self, host_: str) -> str:
+        redirects = "".join(
+            f'<a href="{host_}/old-page-{index}/">Old {index}</a>'
+            for index in range(self._site["redirects"])
+        )
+        return (
+            f"<!DOCTYPE html><html><head><title>Home</title></head><body>"
+            f'<a href="{host_}/page-0/">Page 0</a>'
+            f'<a href="{host_}/search/">Search</a>{redirects}</body></html>'
+        )
+
+    def search(self) -> str:
+        return (
+            "<!DOCTYPE html><html><head><title>Search</title></head>"
+            '<body><div id="search-results"></div></body></html>'
+        )
+
+    def sitemap_index(self, host_: str) -> str:
+        sitemaps = "".join(
+            f"<sitemap><loc>{host_}/page-sitemap{index}.xml</loc></sitemap>"
+            for index in range(self._site["sitemaps"])
+        )
+        return f'<?xml version="1.0"?><sitemapindex>{sitemaps}</sitemapindex>'
+
+    def sitemap(self, host_: str, index_: int) -> str:
+        urls = "".join(
+            f"<url><loc>{host_}/page-{page}/</loc></url>"
+            for page in range(index_, self._site["pages"], self._site["sitemaps"])
+        )
+        return f'<?xml version="1.0"?><urlset>{urls}</urlset>'
+
+    def redirections(self) -> str:
+        return json.dumps(
+            {
+                "items": [
+                    {
+                        "url": f"/old-page-{index}/",
+                        "action_data": {"url": f"/page-{index}/"},
+                        "action_code": 301,
+                    }
+                    for index in range(self._site["redirects"])
+                ]
+            }
+        )
+
+    def simply_static_settings(self, host_: str) -> str:
+        return json.dumps(
+            {
+                "archive_name": ARCHIVE_NAME,
+                "archive_status_messages": {
+                    "create_zip_archive": {
+                        "message": f'ZIP archive created: <a href="{host_}'
+                        f'{ARCHIVE_FOLDER}{ARCHIVE_NAME}.zip">Click here</a>'
+                    }
+                },
+            }
+        )
+
+    def archive(self, host_: str) -> bytes:
+        """Simply Static export of the whole website, built once"""
+        with self._lock:
+            if self._archive is None:
+                buffer = io.BytesIO()
+                with ZipFile(buffer, "w", ZIP_DEFLATED) as zip_file:
+                    zip_file.writestr(f"{ARCHIVE_NAME}/index.html", self.home(host_))
+                    zip_file.writestr(
+                        f"{ARCHIVE_NAME}/search/index.html", self.search()
+                    )
+                    for index in range(self._site["pages"]):
+                        zip_file.writestr(
+                            f"{ARCHIVE_NAME}/page-{index}/index.html",
+                            self.page(host_, index),
+                        )
+                        for asset in range(self._site["assets"]):
+                            zip_file.writestr(
+                                f"{ARCHIVE_NAME}/wp-content/uploads/img-{index}-{asset}.png",
+                                self._asset,
+                            )
+                self._archive = buffer.getvalue()
+            return self._archive
+
+    def route(self, host_: str, path_: str) -> tuple:
+        """Response for a path
+
+        Returns:
+            tuple: (status, headers, content)
+        """
+        html = {"Content-Type": "text/html; charset=UTF-8"}
+        xml = {"Content-Type": "application/xml; charset=UTF-8"}
+        json_type = {"Content-Type": "application/json"}
+
+        if path_ == "/":
+            return 200, html, self.home(host_).encode()
+        if path_ == "/search/":
+            return 200, html, self.search().encode()
+        if path_ == "/sitemap_index.xml":
+            return 200, xml, self.sitemap_index(host_).encode()
+        if path_ == "/wp-json/redirection/v1/redirect":
+            return 200, json_type, self.redirections().encode()
+        if path_ == "/wp-json/simplystatic/v1/settings":
+            return 200, json_type, self.simply_static_settings(host_).encode()
+        if path_ == f"{ARCHIVE_FOLDER}{ARCHIVE_NAME}.zip":
+            return 200, {"Content-Type": "application/zip"}, self.archive(host_)
+        if path_ == "/wp-content/themes/style.css":
+            return 200, {"Content-Type": "text/css"}, b"body { margin: 0; }"
+
+        match = re.fullmatch(r"/page-(\d+)/", path_)
+        if match and int(match.group(1)) < self._site["pages"]:
+            return 200, html, self.page(host_, int(match.group(1))).encode()
+
+        match = re.fullmatch(r"/old-page-(\d+)/", path_)
+        if match and int(match.group(1)) < self._site["redirects"]:
+            return 301, {"Location": f"{host_}/page-{match.group(1)}/"}, b""
+
+        match = re.fullmatch(r"/page-sitemap(\d+)\.xml", path_)
+        if match and int(match.group(1)) < self._site["sitemaps"]:
+            return 200, xml, self.sitemap(host_, int(match.group(1))).encode()
+
+        if re.fullmatch(r"/wp-content/uploads/img-\d+-\d+\.png", path_):
+            return 200, {"Content-Type": "image/png"}, self._asset
+
+        return 404, html, b"<html><head><title>Not Found</title></head></html>"
+
+
+class SyntheticWordPressHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # avoid delayed ACK stalls on keep-alive
+    website = None
+
+    def do_HEAD(self):
+        self.respond(send_content_=False)
+
+    def do_GET(self):
+        self.respond(send_content_=True)
+
+    def respond(self, send_content_: bool) -> None:
+        host = f"http://{self.headers['Host']}"
+        status, headers, content = self.website.route(host, self.path.split("?")[0])
+
+        # Range support for segmented downloads of the archive
+        byte_range = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if status == 200 and byte_range:
+            start = int(byte_range.group(1))
+            end = int(byte_range.group(2) or len(content) - 1)
+            headers = {
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{len(content)}",
+            }
+            status, content = 206, content[start : end + 1]
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if send_content_:
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(**site_) -> tuple:
+    """Serve a synthetic website on a free local port in a background thread
+
+    Returns:
+        tuple: (server, url)
+    """
+    handler = type(
+        "Handler",
+        (SyntheticWordPressHandler,),
+        {"website": SyntheticWordPress(**site_)},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a synthetic WordPress site")
+    parser.add_argument("--port", type=int, default=8000)
+    for key, value in DEFAULT_SITE.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=value)
+    arguments = vars(parser.parse_args())
+    port = arguments.pop("port")
+
+    SyntheticWordPressHandler.website = SyntheticWordPress(**arguments)
+    print(f"Serving synthetic WordPress site on http://127.0.0.1:{port}")
+    ThreadingHTTPServer(("127.0.0.1", port), SyntheticWordPressHandler).serve_forever()
@@ -74,6 +74,7 @@ extras_require = {
         "pymdown-extensions",
     ],
     "gui": ["pyqt5", "qtconsole"],
+    "async": ["httpx[http2]"],
 }
 extras_require["all"] = list(
     {rq for target in extras_require.keys() for rq in extras_require[target]}
@@ -119,6 +120,7 @@ setup(
     entry_points={
         "console_scripts": [
             "staticwordpress = staticwordpress.gui:main",
+            "staticwordpress-batch = staticwordpress.cli.batch:main",
         ],
     },
     classifiers=[
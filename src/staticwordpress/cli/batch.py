@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/cli/batch.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import sys
+import logging
+import threading
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import click
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.batch import BatchExporter
+from ..core.constants import CONFIGS
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@click.command()
+@click.argument(
+    "projects", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False)
+)
+@click.option(
+    "--workers",
+    default=CONFIGS["BATCH"]["WORKERS"],
+    show_default=True,
+    help="Maximum number of projects exported at the same time.",
+)
+@click.option(
+    "--fetch-workers",
+    default=CONFIGS["BATCH"]["FETCH_WORKERS"],
+    show_default=True,
+    help="Maximum number of requests in flight over all projects.",
+)
+@click.option(
+    "--report",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the aggregate report as JSON file.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the workflow stages into _data/profiles of each project.",
+)
+@click.option("--verbose", is_flag=True, help="Show debug messages.")
+def main(projects, workers, fetch_workers, report, profile, verbose):
+    """Export several PROJECTS (_data/.project.json files) concurrently."""
+    logging.basicConfig(
+        format="%(asctime)s - %(levelname)s - %(threadName)s - %(message)s",
+        level=logging.DEBUG if verbose else logging.INFO,
+        stream=sys.stdout,
+    )
+
+    if profile:
+        CONFIGS["PROFILE"]["ENABLED"] = True
+
+    batch_exporter = BatchExporter(
+        project_paths_=projects, max_workers_=workers, max_fetches_=fetch_workers
+    )
+
+    finished = threading.Event()
+
+    def show_progress():
+        while not finished.wait(CONFIGS["BATCH"]["PROGRESS_INTERVAL"]):
+            for project_path, progress in batch_exporter.progress().items():
+                logging.info(
+                    f"{progress.message} ({progress.percent}%): {project_path}"
+                )
+
+    threading.Thread(target=show_progress, daemon=True).start()
+    try:
+        results = batch_exporter.run()
+    finally:
+        finished.set()
+
+    for project in results["projects"]:
+        click.echo(
+            f"{project['status']:<8}{project['duration']:>10.1f}s"
+            f"{project['pages']:>8} pages{project['requests']:>8} requests"
+            f"{project['bytes']:>14} bytes  "
+            f"{project['project']}"
+        )
+    click.echo(
+        f"{'total':<8}{results['duration']:>10.1f}s"
+        f"{results['pages']:>8} pages{results['requests']:>8} requests"
+        f"{results['bytes']:>14} bytes"
+    )
+
+    if report:
+        batch_exporter.save_report(report)
+
+    sys.exit(1 if results["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/batch.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.project import Project
+from ..core.workflow import Workflow
+from ..core.constants import CONFIGS, PROJECT
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class BatchExporter:
+    """Export several projects concurrently.
+
+    At most max_workers_ projects are exported at the same time and at most
+    max_fetches_ requests are in flight over all projects. All workflows
+    share one HTTP connection pool and requests to the same origin are spaced
+    by the project delay, even if several projects crawl the same website.
+    """
+
+    def __init__(
+        self, project_paths_: list, max_workers_: int = None, max_fetches_: int = None
+    ) -> None:
+        self._project_paths = [Path(path) for path in project_paths_]
+        self._max_workers = max_workers_ or CONFIGS["BATCH"]["WORKERS"]
+        self._fetch_slots = threading.BoundedSemaphore(
+            max_fetches_ or CONFIGS["BATCH"]["FETCH_WORKERS"]
+        )
+        self._workflows = dict()
+        self._lock = threading.Lock()
+        self._report = dict()
+
+    @property
+    def report(self) -> dict:
+        return self._report
+
+    def run(self) -> dict:
+        """Export all projects
+
+        Returns:
+            dict: Aggregate report with duration, pages, requests and bytes per project
+        """
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(self.export_project, project_path)
+                for project_path in self._project_paths
+            ]
+            try:
+                projects = [future.result() for future in futures]
+            except KeyboardInterrupt:
+                self.stop()
+                raise
+
+        self._report = {
+            "projects": projects,
+            "duration": round(time.monotonic() - start, 3),
+            "pages": sum(project["pages"] for project in projects),
+            "requests": sum(project["requests"] for project in projects),
+            "bytes": sum(project["bytes"] for project in projects),
+            "failed": sum(1 for project in projects if project["status"] != "done"),
+        }
+        logging.info(
+            f"Exported {len(projects)} Projects in {self._report['duration']}s: "
+            f"{self._report['pages']} pages, {self._report['requests']} requests, "
+            f"{self._report['bytes']} bytes, "
+            f"{self._report['failed']} failed"
+        )
+        return self._report
+
+    def export_project(self, project_path_: Path) -> dict:
+        """Open and export a single project, errors are reported and do not
+        stop other projects.
+
+        Args:
+            project_path_ (Path): Path of the project file
+
+        Returns:
+            dict: Report of the project
+        """
+        start = time.monotonic()
+        result = {
+            "project": project_path_.stem,
+            "path": str(project_path_),
+            "status": "done",
+            "error": "",
+            "duration": 0,
+            "pages": 0,
+            "requests": 0,
+            "bytes": 0,
+            "stats": {},
+        }
+
+        workflow = None
+        try:
+            project = Project(project_path_)
+            project.open()
+            if project.status == PROJECT.NOT_FOUND or not project.is_valid():
+                raise ValueError(f"Project is not valid: {project_path_}")
+            result["project"] = project.name
+
+            workflow = Workflow()
+            workflow.fetch_slots = self._fetch_slots
+            workflow.set_project(project)
+            with self._lock:
+                self._workflows[project_path_] = workflow
+
+            logging.info(f"Exporting Project: {project.name}")
+            workflow.export()
+
+            # totals of the export, also if nothing changed since the last one
+            result["stats"] = workflow.stats.summary()
+            result["pages"] = workflow.pages
+            result["requests"] = result["stats"]["requests"]
+            result["bytes"] = result["stats"]["bytes"]
+        except Exception as e:
+            logging.error(f"Exporting Project {project_path_} Failed: {e}")
+            result["status"] = "failed"
+            result["error"] = str(e)
+        finally:
+            with self._lock:
+                self._workflows.pop(project_path_, None)
+            if workflow:
+                workflow.shutdown()
+
+        result["duration"] = round(time.monotonic() - start, 3)
+        logging.info(
+            f"Exported Project {result['project']} in {result['duration']}s: "
+            f"{result['pages']} pages, {result['requests']} requests, "
+            f"{result['bytes']} bytes"
+        )
+        return result
+
+    def progress(self) -> dict:
+        """Crawl progress of the running exports
+
+        Returns:
+            dict: project path -> CrawlProgress
+        """
+        with self._lock:
+            return {
+                project_path: workflow.progress
+                for project_path, workflow in self._workflows.items()
+            }
+
+    def stop(self) -> None:
+        """Stop all running exports after their current step"""
+        with self._lock:
+            for workflow in self._workflows.values():
+                workflow.stop_calculations()
+
+    def save_report(self, report_path_: Path) -> None:
+        with open(report_path_, "w", encoding="utf-8") as f:
+            json.dump(self._report, f, indent=4)
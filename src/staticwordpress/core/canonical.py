@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/canonical.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import hashlib
+from urllib import parse
+from functools import lru_cache
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS, COMPILED_CONFIGS
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+# characters which are kept as they are when paths are quoted again
+PATH_SAFE_CHARS = "/!$&'()*+,;=:@"
+
+
+def url_hash(url_: str) -> int:
+    """64 bit blake2b hash of a (canonical) url. Stable across runs, unlike
+    hash()."""
+    digest = hashlib.blake2b(url_.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def remove_dot_segments(path_: str) -> str:
+    """Resolve . and .. segments of an absolute path (RFC 3986, 5.2.4)"""
+    segments = []
+    for segment in path_.split("/"):
+        if segment == "..":
+            if len(segments) > 1:
+                segments.pop()
+        elif segment != ".":
+            segments.append(segment)
+
+    path = "/".join(segments)
+    if path_.endswith(("/.", "/..")):
+        path += "/"
+    return path
+
+
+def canonical_url(url_: str) -> str:
+    """Canonical form of url_, urls with the same canonical form are treated
+    as the same page. The rules are configured in CONFIGS["CANONICAL"]:
+    scheme folding (http and https), lower case host, default ports, index
+    files and trailing slashes of paths, dropped tracking query parameters
+    and sorted query parameters. Fragments are always removed.
+
+    Args:
+        url_ (str): Absolute url
+
+    Returns:
+        str: Canonical url
+    """
+    rules = CONFIGS["CANONICAL"]
+    url = parse.urlsplit(url_)
+
+    scheme = url.scheme.lower()
+    netloc = url.netloc.lower() if rules["LOWERCASE_HOST"] else url.netloc
+    if rules["DEFAULT_PORTS"] and scheme in DEFAULT_PORTS:
+        host, _, port = netloc.rpartition(":")
+        if port == DEFAULT_PORTS[scheme]:
+            netloc = host
+    if rules["FOLD_SCHEME"] and scheme in DEFAULT_PORTS:
+        scheme = "https"
+
+    path = parse.quote(
+        remove_dot_segments(parse.unquote(url.path)) or "/",
+        safe=PATH_SAFE_CHARS,
+    )
+    directory, _, name = path.rpartition("/")
+    if name in rules["INDEX_FILES"]:
+        path = f"{directory}/"
+    elif rules["TRAILING_SLASH"] and name and "." not in name:
+        path = f"{path}/"
+
+    query = [
+        (key, value)
+        for key, value in parse.parse_qsl(url.query, keep_blank_values=True)
+        if not COMPILED_CONFIGS["DROP_PARAMS"].match(key)
+    ]
+    if rules["SORT_PARAMS"]:
+        query.sort()
+
+    return parse.urlunsplit((scheme, netloc, path, parse.urlencode(query), ""))
+
+
+@lru_cache(maxsize=1 << 16)
+def canonical_key(url_: str) -> int:
+    """Hash of the canonical url, used as key for deduplication of urls,
+    e.g. links discovered on thousands of pages"""
+    return url_hash(canonical_url(url_))
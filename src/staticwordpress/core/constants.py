@@ -32,6 +32,12 @@ import json
 from pathlib import Path
 from enum import Enum
 
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.snapshot import load_snapshot, compile_configs
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # CONSTANTS LIST
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -52,9 +58,21 @@ LINK_REGEX = re.compile(
     re.DOTALL,
 )
 
+# top level entries of the output folder which are not part of the website
+OUTPUT_PROTECTED = [".git", ".gitignore", "_data"]
+
 CONFIG_PATH = SHARE_FOLDER_PATH / "config.json"
-with CONFIG_PATH.open("r") as f:
-    CONFIGS = json.load(f)
+
+
+def _read_configs() -> tuple:
+    with CONFIG_PATH.open("r") as f:
+        configs = json.load(f)
+    return configs, compile_configs(configs)
+
+
+# parsed config.json and the lookup tables derived from it, served from a
+# snapshot as long as config.json is unchanged
+CONFIGS, COMPILED_CONFIGS = load_snapshot("config", [CONFIG_PATH], _read_configs)
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -65,6 +83,7 @@ with CONFIG_PATH.open("r") as f:
 def save_configs():
     with CONFIG_PATH.open("w") as f:
         json.dump(CONFIGS, f, indent=4)
+    COMPILED_CONFIGS.update(compile_configs(CONFIGS))
 
 
 class ExtendedEnum(Enum):
@@ -90,8 +109,10 @@ class HOST(ExtendedEnum):
     """An enum for the different Hostings."""
 
     NETLIFY = "NETLIFY"
-    # CLOUDFLARE = "CLOUDFLARE"
-    # LOCALHOST = "LOCALHOST"
+    CLOUDFLARE = "CLOUDFLARE"
+    LOCALHOST = "LOCALHOST"
+    NGINX = "NGINX"
+    APACHE = "APACHE"
     # GITHUB = "GITHUB"
     # GITLAB = "GITLAB"
 
@@ -134,6 +155,7 @@ class REDIRECTS(ExtendedEnum):
 
     NONE = "NONE"  # Do not include Redirects
     REDIRECTION = "REDIRECTION"  # redirects Plugin from WP Plugin Repository
+    CRAWL = "CRAWL"  # redirects followed while crawling, not a project option
 
 
 class USER_AGENT(ExtendedEnum):
@@ -144,10 +166,18 @@ class USER_AGENT(ExtendedEnum):
     CUSTOM = "CUSTOM"
 
 
+class FETCH(ExtendedEnum):
+    """HTTP clients for fetching pages"""
+
+    REQUESTS = "requests"  # blocking requests session
+    HTTPX = "httpx"  # asyncio with HTTP/2, optional httpx package
+
+
 # Dict with enumeration mapping
 ENUMS_MAP = {
     "redirects": REDIRECTS,
     "host": HOST,
     "source": SOURCE,
     "user-agent": USER_AGENT,
+    "fetch-backend": FETCH,
 }
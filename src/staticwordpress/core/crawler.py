@@ -28,7 +28,6 @@ specific language governing rights and limitations under the License.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 import re
-import hashlib
 import json
 from urllib import parse
 from pathlib import Path
@@ -37,16 +36,20 @@ from pathlib import Path
 # 3rd PARTY LIBRARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-import requests
 from requests import PreparedRequest
-from requests.structures import CaseInsensitiveDict
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from ..core.utils import get_mock_response, get_remote_content, get_clean_url
-from ..core.constants import CONFIGS, URL, LINK_REGEX
+from ..core.utils import (
+    get_mock_response,
+    get_remote_content,
+    get_clean_url,
+    download_file,
+)
+from ..core.constants import CONFIGS, COMPILED_CONFIGS, URL, LINK_REGEX
+from ..core.canonical import canonical_url, url_hash
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -67,14 +70,10 @@ class Crawler:
         self._urlparse = parse.urlparse(self._loc)
 
         file_ext = self._urlparse.path.split(".")[-1].upper()
-        if file_ext:
-            for keys in CONFIGS["FORMATS"]:
-                if file_ext in CONFIGS["FORMATS"][keys]:
-                    self._typ = URL[keys]
-
-        if any(
-            [exclule_url in self._urlparse.path for exclule_url in CONFIGS["EXCLUDE"]]
-        ):
+        if file_ext in COMPILED_CONFIGS["EXTENSIONS"]:
+            self._typ = URL[COMPILED_CONFIGS["EXTENSIONS"][file_ext]]
+
+        if COMPILED_CONFIGS["EXCLUDE"].search(self._urlparse.path):
             self._typ = URL.NONE
 
         if self._typ == URL.FOLDER:
@@ -86,12 +85,18 @@ class Crawler:
         self._response = get_mock_response(url_=self._urlparse)
         self._internal_links = []
         self._externals_links = []
-        self._hash = hashlib.sha256(self._loc.encode("utf-8")).hexdigest()
+        self._output_path = None
+        self._canonical = canonical_url(self._loc)
+        self._hash = url_hash(self._canonical)
 
     @property
-    def hash(self) -> str:
+    def hash(self) -> int:
         return self._hash
 
+    @property
+    def canonical(self) -> str:
+        return self._canonical
+
     @property
     def typ(self) -> str:
         return self._typ
@@ -104,6 +109,16 @@ class Crawler:
     def internal_links(self) -> list:
         return self._internal_links
 
+    @property
+    def output_path(self) -> Path:
+        """File written by the last save, None if nothing was written"""
+        return self._output_path
+
+    @property
+    def size(self) -> int:
+        """Size of the fetched content in bytes"""
+        return len(self._response.content or b"")
+
     @property
     def status_code(self) -> int:
         return self._response.status_code
@@ -184,6 +199,10 @@ class Crawler:
     def redirects_chain(self) -> list:
         return [history.url for history in self._response.history]
 
+    @property
+    def is_redirected(self) -> bool:
+        return len(self._response.history) > 0
+
     @property
     def is_valid(self) -> bool:
         return all(
@@ -198,13 +217,19 @@ class Crawler:
     def update_scheme(self, new_schema: str = "https") -> None:
         self._loc = self._loc.replace(self._urlparse.scheme, new_schema)
         self._urlparse = parse.urlparse(self._loc)
-        self._hash = hashlib.sha256(self._loc.encode("utf-8")).hexdigest()
-
-    def fetch(self) -> None:
-        if self.is_valid:
-            self._response = get_remote_content(self._urlparse)
+        self._canonical = canonical_url(self._loc)
+        self._hash = url_hash(self._canonical)
+
+    def fetch(self, cached_: bool = True, backend_=None) -> None:
+        # archives are downloaded in chunks by save()
+        if self.is_valid and self._typ != URL.ZIP:
+            self._response = (
+                get_remote_content(self._urlparse, backend_=backend_)
+                if cached_
+                else get_remote_content.__wrapped__(self._urlparse, backend_=backend_)
+            )
 
-            if self._typ in [URL.FOLDER, URL.HTML, URL.JS, URL.HOME]:
+            if self._typ in [URL.FOLDER, URL.HTML, URL.JS, URL.HOME, URL.XML]:
                 extracted_urls = set(
                     [link[0] for link in re.findall(LINK_REGEX, self._response.text)]
                 )
@@ -216,7 +241,9 @@ class Crawler:
                     url for url in extracted_urls if self._urlparse.netloc not in url
                 ]
 
-    def save(self, full_output_folder: Path, dst_url: str = "") -> str:
+    def save(
+        self, full_output_folder: Path, dst_url: str = "", progress_callback_=None
+    ) -> str:
         folder_path = (
             Path(self.path[1:]) if self.path.startswith("/") else Path(self.path)
         )
@@ -263,19 +290,13 @@ class Crawler:
                 json.dump(json.loads(self._response.text), file, indent=4)
 
         elif self._typ == URL.ZIP:
-            headers = CaseInsensitiveDict()
-            headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            headers["Pragma"] = "no-cache"
-            headers["Expires"] = "0"
-
-            current_session = requests.session()
-            response = current_session.get(self._loc, headers=headers)
-
-            if response.status_code == 200:
-                with open(full_output_path, "wb") as fd:
-                    for chunk in response.iter_content(chunk_size=128):
-                        fd.write(chunk)
-            current_session.cookies.clear()
+            download_file(
+                url_=self._loc,
+                output_path_=full_output_path,
+                chunk_size_=CONFIGS["SIMPLYSTATIC"]["DOWNLOAD"]["CHUNK_SIZE"],
+                segments_=CONFIGS["SIMPLYSTATIC"]["DOWNLOAD"]["SEGMENTS"],
+                progress_callback_=progress_callback_,
+            )
 
         elif self._typ == URL.FONTS:
             totalbits = 0
@@ -286,4 +307,7 @@ class Crawler:
                             totalbits += 1024
                             f.write(chunk)
 
+        if self._typ not in [URL.NONE] and full_output_path.exists():
+            self._output_path = full_output_path
+
         return self._urlparse.path
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/deploy.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import hashlib
+import logging
+from pathlib import Path
+from urllib import parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS, HOST, OUTPUT_PROTECTED
+from ..core.errors import DeployFailed
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class DeployBackend:
+    """Publish the output folder directly to a host, without a git round trip.
+
+    Sub classes implement `deploy`. Digests of output files are cached by
+    size and modification time in _data/.deploy-digests.json, so only new
+    or modified files are read and hashed.
+    """
+
+    digest = "sha1"
+
+    def __init__(self, token_: str, site_: str, api_url_: str = "") -> None:
+        assert token_ != ""
+        assert site_ != ""
+
+        self._token = token_
+        self._site = site_
+        self._api_url = api_url_.rstrip("/")
+
+        retry = Retry(
+            total=CONFIGS["DEPLOY"]["RETRIES"],
+            backoff_factor=CONFIGS["DEPLOY"]["BACKOFF"],
+            status_forcelist=[429, 500, 502, 503, 504],
+            # file uploads are idempotent, creating a deploy (POST) is not
+            allowed_methods=frozenset(["GET", "PUT"]),
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            self._api_url,
+            HTTPAdapter(
+                max_retries=retry,
+                pool_maxsize=CONFIGS["DEPLOY"]["WORKERS"],
+            ),
+        )
+        self._session.headers.update({"Authorization": f"Bearer {self._token}"})
+
+    @property
+    def site(self) -> str:
+        return self._site
+
+    def file_digests(self, output_dir_: Path) -> dict:
+        """Content digests of all files which are published
+
+        Args:
+            output_dir_ (Path): Output folder of the project
+
+        Returns:
+            dict: /relative/path -> hex digest
+        """
+        output_dir_ = Path(output_dir_)
+        cache_path = output_dir_ / "_data" / ".deploy-digests.json"
+        cache = dict()
+        if cache_path.exists():
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+
+        digests, updated_cache = dict(), dict()
+        for path in sorted(output_dir_.rglob("*")):
+            relative_path = path.relative_to(output_dir_)
+            if (
+                relative_path.parts[0] in OUTPUT_PROTECTED
+                or any(part.startswith(".") for part in relative_path.parts)
+                or not path.is_file()
+            ):
+                continue
+
+            key = relative_path.as_posix()
+            file_stat = path.stat()
+            cached = cache.get(key)
+            if cached and cached[:2] == [file_stat.st_size, file_stat.st_mtime_ns]:
+                digest = cached[2]
+            else:
+                file_hash = hashlib.new(self.digest)
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        file_hash.update(chunk)
+                digest = file_hash.hexdigest()
+            updated_cache[key] = [file_stat.st_size, file_stat.st_mtime_ns, digest]
+            digests[f"/{key}"] = digest
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(updated_cache), encoding="utf-8")
+        return digests
+
+    def deploy(self, output_dir_: Path, progress_callback_=None) -> dict:
+        raise NotImplementedError
+
+
+class NetlifyDeploy(DeployBackend):
+    """Netlify file digest deploys: the site manifest (path -> sha1) is posted
+    and only files Netlify does not know yet are uploaded."""
+
+    def __init__(self, token_: str, site_: str, api_url_: str = "") -> None:
+        super().__init__(
+            token_, site_, api_url_ or CONFIGS["DEPLOY"]["NETLIFY"]["API_URL"]
+        )
+
+    def deploy(self, output_dir_: Path, progress_callback_=None) -> dict:
+        """Deploy output_dir_ to the Netlify site
+
+        Args:
+            output_dir_ (Path): Output folder of the project
+            progress_callback_ (callable, optional): Called as progress_callback_(percent).
+
+        Raises:
+            DeployFailed: Netlify rejected the deploy or an upload failed.
+
+        Returns:
+            dict: Deploy as returned by the Netlify API
+        """
+        output_dir_ = Path(output_dir_)
+        digests = self.file_digests(output_dir_)
+
+        response = self._session.post(
+            f"{self._api_url}/sites/{self._site}/deploys",
+            json={"files": digests},
+        )
+        if response.status_code >= 400:
+            raise DeployFailed(f"Creating deploy failed: {response.status_code}")
+        deploy = response.json()
+
+        # one file per required digest is enough, identical files are deduplicated
+        required = set(deploy.get("required", []))
+        uploads = dict()
+        for path, digest in digests.items():
+            if digest in required and digest not in uploads:
+                uploads[digest] = path
+        logging.info(
+            f"Deploying {len(digests)} Files, Uploading {len(uploads)} Changed Files"
+        )
+
+        with ThreadPoolExecutor(max_workers=CONFIGS["DEPLOY"]["WORKERS"]) as executor:
+            futures = [
+                executor.submit(self._upload, deploy["id"], output_dir_, path)
+                for path in uploads.values()
+            ]
+            for count, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                if progress_callback_:
+                    progress_callback_(int(100 * count / len(futures)))
+
+        logging.info(f"Deployed to Netlify: {deploy.get('deploy_ssl_url', '')}")
+        return deploy
+
+    def _upload(self, deploy_id_: str, output_dir_: Path, path_: str) -> None:
+        # the file is streamed, urllib3 rewinds it when an upload is retried
+        with open(output_dir_ / path_[1:], "rb") as f:
+            response = self._session.put(
+                f"{self._api_url}/deploys/{deploy_id_}/files{parse.quote(path_)}",
+                data=f,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+        if response.status_code >= 400:
+            raise DeployFailed(f"Uploading {path_} failed: {response.status_code}")
+
+
+DEPLOY_BACKENDS = {
+    HOST.NETLIFY: NetlifyDeploy,
+}
+
+
+def get_deploy_backend(host_: HOST) -> type:
+    """Deploy backend class of a host, None if the host can only be published
+    through git"""
+    return DEPLOY_BACKENDS.get(host_)
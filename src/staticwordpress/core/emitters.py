@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/emitters.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+import logging
+from pathlib import Path, PurePosixPath
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import HOST
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def is_dynamic(redirect_) -> bool:
+    """Dynamic redirects use splats or placeholders and are counted
+    separately from static redirects by most hosts."""
+    return "*" in redirect_.from_url or ":" in redirect_.from_url
+
+
+def _path_key(path_: str) -> str:
+    return path_.rstrip("*").rstrip("/") or "/"
+
+
+def merge_to_wildcards(redirects_: list, known_paths_: list = None) -> list:
+    """Replace groups of static redirects which move a whole folder
+    (/old/a -> /new/a, /old/b -> /new/b) by a single wildcard redirect
+    (/old/* -> /new/:splat). A folder is only merged if every known path in
+    it (redirect sources and known_paths_) moves to the same folder, the
+    wildcard takes the position of the last redirect it replaces. Without
+    known_paths_ the root folder is never merged, a /* wildcard would take
+    over every page of the website.
+
+    Args:
+        redirects_ (list): List of Redirect objects
+        known_paths_ (list, optional): Url paths which exist on the website,
+        e.g. pages and files of the export
+
+    Returns:
+        list: Redirects with folder moves replaced by wildcard redirects
+    """
+    children_count = dict()
+    known_keys = set(_path_key(path_) for path_ in known_paths_ or [])
+    known_keys.update(
+        _path_key(redirect_.from_url) for redirect_ in redirects_ if not redirect_.query
+    )
+    for key in known_keys:
+        for folder in [key, *map(str, PurePosixPath(key).parents)]:
+            children_count[folder] = children_count.get(folder, 0) + 1
+
+    groups = dict()
+    for redirect_ in redirects_:
+        if is_dynamic(redirect_) or redirect_.query:
+            continue
+
+        from_path = PurePosixPath(redirect_.from_url)
+        to_path = PurePosixPath(redirect_.to_url)
+        if from_path.name and from_path.name == to_path.name:
+            key = (str(from_path.parent), str(to_path.parent), redirect_.status)
+            groups.setdefault(key, []).append(redirect_)
+
+    merged = dict()
+    for (from_parent, to_parent, status), members in groups.items():
+        if from_parent == "/" and known_paths_ is None:
+            continue
+        member_keys = set(_path_key(redirect_.from_url) for redirect_ in members)
+        if len(member_keys) > 1 and children_count[from_parent] == len(member_keys):
+            wildcard = members[0].__class__(
+                from_=f"{from_parent.rstrip('/')}/*",
+                to_=f"{to_parent.rstrip('/')}/:splat",
+                query_=None,
+                status_=status,
+                force_=members[0].force,
+                source_=members[0].source,
+            )
+            for redirect_ in members:
+                merged[id(redirect_)] = None
+            merged[id(members[-1])] = wildcard
+
+    return [
+        merged.get(id(redirect_), redirect_)
+        for redirect_ in redirects_
+        if merged.get(id(redirect_), redirect_) is not None
+    ]
+
+
+class RedirectEmitter:
+    """Write redirects in the format understood by a host.
+
+    Sub classes implement `format` (and optionally `header`/`footer`) and
+    declare the rule count limits of the host. Lines are streamed into a
+    buffered file with a single `writelines` call per file.
+    """
+
+    max_static = None  # maximum number of static redirects per file
+    max_dynamic = None  # maximum number of dynamic (wildcard) redirects per file
+    max_per_file = None  # maximum number of redirects per file
+    multiple_files = False  # the host can include several redirect files
+    buffer_size = 1 << 16
+
+    def header(self) -> str:
+        return ""
+
+    def footer(self) -> str:
+        return ""
+
+    def accepts(self, redirect_) -> bool:
+        return True
+
+    def format(self, redirect_) -> str:
+        raise NotImplementedError
+
+    def fit(self, redirects_: list, known_paths_: list = None) -> list:
+        """Keep redirects within the rule count limits of the host. Folder moves
+        are merged into wildcard redirects first, remaining redirects are split
+        into several files which are each within the limits. Hosts which read
+        a single file get the first file only, the redirects which do not fit
+        are logged as errors.
+
+        Args:
+            redirects_ (list): List of Redirect objects
+            known_paths_ (list, optional): Url paths which exist on the website
+
+        Returns:
+            list: Redirects of every output file
+        """
+        accepted = []
+        for redirect_ in redirects_:
+            if self.accepts(redirect_):
+                accepted.append(redirect_)
+            else:
+                logging.warning(
+                    f"Redirect Not Supported by {self.__class__.__name__}, "
+                    f"Dropped: {redirect_.from_url} -> {redirect_.to_url}"
+                )
+        redirects_ = accepted
+
+        if not self._is_within_limits(redirects_):
+            redirects_ = merge_to_wildcards(redirects_, known_paths_)
+            logging.warning(
+                f"Redirects exceed limits of {self.__class__.__name__}, "
+                f"folder moves are merged into wildcard redirects"
+            )
+
+        chunks = [[]]
+        counts = {True: 0, False: 0}  # dynamic and static redirects of last chunk
+        limits = {True: self.max_dynamic, False: self.max_static}
+        for redirect_ in redirects_:
+            dynamic = is_dynamic(redirect_)
+            if any(
+                [
+                    limits[dynamic] is not None and counts[dynamic] >= limits[dynamic],
+                    self.max_per_file and len(chunks[-1]) >= self.max_per_file,
+                ]
+            ):
+                chunks.append([])
+                counts = {True: 0, False: 0}
+            chunks[-1].append(redirect_)
+            counts[dynamic] += 1
+
+        if len(chunks) > 1 and self.multiple_files:
+            logging.warning(
+                f"{len(redirects_) - len(chunks[0])} redirects exceed limits of "
+                f"{self.__class__.__name__} and are written to {len(chunks) - 1} "
+                f"additional files"
+            )
+        elif len(chunks) > 1:
+            skipped = [redirect_ for chunk in chunks[1:] for redirect_ in chunk]
+            logging.error(
+                f"{len(skipped)} redirects exceed limits of "
+                f"{self.__class__.__name__} and are not written:\n"
+                + "\n".join(
+                    f"{redirect_.from_url} -> {redirect_.to_url}"
+                    for redirect_ in skipped
+                )
+            )
+            chunks = chunks[:1]
+
+        return chunks
+
+    def save(
+        self, redirects_: list, output_file_: str, known_paths_: list = None
+    ) -> list:
+        """Write redirects into output_file_ (and numbered siblings if the
+        redirects are split over several files)
+
+        Args:
+            redirects_ (list): List of Redirect objects
+            output_file_ (str | Path): Path of the redirects file
+            known_paths_ (list, optional): Url paths which exist on the website
+
+        Returns:
+            list: Paths of all written files
+        """
+        output_file_ = Path(output_file_)
+
+        output_files = []
+        for index, chunk in enumerate(self.fit(redirects_, known_paths_)):
+            current_file = (
+                output_file_
+                if index == 0
+                else output_file_.with_name(
+                    f"{output_file_.stem}.{index}{output_file_.suffix}"
+                )
+            )
+            with open(
+                current_file,
+                "w",
+                encoding="utf-8",
+                buffering=self.buffer_size,
+            ) as f:
+                f.write(self.header())
+                f.writelines(self.format(redirect_) for redirect_ in chunk)
+                f.write(self.footer())
+            output_files.append(current_file)
+
+        return output_files
+
+    def _is_within_limits(self, redirects_: list) -> bool:
+        dynamic_count = sum(1 for redirect_ in redirects_ if is_dynamic(redirect_))
+        static_count = len(redirects_) - dynamic_count
+        return all(
+            [
+                self.max_static is None or static_count <= self.max_static,
+                self.max_dynamic is None or dynamic_count <= self.max_dynamic,
+                self.max_per_file is None or len(redirects_) <= self.max_per_file,
+            ]
+        )
+
+
+class NetlifyTomlEmitter(RedirectEmitter):
+    """[[redirects]] tables of netlify.toml"""
+
+    def format(self, redirect_) -> str:
+        return redirect_.as_toml()
+
+
+class NetlifyRedirectsEmitter(RedirectEmitter):
+    """Netlify _redirects file (also used by netlify dev on localhost)"""
+
+    def format(self, redirect_) -> str:
+        query = ""
+        if redirect_.query:
+            # netlify.toml query table {s = ":s"} becomes s=:s
+            parameters = [
+                [part.strip().strip('"') for part in item.split("=", 1)]
+                for item in redirect_.query.strip("{} ").split(",")
+                if "=" in item
+            ]
+            query = "  " + " ".join(f"{key}={value}" for key, value in parameters)
+        force = "!" if redirect_.force else ""
+        return f"{redirect_.from_url}{query}  {redirect_.to_url}  {redirect_.status}{force}\n"
+
+
+class CloudflareRedirectsEmitter(RedirectEmitter):
+    """Cloudflare Pages _redirects file. Cloudflare accepts 2000 static and
+    100 dynamic redirects and does not support query string matching."""
+
+    max_static = 2000
+    max_dynamic = 100
+
+    def accepts(self, redirect_) -> bool:
+        return not redirect_.query
+
+    def format(self, redirect_) -> str:
+        return f"{redirect_.from_url} {redirect_.to_url} {redirect_.status}\n"
+
+
+class NginxMapEmitter(RedirectEmitter):
+    """nginx map entries, to be included into a map block, e.g.
+    map $uri $redirect_uri { include redirects.map; }"""
+
+    max_per_file = 10000
+    multiple_files = True
+
+    def accepts(self, redirect_) -> bool:
+        return not redirect_.query
+
+    def format(self, redirect_) -> str:
+        if redirect_.is_wildcard:
+            return f"~^{redirect_.from_url[:-1]}(.*)$ {redirect_.to_url.replace(':splat', '$1')};\n"
+        return f"{redirect_.from_url} {redirect_.to_url};\n"
+
+
+class ApacheHtaccessEmitter(RedirectEmitter):
+    """Apache mod_alias RedirectMatch directives for .htaccess"""
+
+    def accepts(self, redirect_) -> bool:
+        return not redirect_.query
+
+    def format(self, redirect_) -> str:
+        if redirect_.is_wildcard:
+            return f"RedirectMatch {redirect_.status} ^{redirect_.from_url[:-1]}(.*)$ {redirect_.to_url.replace(':splat', '$1')}\n"
+        # Redirect matches by prefix, exact rules must not catch sub paths
+        from_url = re.escape(redirect_.from_url.rstrip("/"))
+        return f"RedirectMatch {redirect_.status} ^{from_url}/?$ {redirect_.to_url}\n"
+
+
+EMITTERS = {
+    HOST.NETLIFY: NetlifyTomlEmitter,
+    HOST.CLOUDFLARE: CloudflareRedirectsEmitter,
+    HOST.LOCALHOST: NetlifyRedirectsEmitter,
+    HOST.NGINX: NginxMapEmitter,
+    HOST.APACHE: ApacheHtaccessEmitter,
+}
+
+
+def register_emitter(host_: HOST, emitter_class_: type) -> None:
+    """Register (or replace) the redirect emitter used for a host"""
+    EMITTERS[host_] = emitter_class_
+
+
+def get_emitter(host_: HOST) -> RedirectEmitter:
+    return EMITTERS.get(host_, NetlifyRedirectsEmitter)()
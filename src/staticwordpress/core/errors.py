@@ -31,3 +31,15 @@ specific language governing rights and limitations under the License.
 
 class ResponseNotValid(Exception):
     pass
+
+
+class DownloadNotValid(Exception):
+    pass
+
+
+class LFSUploadFailed(Exception):
+    pass
+
+
+class DeployFailed(Exception):
+    pass
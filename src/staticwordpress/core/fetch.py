@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/fetch.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import asyncio
+import logging
+import threading
+from importlib.util import find_spec
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from requests.models import Response, PreparedRequest
+from requests.exceptions import RequestException
+from requests.structures import CaseInsensitiveDict
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS, FETCH
+from ..core.utils import get_session
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class FetchBackend:
+    """Performs the HTTP GET requests of a project.
+
+    Sub classes implement `get`, which must be thread safe and return a
+    `requests.models.Response` (redirects followed, history filled), so that
+    crawlers do not depend on the HTTP client in use.
+    """
+
+    def get(self, url_: str, headers_: dict = None) -> Response:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsBackend(FetchBackend):
+    """Blocking requests on the shared, pooled requests session"""
+
+    def __init__(self, max_retries_: int = None) -> None:
+        self._max_retries = (
+            CONFIGS["FETCH"]["RETRIES"] if max_retries_ is None else max_retries_
+        )
+
+    def get(self, url_: str, headers_: dict = None) -> Response:
+        return get_session(self._max_retries).get(url_, headers=headers_)
+
+
+class LimitedBackend(FetchBackend):
+    """Runs the requests of another backend with at most as many requests in
+    flight as slots_ allows, e.g. over all projects of a batch export. It is
+    equal to the wrapped backend, so both share cached responses."""
+
+    def __init__(self, backend_: FetchBackend, slots_: threading.Semaphore) -> None:
+        self._backend = backend_
+        self._slots = slots_
+
+    @property
+    def backend(self) -> FetchBackend:
+        return self._backend
+
+    def get(self, url_: str, headers_: dict = None) -> Response:
+        with self._slots:
+            return self._backend.get(url_, headers_=headers_)
+
+    def __eq__(self, other_) -> bool:
+        return self._backend == getattr(other_, "backend", other_)
+
+    def __hash__(self) -> int:
+        return hash(self._backend)
+
+
+class HttpxBackend(FetchBackend):
+    """Requests of all crawler threads are multiplexed by one asyncio event
+    loop (HTTP/2 if the h2 package is installed and the origin supports it),
+    so that raising the concurrency does not cost a socket and a blocked
+    thread per request. Requires the optional httpx package."""
+
+    def __init__(self) -> None:
+        import httpx
+
+        self._httpx = httpx
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="staticwordpress-fetch",
+            daemon=True,
+        )
+        self._thread.start()
+        self._client = self._run(self._create_client())
+
+    @property
+    def http2(self) -> bool:
+        return CONFIGS["FETCH"]["HTTP2"] and find_spec("h2") is not None
+
+    def get(self, url_: str, headers_: dict = None) -> Response:
+        return self._run(self._get(url_, headers_))
+
+    def close(self) -> None:
+        if self._loop.is_running():
+            self._run(self._client.aclose())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    async def _create_client(self):
+        return self._httpx.AsyncClient(
+            http2=self.http2,
+            follow_redirects=True,
+            timeout=CONFIGS["FETCH"]["TIMEOUT"],
+            limits=self._httpx.Limits(
+                max_connections=CONFIGS["FETCH"]["MAX_CONNECTIONS"],
+                max_keepalive_connections=CONFIGS["FETCH"]["MAX_KEEPALIVE"],
+            ),
+            transport=self._httpx.AsyncHTTPTransport(
+                http2=self.http2, retries=CONFIGS["FETCH"]["RETRIES"]
+            ),
+        )
+
+    async def _get(self, url_: str, headers_: dict = None) -> Response:
+        try:
+            response = await self._client.get(url_, headers=headers_)
+        except self._httpx.HTTPError as e:
+            # same exception type as RequestsBackend for callers
+            raise RequestException(str(e)) from e
+        return as_requests_response(response)
+
+    def _run(self, coroutine_):
+        return asyncio.run_coroutine_threadsafe(coroutine_, self._loop).result()
+
+
+def as_requests_response(response_) -> Response:
+    """Convert a (read) httpx response into a requests response
+
+    Args:
+        response_ (httpx.Response): Response with content already read
+
+    Returns:
+        Response: Equivalent requests response, including redirect history
+    """
+    request = PreparedRequest()
+    request.method = response_.request.method
+    request.url = str(response_.request.url)
+    request.headers = CaseInsensitiveDict(response_.request.headers)
+
+    response = Response()
+    response.status_code = response_.status_code
+    response.reason = response_.reason_phrase
+    response.url = str(response_.url)
+    response.headers = CaseInsensitiveDict(response_.headers)
+    response.encoding = response_.encoding
+    response.elapsed = response_.elapsed
+    response.request = request
+    # content is read, iter_content serves it from memory
+    response._content = response_.content
+    response._content_consumed = True
+    response.history = [as_requests_response(item) for item in response_.history]
+    return response
+
+
+FETCH_BACKENDS = {
+    FETCH.REQUESTS: RequestsBackend,
+    FETCH.HTTPX: HttpxBackend,
+}
+
+_FETCHERS = dict()
+_FETCHERS_LOCK = threading.Lock()
+
+
+def register_fetch_backend(fetch_: FETCH, backend_class_: type) -> None:
+    """Register (or replace) the fetch backend class used for fetch_"""
+    FETCH_BACKENDS[fetch_] = backend_class_
+
+
+def get_fetch_backend(fetch_: FETCH = FETCH.REQUESTS) -> FetchBackend:
+    """Shared fetch backend instance, projects selecting the same backend
+    share its connection pool. Falls back to requests if the backend's
+    dependencies are not installed.
+
+    Args:
+        fetch_ (FETCH, optional): Backend type. Defaults to FETCH.REQUESTS.
+
+    Returns:
+        FetchBackend: Backend instance
+    """
+    with _FETCHERS_LOCK:
+        if fetch_ not in _FETCHERS:
+            try:
+                _FETCHERS[fetch_] = FETCH_BACKENDS[fetch_]()
+            except ImportError as e:
+                logging.warning(
+                    f"Fetch backend {fetch_.value} is not available ({e}), using requests"
+                )
+                _FETCHERS[fetch_] = _FETCHERS.setdefault(
+                    FETCH.REQUESTS, FETCH_BACKENDS[FETCH.REQUESTS]()
+                )
+        return _FETCHERS[fetch_]
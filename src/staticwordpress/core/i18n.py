@@ -27,7 +27,7 @@ specific language governing rights and limitations under the License.
 # STANDARD LIBARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-import yaml
+import threading
 from pathlib import Path
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -35,6 +35,7 @@ from pathlib import Path
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from ..core.constants import LANGUAGES, CONFIGS
+from ..core.snapshot import load_snapshot
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -42,8 +43,14 @@ from ..core.constants import LANGUAGES, CONFIGS
 
 
 class _Translator(dict):
+    """Translations of GUI strings. translations.yaml (or its snapshot) is
+    only loaded on the first lookup, so that importing the package does not
+    pay for it."""
+
     def __init__(self) -> None:
         super().__init__()
+        self._is_loaded = False
+        self._lock = threading.Lock()
         self._lang = LANGUAGES[CONFIGS["LANGUAGE"]]
         self._path = Path(
             Path(__file__).resolve().parent,
@@ -54,11 +61,26 @@ class _Translator(dict):
 
     def __call__(self, index: str) -> str:
         assert len(index) > 0
+        if not self._is_loaded:
+            self.load()
         return self.get(index, {}).get(self._lang.value, index)
 
     def load(self) -> None:
+        with self._lock:
+            if self._is_loaded:
+                return
+            self.update(load_snapshot("translations", [self._path], self._read))
+            self._is_loaded = True
+
+    def _read(self) -> dict:
+        import yaml
+
         with open(self._path, "r", encoding="UTF-8") as f:
-            self.update(yaml.load(f.read(), Loader=yaml.CLoader))
+            return yaml.load(f.read(), Loader=yaml.CLoader)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._is_loaded
 
     @property
     def language(self) -> LANGUAGES:
@@ -70,4 +92,3 @@ class _Translator(dict):
 
 
 tr = _Translator()
-tr.load()
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/lfs.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+import json
+import hashlib
+import logging
+from pathlib import Path
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import requests
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
+from ..core.errors import LFSUploadFailed
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+LFS_MEDIA_TYPE = "application/vnd.git-lfs+json"
+LFS_ATTRIBUTES = "filter=lfs diff=lfs merge=lfs -text"
+
+
+def lfs_pointer(oid_: str, size_: int) -> bytes:
+    """Git LFS pointer file which is committed instead of the file content"""
+    return (
+        f"version https://git-lfs.github.com/spec/v1\n"
+        f"oid sha256:{oid_}\n"
+        f"size {size_}\n"
+    ).encode("utf-8")
+
+
+def lfs_extensions() -> set:
+    """Upper case file extensions of media outputs (images, pdfs and other
+    binaries) which can be offloaded to LFS"""
+    extensions = set(CONFIGS["GITHUB"]["LFS"]["EXTENSIONS"])
+    for url_type in CONFIGS["GITHUB"]["LFS"]["FORMATS"]:
+        extensions.update(CONFIGS["FORMATS"][url_type])
+    return extensions
+
+
+def lfs_attribute_path(path_: str) -> str:
+    """Escape a repository path for use as .gitattributes pattern"""
+    for special in "\\[]*?!#":
+        path_ = path_.replace(special, f"\\{special}")
+    return "/" + path_.replace(" ", "[[:space:]]")
+
+
+def lfs_attribute_pattern_path(pattern_: str) -> str:
+    """Repository path of a pattern written by lfs_attribute_path"""
+    path = pattern_[1:].replace("[[:space:]]", " ")
+    return re.sub(r"\\(.)", r"\1", path)
+
+
+class LFSObjects:
+    """Offload large media files of a repository to a Git LFS server.
+
+    Object ids (sha256) are cached by path, size and modification time in
+    .git/lfs-objects.json so unchanged media is not hashed again on every
+    commit.
+    """
+
+    def __init__(self, repo_dir_: str, git_dir_: str, threshold_: int) -> None:
+        self._repo_dir = Path(repo_dir_)
+        self._cache_path = Path(git_dir_) / "lfs-objects.json"
+        self._threshold = threshold_
+        self._extensions = lfs_extensions()
+        self._cache = dict()
+        if self._cache_path.exists():
+            with self._cache_path.open("r", encoding="utf-8") as f:
+                self._cache = json.load(f)
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    def select(self, paths_: list) -> dict:
+        """Pick media files at or above the size threshold.
+
+        Args:
+            paths_ (list): Paths relative to the repository
+
+        Returns:
+            dict: path -> (oid, size) of files to offload
+        """
+        selected = dict()
+        for path in paths_:
+            if path.rsplit(".", 1)[-1].upper() not in self._extensions:
+                continue
+
+            full_path = self._repo_dir / path
+            if not full_path.is_file():
+                continue
+
+            file_stat = full_path.stat()
+            if file_stat.st_size < self._threshold:
+                continue
+
+            cached = self._cache.get(path)
+            if cached and cached[:2] == [file_stat.st_size, file_stat.st_mtime_ns]:
+                oid = cached[2]
+            else:
+                oid = self._sha256_of_file(full_path)
+                self._cache[path] = [file_stat.st_size, file_stat.st_mtime_ns, oid]
+            selected[path] = (oid, file_stat.st_size)
+
+        return selected
+
+    def upload(self, lfs_url_: str, objects_: dict) -> int:
+        """Upload objects using the LFS batch API, objects already known to
+        the server are skipped.
+
+        Args:
+            lfs_url_ (str): LFS endpoint, e.g. https://github.com/user/repo.git/info/lfs
+            objects_ (dict): path -> (oid, size) as returned by select
+
+        Returns:
+            int: Number of uploaded objects
+        """
+        paths = {oid: path for path, (oid, _) in objects_.items()}
+        headers = {"Accept": LFS_MEDIA_TYPE, "Content-Type": LFS_MEDIA_TYPE}
+        session = requests.Session()
+        uploaded = 0
+
+        oids = sorted({(oid, size) for oid, size in objects_.values()})
+        batch_size = CONFIGS["GITHUB"]["LFS"]["BATCH_SIZE"]
+        for start in range(0, len(oids), batch_size):
+            response = session.post(
+                f"{lfs_url_.rstrip('/')}/objects/batch",
+                json={
+                    "operation": "upload",
+                    "transfers": ["basic"],
+                    "objects": [
+                        {"oid": oid, "size": size}
+                        for oid, size in oids[start : start + batch_size]
+                    ],
+                },
+                headers=headers,
+            )
+            if response.status_code >= 400:
+                raise LFSUploadFailed(
+                    f"LFS batch request failed: {response.status_code}"
+                )
+
+            for lfs_object in response.json().get("objects", []):
+                if "error" in lfs_object:
+                    raise LFSUploadFailed(
+                        f"LFS object {lfs_object['oid']}: {lfs_object['error']}"
+                    )
+
+                actions = lfs_object.get("actions", {})
+                if "upload" in actions:
+                    with open(self._repo_dir / paths[lfs_object["oid"]], "rb") as f:
+                        upload_response = session.put(
+                            actions["upload"]["href"],
+                            data=f,
+                            headers=actions["upload"].get("header", {}),
+                        )
+                    if upload_response.status_code >= 400:
+                        raise LFSUploadFailed(
+                            f"LFS upload of {paths[lfs_object['oid']]} failed: "
+                            f"{upload_response.status_code}"
+                        )
+                    uploaded += 1
+
+                if "verify" in actions:
+                    verify_response = session.post(
+                        actions["verify"]["href"],
+                        json={"oid": lfs_object["oid"], "size": lfs_object["size"]},
+                        headers={
+                            **headers,
+                            **actions["verify"].get("header", {}),
+                        },
+                    )
+                    if verify_response.status_code >= 400:
+                        raise LFSUploadFailed(
+                            f"LFS verification of {paths[lfs_object['oid']]} failed: "
+                            f"{verify_response.status_code}"
+                        )
+
+        logging.info(f"Uploaded {uploaded} of {len(oids)} Objects to LFS")
+        return uploaded
+
+    def update_attributes(self, paths_: list, changed_paths_: list = ()) -> bool:
+        """Rebuild the LFS entries of .gitattributes from the offloaded paths.
+        Entries of deleted files and of changed paths which are no longer
+        offloaded (shrunk below the threshold or committed as regular files)
+        are removed, other lines are kept as they are.
+
+        Args:
+            paths_ (list): Paths offloaded in this commit
+            changed_paths_ (list, optional): All staged paths of this commit. Defaults to ().
+
+        Returns:
+            bool: True if .gitattributes was changed
+        """
+        attributes_path = self._repo_dir / ".gitattributes"
+        lines = []
+        if attributes_path.exists():
+            lines = attributes_path.read_text(encoding="utf-8").splitlines()
+
+        suffix = f" {LFS_ATTRIBUTES}"
+        changed = {lfs_attribute_path(path) for path in changed_paths_}
+        changed.update(lfs_attribute_path(path) for path in paths_)
+        other_lines = []
+        patterns = set()
+        for line in lines:
+            if line.startswith("/") and line.endswith(suffix):
+                pattern = line[: -len(suffix)]
+                if (
+                    pattern not in changed
+                    and (self._repo_dir / lfs_attribute_pattern_path(pattern)).is_file()
+                ):
+                    patterns.add(pattern)
+            else:
+                other_lines.append(line)
+        patterns.update(lfs_attribute_path(path) for path in paths_)
+
+        new_lines = other_lines + [f"{pattern}{suffix}" for pattern in sorted(patterns)]
+        if new_lines == lines:
+            return False
+
+        if new_lines:
+            attributes_path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
+        else:
+            attributes_path.unlink()
+        return True
+
+    def save(self) -> None:
+        with self._cache_path.open("w", encoding="utf-8") as f:
+            json.dump(self._cache, f)
+
+    def _sha256_of_file(self, path_: Path) -> str:
+        sha256 = hashlib.sha256()
+        with open(path_, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
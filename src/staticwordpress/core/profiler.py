@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/profiler.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import io
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+from pathlib import Path
+from collections import defaultdict
+from contextlib import contextmanager
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+_ACTIVE_LOCK = threading.Lock()  # cProfile and tracemalloc are process wide
+
+
+class StageProfiler:
+    """Opt-in cProfile and tracemalloc profiling of workflow stages.
+
+    While output_path is set, every stage writes <stage>.prof (pstats, open
+    with snakeviz or `python -m pstats`), <stage>.memory.txt (top allocations
+    still held at the end of the stage) and updates summary.txt with one row
+    per stage. Calls of the same stage are accumulated. Only one stage is
+    profiled at a time, stages nested in (or running in parallel to) a
+    profiled stage are counted in the outer stage.
+
+    cProfile only sees the thread which enabled it, work a stage hands to
+    pool threads is profiled when it is submitted through `run`. Python 3.12
+    allows a single profiler per process, there worker threads only count in
+    the stage's time and memory.
+    """
+
+    def __init__(self, output_path_: Path = None) -> None:
+        self._output_path = output_path_
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._profiles = dict()
+            self._worker_stats = dict()
+            self._active = None
+            self._rows = defaultdict(
+                lambda: {"calls": 0, "seconds": 0.0, "peak": 0, "retained": 0}
+            )
+
+    @property
+    def output_path(self) -> Path:
+        return self._output_path
+
+    @output_path.setter
+    def output_path(self, output_path_: Path) -> None:
+        self._output_path = output_path_
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._output_path is not None
+
+    @property
+    def rows(self) -> dict:
+        with self._lock:
+            return {name: dict(row) for name, row in self._rows.items()}
+
+    @contextmanager
+    def stage(self, name_: str):
+        """Profile the enclosed block as stage name_ if profiling is enabled
+        and no other stage is being profiled."""
+        if not self.is_enabled or not _ACTIVE_LOCK.acquire(blocking=False):
+            yield
+            return
+
+        try:
+            profile = self._profiles.setdefault(name_, cProfile.Profile())
+            was_tracing = tracemalloc.is_tracing()
+            if was_tracing:
+                start_snapshot = tracemalloc.take_snapshot()
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+            elif CONFIGS["PROFILE"]["MEMORY"]:
+                tracemalloc.start()
+
+            start = time.perf_counter()
+            try:
+                profile.enable()
+            except ValueError as e:  # another profiler is active
+                logging.warning(f"Profiling {name_} Skipped: {e}")
+                profile = None
+
+            self._active = name_
+            try:
+                yield
+            finally:
+                self._active = None
+                if profile:
+                    profile.disable()
+                seconds = time.perf_counter() - start
+
+                snapshot, statistics, peak, retained = None, [], 0, 0
+                if tracemalloc.is_tracing():
+                    snapshot = tracemalloc.take_snapshot()
+                    peak = tracemalloc.get_traced_memory()[1]
+                    statistics = (
+                        snapshot.compare_to(start_snapshot, "lineno")
+                        if was_tracing
+                        else snapshot.statistics("lineno")
+                    )
+                    retained = sum(
+                        getattr(statistic, "size_diff", statistic.size)
+                        for statistic in statistics
+                    )
+                    if not was_tracing:
+                        tracemalloc.stop()
+
+                with self._lock:
+                    row = self._rows[name_]
+                    row["calls"] += 1
+                    row["seconds"] += seconds
+                    row["peak"] = max(row["peak"], peak)
+                    row["retained"] += retained
+
+                self.save_stage(name_, statistics)
+        finally:
+            _ACTIVE_LOCK.release()
+
+    def run(self, function_, *args, **kwargs):
+        """Run function_(*args, **kwargs) in a worker thread of the stage which
+        is being profiled, its calls are added to that stage's profile.
+
+        Returns:
+            object: Result of function_
+        """
+        name = self._active
+        profile = cProfile.Profile() if name else None
+        try:
+            if profile:
+                profile.enable()
+        except ValueError:  # python 3.12+, the stage's profiler is active
+            profile = None
+
+        try:
+            return function_(*args, **kwargs)
+        finally:
+            if profile:
+                profile.disable()
+                with self._lock:
+                    if name in self._worker_stats:
+                        self._worker_stats[name].add(profile)
+                    else:
+                        self._worker_stats[name] = pstats.Stats(
+                            profile, stream=io.StringIO()
+                        )
+
+    def stage_stats(self, name_: str) -> pstats.Stats:
+        """Profile of a stage including its worker threads, None if nothing
+        was profiled"""
+        stats = pstats.Stats(stream=io.StringIO())
+        profile = self._profiles.get(name_)
+        if profile and profile.getstats():
+            stats.add(profile)
+        with self._lock:
+            if name_ in self._worker_stats:
+                stats.add(self._worker_stats[name_])
+        return stats if stats.stats else None
+
+    def save_stage(self, name_: str, statistics_: list) -> None:
+        """Write profile and allocations of a stage and update summary.txt"""
+        output_path = Path(self._output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+        stats = self.stage_stats(name_)
+        if stats:
+            stats.dump_stats(str(output_path / f"{name_}.prof"))
+
+        if statistics_:
+            top = CONFIGS["PROFILE"]["TOP"]
+            (output_path / f"{name_}.memory.txt").write_text(
+                "\n".join(str(statistic) for statistic in statistics_[:top]) + "\n",
+                encoding="utf-8",
+            )
+
+        (output_path / "summary.txt").write_text(self.table(), encoding="utf-8")
+
+    def hotspot(self, name_: str) -> str:
+        """Function with the highest own time in a stage"""
+        stats = self.stage_stats(name_)
+        if not stats:
+            return ""
+        stats.sort_stats("tottime")
+        filename, line, function = stats.fcn_list[0]
+        return f"{Path(filename).name}:{line}({function})"
+
+    def table(self) -> str:
+        """Summary of all profiled stages as fixed width text table"""
+        header = ["stage", "calls", "seconds", "peak MB", "retained MB", "hotspot"]
+        lines = [header] + [
+            [
+                name,
+                str(row["calls"]),
+                f"{row['seconds']:.3f}",
+                f"{row['peak'] / 2**20:.1f}",
+                f"{row['retained'] / 2**20:.1f}",
+                self.hotspot(name),
+            ]
+            for name, row in sorted(
+                self.rows.items(), key=lambda item: -item[1]["seconds"]
+            )
+        ]
+        widths = [max(len(line[column]) for line in lines) for column in range(5)]
+        return (
+            "\n".join(
+                "  ".join(
+                    [line[column].ljust(widths[column]) for column in range(5)]
+                    + [line[5]]
+                ).rstrip()
+                for line in lines
+            )
+            + "\n"
+        )
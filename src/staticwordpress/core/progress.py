@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/progress.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import time
+import threading
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def format_duration(seconds_: float) -> str:
+    """Human readable duration, e.g. 1h 02m or 3m 20s"""
+    seconds_ = int(round(seconds_))
+    hours, rest = divmod(seconds_, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+
+class CrawlProgress:
+    """Progress of a crawl based on real counts.
+
+    The expected total is the larger of the number of urls listed in the
+    sitemaps and the number of urls discovered so far (completed urls plus
+    the frontier of queued urls). The ETA uses the measured throughput.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._start = None
+            self._expected = 0
+            self._completed = 0
+            self._frontier = 0
+            self._finished = False
+
+    def set_expected(self, expected_: int) -> None:
+        """Number of urls known in advance, e.g. listed in the sitemaps"""
+        with self._lock:
+            self._expected = expected_
+
+    def update(self, completed_: int, frontier_: int) -> None:
+        """Update counts after an url was processed
+
+        Args:
+            completed_ (int): Number of urls processed
+            frontier_ (int): Number of urls discovered and waiting to be processed
+        """
+        with self._lock:
+            if self._start is None:
+                self._start = time.monotonic()
+            self._completed = completed_
+            self._frontier = frontier_
+            self._finished = False
+
+    def finish(self) -> None:
+        with self._lock:
+            self._finished = True
+            self._frontier = 0
+
+    @property
+    def completed(self) -> int:
+        return self._completed
+
+    @property
+    def frontier(self) -> int:
+        return self._frontier
+
+    @property
+    def total(self) -> int:
+        return max(self._expected, self._completed + self._frontier, 1)
+
+    @property
+    def percent(self) -> int:
+        """Completed percentage, 100 only after the crawl finished"""
+        if self._finished:
+            return 100
+        return min(99, int(100 * self._completed / self.total))
+
+    @property
+    def rate(self) -> float:
+        """Processed urls per second"""
+        if self._start is None:
+            return 0.0
+        elapsed = time.monotonic() - self._start
+        return self._completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float:
+        """Estimated seconds until the crawl finishes, None if unknown"""
+        if self._finished:
+            return 0.0
+        if not self.rate:
+            return None
+        return (self.total - self._completed) / self.rate
+
+    @property
+    def message(self) -> str:
+        eta = self.eta
+        eta = f", ETA {format_duration(eta)}" if eta is not None else ""
+        return f"Crawling Pages {self._completed}/{self.total}{eta}"
+
+    def as_dict(self) -> dict:
+        return {
+            "completed": self._completed,
+            "frontier": self._frontier,
+            "total": self.total,
+            "percent": self.percent,
+            "rate": round(self.rate, 3),
+            "eta": round(self.eta, 1) if self.eta is not None else None,
+        }
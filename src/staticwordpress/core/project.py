@@ -30,7 +30,6 @@ specific language governing rights and limitations under the License.
 import re
 import json
 import base64
-import requests
 from copy import deepcopy
 from urllib import parse
 from pathlib import Path, PosixPath, WindowsPath
@@ -45,10 +44,12 @@ from ..core.constants import (
     HOST,
     SOURCE,
     USER_AGENT,
+    FETCH,
     CONFIGS,
     VERISON,
     LINK_REGEX,
 )
+from ..core.fetch import get_fetch_backend
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -70,6 +71,7 @@ class Project(dict):
         self["name"] = ""
         self["scheme"] = CONFIGS["DEFAULT_SCHEME"]
         self["user-agent"] = USER_AGENT.FIREFOX
+        self["fetch-backend"] = FETCH(CONFIGS["FETCH"]["BACKEND"])
         self["source"] = {
             "type": SOURCE.CRAWL,
             "url": "",
@@ -85,13 +87,20 @@ class Project(dict):
         }
 
         self["wordpress"] = {"user": "", "api-token": ""}
-        self["github"] = {"token": "", "repository": ""}
+        self["github"] = {"token": "", "repository": "", "lfs-threshold": 0}
+        self["deploy"] = {"token": "", "site": ""}
         self["redirects"] = REDIRECTS.NONE
         self["sitemap"] = "sitemap_index.xml"
         self["search"] = "search"
         self["404"] = "404-error"
         self["additional"] = []
         self["exclude"] = CONFIGS["EXCLUDE"]
+        self["scope"] = {
+            "include": CONFIGS["SCOPE"]["INCLUDE"],
+            "max-depth": CONFIGS["SCOPE"]["MAX_DEPTH"],
+            "max-section-pages": CONFIGS["SCOPE"]["MAX_SECTION_PAGES"],
+            "query": CONFIGS["SCOPE"]["QUERY"],
+        }
         self["delay"] = 0.1
 
     def check_path_type(func):
@@ -142,6 +151,9 @@ class Project(dict):
     def has_github(self) -> bool:
         return self["github"]["token"] != "" and self["github"]["repository"] != ""
 
+    def has_deploy(self) -> bool:
+        return self["deploy"]["token"] != "" and self["deploy"]["site"] != ""
+
     def has_wordpress(self) -> bool:
         return self["source"]["type"] == SOURCE.CRAWL or (
             self["wordpress"]["api-token"] != "" and self["wordpress"]["user"] != ""
@@ -160,9 +172,9 @@ class Project(dict):
         self["status"] = PROJECT.NEW
 
     def update_ss(self) -> None:
-        response = requests.get(
+        response = get_fetch_backend(self.fetch_backend).get(
             self.src_url + CONFIGS["SIMPLYSTATIC"]["API"],
-            headers={"Authorization": "Basic " + self.wp_auth_token},
+            headers_={"Authorization": "Basic " + self.wp_auth_token},
         )
 
         if response.status_code < 399:
@@ -197,10 +209,11 @@ class Project(dict):
                 if "version" not in data.keys():
                     return
                 for key in self.keys():
-                    self[key] = data[key]
+                    self[key] = data.get(key, self[key])
                 self["path"] = Path(data["path"])
                 self["source"]["type"] = SOURCE[data["source"]["type"]]
                 self["user-agent"] = USER_AGENT[data["user-agent"]]
+                self["fetch-backend"] = FETCH(self["fetch-backend"])
                 self["destination"]["host"] = HOST[data["destination"]["host"]]
                 self["destination"]["output"] = Path(data["destination"]["output"])
                 self["redirects"] = REDIRECTS(data["redirects"])
@@ -221,6 +234,7 @@ class Project(dict):
                 self_copy = deepcopy(self)
                 self_copy["path"] = str(self["path"])
                 self_copy["user-agent"] = self["user-agent"].value
+                self_copy["fetch-backend"] = self["fetch-backend"].value
                 self_copy["source"]["type"] = self["source"]["type"].value
                 self_copy["destination"]["host"] = self["destination"]["host"].value
                 self_copy["redirects"] = self["redirects"].value
@@ -271,6 +285,14 @@ class Project(dict):
     def user_agent(self, user_agent_: USER_AGENT) -> None:
         self["user-agent"] = user_agent_
 
+    @property
+    def fetch_backend(self) -> FETCH:
+        return self["fetch-backend"]
+
+    @fetch_backend.setter
+    def fetch_backend(self, fetch_backend_: FETCH) -> None:
+        self["fetch-backend"] = fetch_backend_
+
     @property
     def sitemap(self) -> str:
         return self["sitemap"]
@@ -415,6 +437,32 @@ class Project(dict):
     def gh_token(self, gh_token_: str) -> None:
         self["github"]["token"] = gh_token_
 
+    @property
+    def deploy_token(self) -> str:
+        return self["deploy"]["token"]
+
+    @deploy_token.setter
+    def deploy_token(self, deploy_token_: str) -> None:
+        self["deploy"]["token"] = deploy_token_
+
+    @property
+    def deploy_site(self) -> str:
+        return self["deploy"]["site"]
+
+    @deploy_site.setter
+    def deploy_site(self, deploy_site_: str) -> None:
+        self["deploy"]["site"] = deploy_site_
+
+    @property
+    def gh_lfs_threshold(self) -> int:
+        """Media files of at least this size (bytes) are published through
+        Git LFS, 0 disables LFS"""
+        return self["github"].get("lfs-threshold", 0)
+
+    @gh_lfs_threshold.setter
+    def gh_lfs_threshold(self, gh_lfs_threshold_: int) -> None:
+        self["github"]["lfs-threshold"] = gh_lfs_threshold_
+
     @property
     def additional(self) -> list:
         return self["additional"]
@@ -431,6 +479,15 @@ class Project(dict):
     def exclude(self, exclude_: list) -> None:
         self["exclude"] = [url for url in exclude_ if url]
 
+    @property
+    def scope(self) -> dict:
+        return self["scope"]
+
+    @scope.setter
+    def scope(self, scope_: dict) -> None:
+        self["scope"] = {**self["scope"], **scope_}
+        self["scope"]["include"] = [url for url in self["scope"]["include"] if url]
+
     @property
     def redirects(self) -> REDIRECTS:
         return self["redirects"]
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/ratecontrol.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import time
+import logging
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
+from ..core.stats import percentile
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def parse_retry_after(value_: str) -> float:
+    """Seconds to wait from a Retry-After header (seconds or HTTP date),
+    capped at RATE_CONTROL.MAX_WAIT. 0.0 if missing or invalid."""
+    if not value_:
+        return 0.0
+    try:
+        seconds = float(value_)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value_).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    return max(0.0, min(seconds, CONFIGS["RATE_CONTROL"]["MAX_WAIT"]))
+
+
+class RateController:
+    """AIMD (additive increase, multiplicative decrease) concurrency limit
+    for one origin.
+
+    The limit grows by one request per round of successful responses while
+    the p95 latency of the last RATE_CONTROL.WINDOW responses stays below
+    RATE_CONTROL.LATENCY_FACTOR times the baseline (lowest p50 seen). It is
+    multiplied by RATE_CONTROL.DECREASE on throttling (429, 503), errors or
+    rising latency, at most once per round. Request starts are spaced by the
+    delay of the caller and Retry-After pauses all requests to the origin.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._limit = float(CONFIGS["RATE_CONTROL"]["MIN_CONCURRENCY"])
+        self._in_flight = 0
+        self._next_request = 0.0
+        self._pause_until = 0.0
+        self._latencies = deque(maxlen=CONFIGS["RATE_CONTROL"]["WINDOW"])
+        self._baseline = None
+        self._cooldown = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def baseline(self) -> float:
+        return self._baseline
+
+    def acquire(self, delay_: float = 0.0) -> None:
+        """Block until a request to the origin may start
+
+        Args:
+            delay_ (float, optional): Minimum time between two request starts.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if now < self._pause_until:
+                    self._condition.wait(self._pause_until - now)
+                elif self._in_flight >= self.limit:
+                    self._condition.wait()
+                else:
+                    break
+            self._in_flight += 1
+            request_time = max(now, self._next_request)
+            self._next_request = request_time + delay_
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    def release(
+        self, status_code_: int, seconds_: float, retry_after_: str = None
+    ) -> None:
+        """Report the response of an acquired request and adapt the limit
+
+        Args:
+            status_code_ (int): HTTP status code (9999 for connection errors)
+            seconds_ (float): Response time, None if the response did not come
+            from the origin (cached or shared), which only frees the slot.
+            retry_after_ (str, optional): Retry-After header of the response.
+        """
+        settings = CONFIGS["RATE_CONTROL"]
+        with self._condition:
+            self._in_flight -= 1
+            if seconds_ is None:
+                self._condition.notify_all()
+                return
+
+            self._cooldown = max(0, self._cooldown - 1)
+            if status_code_ in settings["THROTTLE_STATUS"]:
+                wait = parse_retry_after(retry_after_)
+                if wait:
+                    self._pause_until = max(self._pause_until, time.monotonic() + wait)
+                self._decrease(f"{status_code_} response, pausing {wait:.1f}s")
+            elif status_code_ >= 500:
+                self._decrease(f"{status_code_} response")
+            else:
+                self._latencies.append(seconds_)
+                if len(self._latencies) == self._latencies.maxlen:
+                    samples = sorted(self._latencies)
+                    p50 = percentile(samples, 50)
+                    self._baseline = min(self._baseline or p50, p50)
+                    if (
+                        percentile(samples, 95)
+                        > settings["LATENCY_FACTOR"] * self._baseline
+                    ):
+                        self._decrease("rising latency")
+                if self._cooldown == 0 and self._limit < settings["MAX_CONCURRENCY"]:
+                    self._limit = min(
+                        settings["MAX_CONCURRENCY"], self._limit + 1 / self._limit
+                    )
+
+            self._condition.notify_all()
+
+    def _decrease(self, reason_: str) -> None:
+        if self._cooldown:
+            return
+        self._limit = max(
+            CONFIGS["RATE_CONTROL"]["MIN_CONCURRENCY"],
+            self._limit * CONFIGS["RATE_CONTROL"]["DECREASE"],
+        )
+        self._latencies.clear()
+        self._cooldown = max(self.limit, self._in_flight + 1)  # one round
+        logging.info(f"Concurrency reduced to {self.limit} ({reason_})")
+
+
+_CONTROLLERS = dict()
+_CONTROLLERS_LOCK = threading.Lock()
+
+
+def get_rate_controller(netloc_: str) -> RateController:
+    """Rate controller of an origin (host and port), shared by all workflows
+    running in this process."""
+    with _CONTROLLERS_LOCK:
+        if netloc_ not in _CONTROLLERS:
+            _CONTROLLERS[netloc_] = RateController()
+        return _CONTROLLERS[netloc_]
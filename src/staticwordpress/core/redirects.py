@@ -28,7 +28,6 @@ specific language governing rights and limitations under the License.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 import json
-import requests
 import hashlib
 import logging
 
@@ -37,6 +36,8 @@ import logging
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from ..core.constants import HOST, REDIRECTS
+from ..core.emitters import get_emitter
+from ..core.fetch import get_fetch_backend
 from ..core.errors import ResponseNotValid
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -66,6 +67,38 @@ class Redirect:
     def hash(self):
         return self._hash
 
+    @property
+    def from_url(self) -> str:
+        return self._from
+
+    @property
+    def to_url(self) -> str:
+        return self._to
+
+    @to_url.setter
+    def to_url(self, to_: str) -> None:
+        self._to = to_
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    @property
+    def status(self) -> int:
+        return self._status
+
+    @property
+    def force(self) -> bool:
+        return self._force
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+    @property
+    def is_wildcard(self) -> bool:
+        return self._from.endswith("*")
+
     def as_json(self) -> dict:
         return {"from": self._from, "to": self._to, "status": self._status}
 
@@ -81,9 +114,77 @@ class Redirect:
             return f'[[redirects]]\nfrom = "{self._from}"\nto = "{self._to}"\nstatus = {self._status}\nforce = {str(self._force).lower()}\n\n'
 
 
+def _path_key(path_: str) -> str:
+    """Normalise redirect path for comparisons ('/abc/' and '/abc' are same)"""
+    return path_.rstrip("/") if len(path_) > 1 else path_
+
+
+class RedirectIndex:
+    """Lookup structure for redirect sources: exact paths are kept in a hash
+    map and wildcard prefixes (/old/*) in a character trie, so a lookup costs
+    one dict access plus one walk along the path."""
+
+    _TERMINAL = ""
+
+    def __init__(self) -> None:
+        self._exact = dict()
+        self._trie = dict()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, redirect_: Redirect) -> None:
+        # redirects with query parameters only match requests with parameters
+        if redirect_.query:
+            return
+
+        self._count += 1
+        if redirect_.is_wildcard:
+            node = self._trie
+            for char in redirect_.from_url[:-1]:
+                node = node.setdefault(char, dict())
+            node.setdefault(self._TERMINAL, (self._count, redirect_))
+        else:
+            self._exact.setdefault(_path_key(redirect_.from_url), redirect_)
+
+    def match(self, path_: str) -> Redirect:
+        """Find the redirect for path_
+
+        Args:
+            path_ (str): Url path e.g. /old-page/
+
+        Returns:
+            Redirect: Exact redirect, else first added matching wildcard redirect or None
+        """
+        exact = self._exact.get(_path_key(path_))
+        if exact:
+            return exact
+
+        return self.match_wildcard(path_)
+
+    def match_wildcard(self, path_: str) -> Redirect:
+        """First added wildcard redirect which matches path_ or None, found in
+        a single walk along path_"""
+        matches = []
+        node = self._trie
+        for char in path_:
+            if self._TERMINAL in node:
+                matches.append(node[self._TERMINAL])
+            node = node.get(char)
+            if node is None:
+                break
+        else:
+            if self._TERMINAL in node:
+                matches.append(node[self._TERMINAL])
+
+        return min(matches, key=lambda match: match[0])[1] if matches else None
+
+
 class Redirects:
     def __init__(self) -> None:
         self._items = dict()
+        self._index = RedirectIndex()
 
     @property
     def items(self) -> dict():
@@ -92,31 +193,112 @@ class Redirects:
     def add_redirect(self, redirect_: Redirect) -> None:
         if redirect_.hash not in self._items:
             self._items[redirect_.hash] = redirect_
+            self._index.add(redirect_)
+
+    def match(self, path_: str) -> Redirect:
+        """Redirect which applies to path_ or None"""
+        return self._index.match(path_)
+
+    def consolidate(self) -> list:
+        """Collapse redirect chains (A -> B -> C) into single hops, remove
+        redirect loops and drop exact rules already covered by a wildcard rule.
+        Every redirect is visited once, so the pass is linear in the number of
+        redirects.
+
+        Returns:
+            list: Redirect loops found, each loop as a list of paths.
+        """
+        graph = {
+            _path_key(redirect_.from_url): redirect_
+            for redirect_ in self._items.values()
+            if not redirect_.is_wildcard and not redirect_.query
+        }
 
-    def consolidate(self) -> None:
-        pass
+        # resolve final destination of every exact redirect; None marks a loop
+        # self redirects (/a -> /a/) only normalise the path and end a chain
+        resolved = {
+            key: redirect_.to_url
+            for key, redirect_ in graph.items()
+            if _path_key(redirect_.to_url) == key
+        }
+        loops = []
+        for start in graph:
+            chain = []
+            on_chain = dict()
+            node = start
+            while node in graph and node not in resolved and node not in on_chain:
+                on_chain[node] = len(chain)
+                chain.append(node)
+                node = _path_key(graph[node].to_url)
+
+            if node in on_chain:
+                loops.append([graph[key].from_url for key in chain[on_chain[node] :]])
+                final = None
+            elif node in resolved:
+                final = resolved[node]
+            else:
+                final = graph[chain[-1]].to_url if chain else None
+
+            for key in chain:
+                resolved[key] = final
+
+        for loop in loops:
+            logging.warning(f"Redirect Loop Removed: {' -> '.join(loop)}")
+
+        consolidated_items = dict()
+        for hash_, redirect_ in self._items.items():
+            key = _path_key(redirect_.from_url)
+            if key in graph:
+                final = resolved[key]
+                if final is None or _path_key(final) == key:
+                    continue
+
+                redirect_.to_url = final
+                covering = self._index.match_wildcard(redirect_.from_url)
+                if covering and covering.status == redirect_.status:
+                    splat = redirect_.from_url[len(covering.from_url) - 1 :]
+                    if covering.to_url.replace(":splat", splat) == final:
+                        continue
+
+            consolidated_items[hash_] = redirect_
+
+        removed = len(self._items) - len(consolidated_items)
+        if removed:
+            logging.info(f"Consolidated Redirects: {removed} redirects removed")
+        self._items = consolidated_items
+        self._index = RedirectIndex()
+        for redirect_ in self._items.values():
+            self._index.add(redirect_)
+
+        return loops
 
     def add_redirects(self, redirects_list_: list) -> None:
         for redirect_ in redirects_list_:
             self.add_redirect(redirect_)
 
-    def save(self, output_file_, host_: HOST) -> None:
-        with open(
-            output_file_,
-            "w",
-            encoding="utf-8",
-        ) as f:
-            for _, redirect in self._items.items():
-                if host_ == HOST.NETLIFY:
-                    f.write(redirect.as_toml())
-                else:
-                    f.write(redirect.as_line(True))
-
-    def get_from_plugin(self, redirects_api_path_: str, wp_auth_token_: str) -> None:
+    def save(self, output_file_, host_: HOST, known_paths_: list = None) -> list:
+        """Write redirects with the emitter registered for host_
+
+        Args:
+            output_file_ (str | Path): Path of the redirects file
+            host_ (HOST): Hosting which serves the redirects
+            known_paths_ (list, optional): Url paths which exist on the website,
+            folders with these paths are not replaced by wildcard redirects
+
+        Returns:
+            list: Paths of all written files
+        """
+        return get_emitter(host_).save(
+            list(self._items.values()), output_file_, known_paths_
+        )
+
+    def get_from_plugin(
+        self, redirects_api_path_: str, wp_auth_token_: str, backend_=None
+    ) -> None:
         try:
-            wp_api_response = requests.get(
+            wp_api_response = (backend_ or get_fetch_backend()).get(
                 redirects_api_path_,
-                headers={"Authorization": "Basic " + wp_auth_token_},
+                headers_={"Authorization": "Basic " + wp_auth_token_},
             )
 
             if wp_api_response.status_code >= 400:
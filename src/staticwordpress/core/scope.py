@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/scope.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+import fnmatch
+import threading
+from urllib import parse
+from collections import Counter
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# urls with a query string are crawled without it (IGNORE) or not at all (SKIP)
+QUERY_POLICIES = ["IGNORE", "SKIP"]
+
+# folders and html files are pages, only exclude patterns apply to other urls
+PAGE_PATTERN = re.compile(r"[^?]*/(?:[^/.?]*|[^/?]*\.html?)(?:\?.*)?\Z", re.I | re.S)
+
+
+def compile_pattern(pattern_: str) -> str:
+    """Regex which matches a url path (and query) from its start.
+
+    Patterns are prefixed with their type: "re:" (regex, searched anywhere),
+    "glob:" (shell pattern of the whole path, * also matches /) and "prefix:".
+    Patterns without prefix match as substring, like the exclude lists did.
+
+    Args:
+        pattern_ (str): Scope pattern, e.g. "glob:/tag/*" or "feed"
+
+    Returns:
+        str: Regex source
+    """
+    if pattern_.startswith("re:"):
+        return f".*?(?:{pattern_[3:]})"
+    if pattern_.startswith("glob:"):
+        return fnmatch.translate(pattern_[5:])
+    if pattern_.startswith("prefix:"):
+        return re.escape(pattern_[7:])
+    return f".*?{re.escape(pattern_)}"
+
+
+def compile_scope(
+    include_: list = None,
+    exclude_: list = None,
+    max_depth_: int = 0,
+    query_: str = "IGNORE",
+) -> re.Pattern:
+    """Compile scope rules into a single regex of zero width lookaheads,
+    which is matched once against the path (and query) of a url.
+
+    Args:
+        include_ (list, optional): Patterns of urls to crawl, all if empty.
+        exclude_ (list, optional): Patterns of urls not to crawl.
+        max_depth_ (int, optional): Maximum number of path segments, 0 for no limit.
+        query_ (str, optional): Query string policy. Defaults to "IGNORE".
+
+    Returns:
+        re.Pattern: Matches urls which are in scope
+    """
+    if query_ not in QUERY_POLICIES:
+        raise ValueError(f"Unknown query policy {query_}, use one of {QUERY_POLICIES}")
+
+    rules = []
+    if query_ == "SKIP":
+        rules.append(r"(?![^?]*\?)")
+    if max_depth_:
+        # index.html files are at the depth of their folder
+        rules.append(
+            f"(?!(?:/[^/?]+){{{max_depth_}}}/(?!index\\.html?(?:\\?|\\Z))[^/?]+)"
+        )
+    if exclude_:
+        rules.append(f"(?!{'|'.join(compile_pattern(item) for item in exclude_)})")
+    if include_:
+        rules.append(f"(?={'|'.join(compile_pattern(item) for item in include_)})")
+    return re.compile("".join(rules), re.DOTALL)
+
+
+def path_with_query(url_: str) -> str:
+    url = parse.urlsplit(url_)
+    path = url.path or "/"
+    return f"{path}?{url.query}" if url.query else path
+
+
+class Scope:
+    """Decide which discovered urls are crawled. Exclude patterns apply to all
+    urls. Include patterns, depth and query rules and the number of pages per
+    section (first path segment, e.g. /tag/) only apply to pages, assets of
+    pages in scope are always crawled."""
+
+    def __init__(
+        self,
+        include_: list = None,
+        exclude_: list = None,
+        max_depth_: int = 0,
+        max_section_pages_: int = 0,
+        query_: str = "IGNORE",
+    ) -> None:
+        include_ = [item for item in include_ or [] if item]
+        exclude_ = [item for item in exclude_ or [] if item]
+        self._pattern = compile_scope(exclude_=exclude_)
+        self._page_pattern = compile_scope(include_, [], max_depth_, query_)
+        self._max_section_pages = max_section_pages_
+        self._sections = Counter()
+        self._rejected_count = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configs(cls, exclude_: list = None, scope_: dict = None) -> "Scope":
+        """Scope of a project, missing settings are taken from CONFIGS["SCOPE"]
+
+        Args:
+            exclude_ (list, optional): Exclude patterns of the project
+            scope_ (dict, optional): Scope settings of the project
+        """
+        scope_ = scope_ or {}
+        return cls(
+            include_=scope_.get("include", CONFIGS["SCOPE"]["INCLUDE"]),
+            exclude_=exclude_,
+            max_depth_=scope_.get("max-depth", CONFIGS["SCOPE"]["MAX_DEPTH"]),
+            max_section_pages_=scope_.get(
+                "max-section-pages", CONFIGS["SCOPE"]["MAX_SECTION_PAGES"]
+            ),
+            query_=scope_.get("query", CONFIGS["SCOPE"]["QUERY"]),
+        )
+
+    @property
+    def sections(self) -> dict:
+        return dict(self._sections)
+
+    @property
+    def rejected_count(self) -> int:
+        return self._rejected_count
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sections.clear()
+            self._rejected_count = 0
+
+    def matches(self, url_: str) -> bool:
+        """True if url_ (absolute url or path) is in scope, without counting
+        it for its section"""
+        return self._matches(path_with_query(url_)) is not None
+
+    def admit(self, url_: str) -> bool:
+        """Check url_ against all rules and count pages for their section if
+        they are in scope. Every url should only be admitted once.
+
+        Args:
+            url_ (str): Absolute url or path
+
+        Returns:
+            bool: url_ is in scope and should be crawled
+        """
+        path = path_with_query(url_)
+        is_page = self._matches(path)
+        with self._lock:
+            if is_page and self._max_section_pages:
+                section = path.split("/")[1] if path.count("/") > 1 else ""
+                if self._sections[section] >= self._max_section_pages:
+                    is_page = None
+                else:
+                    self._sections[section] += 1
+            if is_page is None:
+                self._rejected_count += 1
+        return is_page is not None
+
+    def _matches(self, path_: str):
+        """None if path_ is out of scope, else whether path_ is a page"""
+        if self._pattern.match(path_) is None:
+            return None
+        if PAGE_PATTERN.match(path_) is None:
+            return False
+        return True if self._page_pattern.match(path_) else None
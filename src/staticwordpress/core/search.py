@@ -30,13 +30,14 @@ specific language governing rights and limitations under the License.
 import shutil
 import json
 from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # 3rd PARTY LIBRARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from bs4 import BeautifulSoup
-from bs4.formatter import HTMLFormatter
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
@@ -88,7 +89,7 @@ class Search:
     def dst_url(self) -> str:
         return self._dst_url
 
-    def update(self, soup_: BeautifulSoup, output_path_: str) -> None:
+    def update(self, soup_: "BeautifulSoup", output_path_: str) -> None:
         """Update search page by adding new tags
 
         Args:
@@ -112,13 +113,15 @@ class Search:
         for script in lunr_script_tag:
             soup_.find("head").append(str(script))
 
+        from bs4.formatter import HTMLFormatter
+
         # TODO: In future add support for minification check
         content = soup_.prettify(formatter=HTMLFormatter(string_formatter))
 
         with open(output_path_, "w", encoding="utf-8") as f:
             f.write(content)
 
-    def add(self, soup_: BeautifulSoup, url_path_: str) -> None:
+    def add(self, soup_: "BeautifulSoup", url_path_: str) -> None:
         """Add new (as soup) page to search indexs
 
         Args:
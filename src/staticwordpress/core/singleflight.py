@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/singleflight.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import threading
+from concurrent.futures import Future
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key: the first caller runs the
+    function, callers arriving while it is in flight wait for and share its
+    result (or exception) instead of running the function again."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = dict()
+        self._shared_count = 0
+        self._local = threading.local()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    @property
+    def shared_count(self) -> int:
+        """Number of calls which were served by another caller's result"""
+        return self._shared_count
+
+    @property
+    def was_shared(self) -> bool:
+        """Whether the last call of the current thread was served by another
+        caller's result"""
+        return getattr(self._local, "shared", False)
+
+    def do(self, key_, function_, *args, **kwargs):
+        """Run function_(*args, **kwargs) unless a call with key_ is already
+        in flight, in which case wait for its result
+
+        Args:
+            key_ (hashable): Identity of the call, e.g. a normalized url
+            function_ (callable): Function to run
+
+        Returns:
+            object: Result of function_
+        """
+        with self._lock:
+            future = self._calls.get(key_)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key_] = future
+            else:
+                self._shared_count += 1
+        self._local.shared = not is_leader
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = function_(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key_]
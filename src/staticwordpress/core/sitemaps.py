@@ -30,12 +30,6 @@ specific language governing rights and limitations under the License.
 
 from urllib import parse
 
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-# 3rd PARTY LIBRARY IMPORTS
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-
-from bs4 import BeautifulSoup
-
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -48,32 +42,35 @@ from ..core.utils import get_clean_url, get_remote_content, is_url_valid
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 
-def find_sitemap_location(home_url_: str) -> str:
+def find_sitemap_location(home_url_: str, backend_=None) -> str:
     """Finding Sitemap Location Using Home Url
 
     Args:
         home_url (str): Source URL of the Website
+        backend_ (FetchBackend, optional): Fetch backend of the project. Defaults to None.
 
     Returns:
         str: Location of Sitemap
     """
+    from bs4 import BeautifulSoup
+
     if is_url_valid(home_url_):
         for sitemap_path in CONFIGS["SITEMAP"]["SEARCH_PATHS"]:
             sitemap_url = get_clean_url(home_url_, sitemap_path)
-            response = get_remote_content(sitemap_url)
+            response = get_remote_content(sitemap_url, backend_=backend_)
             if response.status_code < 400:
                 return parse.urlparse(response.url).path
 
         # robots.txt
         robots_txt = get_clean_url(home_url_, "robots.txt")
-        response = get_remote_content(robots_txt)
+        response = get_remote_content(robots_txt, backend_=backend_)
         if response:
             for item in response.text.split("\n"):
                 if item.startswith("Sitemap:"):
                     return item.split("Sitemap:")[-1].strip()
 
         # check home page for link rel=sitemap
-        response = get_remote_content(home_url_)
+        response = get_remote_content(home_url_, backend_=backend_)
         if response:
             soup = BeautifulSoup(response.text, features="xml")
             for link in soup.find_all("link"):
@@ -83,17 +80,20 @@ def find_sitemap_location(home_url_: str) -> str:
     return ""
 
 
-def extract_sitemap_paths(sitemap_url_: str) -> list:
+def extract_sitemap_paths(sitemap_url_: str, backend_=None) -> list:
     """Extract Sub-Sitemap from Index Sitemap
 
     Args:
         sitemap_url (str): Index Sitemap Url
+        backend_ (FetchBackend, optional): Fetch backend of the project. Defaults to None.
 
     Returns:
         list: List of Sub-Sitemaps
     """
+    from bs4 import BeautifulSoup
+
     sitemap_paths = []
-    response = get_remote_content(sitemap_url_)
+    response = get_remote_content(sitemap_url_, backend_=backend_)
     for item in response.text.split("\n"):
         if ".xsl" in item:
             st = item.find("//")
@@ -107,3 +107,26 @@ def extract_sitemap_paths(sitemap_url_: str) -> list:
         ]
 
     return sitemap_paths
+
+
+def count_sitemap_urls(sitemap_paths_: list, backend_=None) -> int:
+    """Count urls listed in sitemaps
+
+    Args:
+        sitemap_paths_ (list): List of Sub-Sitemaps
+        backend_ (FetchBackend, optional): Fetch backend of the project. Defaults to None.
+
+    Returns:
+        int: Number of urls in all sitemaps
+    """
+    from bs4 import BeautifulSoup
+
+    urls_count = 0
+    for sitemap_path in sitemap_paths_:
+        if sitemap_path.endswith(".xml"):
+            response = get_remote_content(sitemap_path, backend_=backend_)
+            if response.status_code < 400:
+                soup = BeautifulSoup(response.text, features="xml")
+                urls_count += len(soup.find_all("url"))
+
+    return urls_count
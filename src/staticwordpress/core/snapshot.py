@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/snapshot.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import re
+import pickle
+import fnmatch
+import hashlib
+import logging
+from pathlib import Path
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# bump whenever the layout of a snapshot (or of compile_configs) changes
+SNAPSHOT_VERSION = 2
+SNAPSHOT_PROTOCOL = 4
+
+SNAPSHOT_FOLDER = Path(
+    os.environ.get("STATICWORDPRESS_CACHE")
+    or os.environ.get("XDG_CACHE_HOME")
+    or os.environ.get("LOCALAPPDATA")
+    or Path.home() / ".cache",
+    "staticwordpress",
+)
+
+
+def snapshot_key(sources_: list) -> tuple:
+    """Identify the state of the source files by their path, modification
+    time and size"""
+    key = [SNAPSHOT_VERSION]
+    for source in sources_:
+        stat_result = Path(source).stat()
+        key.append((str(source), stat_result.st_mtime_ns, stat_result.st_size))
+    return tuple(key)
+
+
+def snapshot_path(name_: str, sources_: list, folder_: Path = None) -> Path:
+    """Location of the snapshot, every installation (set of source paths)
+    gets its own file"""
+    digest = hashlib.sha1(
+        "|".join(str(Path(source).resolve()) for source in sources_).encode("utf-8")
+    ).hexdigest()[:12]
+    return Path(folder_ or SNAPSHOT_FOLDER) / f"{name_}-{digest}.pickle"
+
+
+def load_snapshot(name_: str, sources_: list, build_, folder_: Path = None):
+    """Return the data compiled from sources_ by build_, cached as pickle
+    snapshot which is rebuilt whenever one of the sources changes
+
+    Args:
+        name_ (str): Name of the snapshot
+        sources_ (list): Paths of the files the data is compiled from
+        build_ (callable): Parse the sources, called without arguments
+        folder_ (Path, optional): Snapshot folder. Defaults to SNAPSHOT_FOLDER.
+
+    Returns:
+        object: Data returned by build_
+    """
+    key = snapshot_key(sources_)
+    path = snapshot_path(name_, sources_, folder_)
+
+    try:
+        with path.open("rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.debug(f"Snapshot {path} is not readable: {e}")
+
+    data = build_()
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump((key, data), f, protocol=SNAPSHOT_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.debug(f"Snapshot {path} is not writable: {e}")
+
+    return data
+
+
+def compile_configs(configs_: dict) -> dict:
+    """Lookup tables derived from the configs, which would otherwise be
+    rebuilt for every crawled url
+
+    Args:
+        configs_ (dict): Parsed config.json
+
+    Returns:
+        dict: EXTENSIONS (upper case file extension -> URL name), EXCLUDE
+        (matcher of excluded url paths), CLEAN_CHARS (matcher of characters
+        removed from urls, None if there are none), HEADERS and
+        DOWNLOAD_HEADERS (request headers per user agent), DROP_PARAMS
+        (matcher of query parameters dropped from canonical urls)
+    """
+    extensions = dict()
+    for url_type, formats in configs_["FORMATS"].items():
+        for file_ext in formats:
+            if file_ext:
+                extensions[file_ext] = url_type
+
+    # (?!) never matches, an empty exclude list must not exclude everything
+    exclude = re.compile(
+        "|".join(re.escape(item) for item in configs_["EXCLUDE"])
+        if configs_["EXCLUDE"]
+        else "(?!)"
+    )
+
+    clean_chars = (
+        re.compile("|".join(re.escape(char) for char in configs_["CLEAN"]["CHARS"]))
+        if configs_["CLEAN"]["CHARS"]
+        else None
+    )
+
+    headers = {
+        agent: dict(header)
+        for agent, header in configs_["HEADER"].items()
+        if isinstance(header, dict)
+    }
+    download_headers = {
+        agent: {
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0",
+            **header,
+        }
+        for agent, header in headers.items()
+    }
+
+    # query parameters (shell patterns) dropped from canonical urls
+    drop_params = re.compile(
+        "|".join(
+            fnmatch.translate(item) for item in configs_["CANONICAL"]["DROP_PARAMS"]
+        )
+        if configs_["CANONICAL"]["DROP_PARAMS"]
+        else "(?!)"
+    )
+
+    return {
+        "EXTENSIONS": extensions,
+        "EXCLUDE": exclude,
+        "CLEAN_CHARS": clean_chars,
+        "HEADERS": headers,
+        "DOWNLOAD_HEADERS": download_headers,
+        "DROP_PARAMS": drop_params,
+    }
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/core/stats.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+PERCENTILES = [50, 95, 99]
+
+
+def percentile(samples_: list, percent_: float) -> float:
+    """Nearest rank percentile of sorted samples"""
+    if not samples_:
+        return 0.0
+    rank = max(
+        0, min(len(samples_) - 1, int(round(percent_ / 100 * len(samples_))) - 1)
+    )
+    return samples_[rank]
+
+
+class Stats:
+    """Throughput and latency metrics of a workflow.
+
+    Fetch latencies are counted and summed per content type since the last
+    reset, percentiles are taken over the latest STATS.MAX_SAMPLES per type. A summary is logged as JSON line every
+    STATS.LOG_INTERVAL seconds and optionally written as Prometheus text file.
+    All methods are thread safe.
+    """
+
+    def __init__(self, prometheus_path_: Path = None) -> None:
+        self._lock = threading.Lock()
+        self._prometheus_path = prometheus_path_
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._start = time.monotonic()
+            self._last_log = self._start
+            self._counters = defaultdict(float)
+            self._latencies = defaultdict(
+                lambda: deque(maxlen=CONFIGS["STATS"]["MAX_SAMPLES"])
+            )
+            self._latency_counts = defaultdict(int)
+            self._latency_sums = defaultdict(float)
+            self._gauges = dict()
+            self._stages = defaultdict(float)
+
+    @property
+    def prometheus_path(self) -> Path:
+        return self._prometheus_path
+
+    @prometheus_path.setter
+    def prometheus_path(self, prometheus_path_: Path) -> None:
+        self._prometheus_path = prometheus_path_
+
+    def record_fetch(
+        self, typ_: str, seconds_: float, bytes_: int, cached_: bool = False
+    ) -> None:
+        """Record a fetched url
+
+        Args:
+            typ_ (str): Content type, e.g. HTML or IMAGE
+            seconds_ (float): Time to fetch the url
+            bytes_ (int): Size of the fetched content
+            cached_ (bool, optional): Response was served from cache. Defaults to False.
+        """
+        with self._lock:
+            self._counters["requests"] += 1
+            self._counters["bytes"] += bytes_
+            self._counters["cache_hits" if cached_ else "cache_misses"] += 1
+            if not cached_:
+                self._latencies[typ_].append(seconds_)
+                self._latency_counts[typ_] += 1
+                self._latency_sums[typ_] += seconds_
+        self.log()
+
+    def record_write(self, seconds_: float, bytes_: int) -> None:
+        """Record a file written to the output folder"""
+        with self._lock:
+            self._counters["disk_writes"] += 1
+            self._counters["disk_write_seconds"] += seconds_
+            self._counters["disk_write_bytes"] += bytes_
+
+    def set_gauge(self, name_: str, value_: float) -> None:
+        """Set a current value, e.g. the size of the crawl queue"""
+        with self._lock:
+            self._gauges[name_] = value_
+
+    @contextmanager
+    def stage(self, name_: str):
+        """Measure the time spent in a stage of the workflow, nested (e.g.
+        recursive) calls of the same stage are counted once."""
+        active = self._local.__dict__.setdefault("active", defaultdict(int))
+        active[name_] += 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            active[name_] -= 1
+            if active[name_] == 0:
+                with self._lock:
+                    self._stages[name_] += time.monotonic() - start
+
+    def summary(self) -> dict:
+        with self._lock:
+            elapsed = max(time.monotonic() - self._start, 1e-9)
+            requests = self._counters["requests"]
+            latency = dict()
+            for typ, samples in self._latencies.items():
+                samples = sorted(samples)
+                latency[typ] = {
+                    "count": self._latency_counts[typ],
+                    "sum": round(self._latency_sums[typ], 6),
+                    **{
+                        f"p{percent}": round(percentile(samples, percent), 6)
+                        for percent in PERCENTILES
+                    },
+                }
+
+            return {
+                "elapsed": round(elapsed, 3),
+                "requests": int(requests),
+                "requests_per_second": round(requests / elapsed, 3),
+                "bytes": int(self._counters["bytes"]),
+                "bytes_per_second": round(self._counters["bytes"] / elapsed, 3),
+                "cache_hit_rate": round(
+                    self._counters["cache_hits"] / requests if requests else 0.0, 3
+                ),
+                "latency": latency,
+                "disk_write": {
+                    "count": int(self._counters["disk_writes"]),
+                    "seconds": round(self._counters["disk_write_seconds"], 6),
+                    "bytes": int(self._counters["disk_write_bytes"]),
+                },
+                "gauges": dict(self._gauges),
+                "stages": {
+                    name: round(seconds, 3) for name, seconds in self._stages.items()
+                },
+            }
+
+    def log(self, force_: bool = False) -> None:
+        """Log the summary as JSON line (and update the Prometheus file), at
+        most once per STATS.LOG_INTERVAL seconds unless forced."""
+        with self._lock:
+            now = time.monotonic()
+            if not force_ and now - self._last_log < CONFIGS["STATS"]["LOG_INTERVAL"]:
+                return
+            self._last_log = now
+
+        summary = self.summary()
+        logging.info(f"Stats: {json.dumps(summary)}")
+        if self._prometheus_path:
+            self.write_prometheus(self._prometheus_path, summary_=summary)
+
+    def write_prometheus(self, path_: Path, summary_: dict = None) -> None:
+        """Write metrics in the Prometheus text format, e.g. for the textfile
+        collector of node exporter. The file is replaced atomically."""
+        summary_ = summary_ or self.summary()
+        prefix = CONFIGS["STATS"]["PROMETHEUS_PREFIX"]
+        lines = []
+
+        def metric(name_, typ_, samples_):
+            lines.append(f"# TYPE {prefix}_{name_} {typ_}")
+            for labels, value in samples_:
+                lines.append(f"{prefix}_{name_}{labels} {value}")
+
+        metric("requests_total", "counter", [("", summary_["requests"])])
+        metric("bytes_total", "counter", [("", summary_["bytes"])])
+        metric("cache_hit_ratio", "gauge", [("", summary_["cache_hit_rate"])])
+        metric(
+            "fetch_latency_seconds",
+            "summary",
+            [
+                (f'{{type="{typ}",quantile="{percent / 100}"}}', values[f"p{percent}"])
+                for typ, values in summary_["latency"].items()
+                for percent in PERCENTILES
+            ]
+            + [
+                (f'_sum{{type="{typ}"}}', values["sum"])
+                for typ, values in summary_["latency"].items()
+            ]
+            + [
+                (f'_count{{type="{typ}"}}', values["count"])
+                for typ, values in summary_["latency"].items()
+            ],
+        )
+        metric(
+            "disk_write_seconds_total",
+            "counter",
+            [("", summary_["disk_write"]["seconds"])],
+        )
+        metric(
+            "disk_write_bytes_total", "counter", [("", summary_["disk_write"]["bytes"])]
+        )
+        metric(
+            "stage_seconds",
+            "gauge",
+            [
+                (f'{{stage="{name}"}}', value)
+                for name, value in summary_["stages"].items()
+            ],
+        )
+        metric(
+            "queue",
+            "gauge",
+            [
+                (f'{{name="{name}"}}', value)
+                for name, value in summary_["gauges"].items()
+            ],
+        )
+
+        path_ = Path(path_)
+        path_.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path_.with_name(f"{path_.name}.tmp")
+        temporary_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(temporary_path, path_)
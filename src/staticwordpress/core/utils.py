@@ -29,14 +29,22 @@ specific language governing rights and limitations under the License.
 
 import os
 import re
+import json
 import stat
+import zlib
+import base64
+import binascii
+import hashlib
+import tempfile
 import shutil
+import threading
 from urllib import parse
 from urllib.request import urlopen
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from zipfile import ZipFile
-from functools import lru_cache
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from functools import update_wrapper
+from collections import OrderedDict
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # 3rd PARTY LIBRARY IMPORTS
@@ -50,7 +58,10 @@ from requests.models import Response
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from ..core.constants import CONFIGS, LINK_REGEX
+from ..core.constants import CONFIGS, COMPILED_CONFIGS, LINK_REGEX
+from ..core.errors import DownloadNotValid
+from ..core.singleflight import SingleFlight
+from ..core.canonical import canonical_key
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -107,8 +118,8 @@ def get_clean_url(url_: str = "", path_: str = "", scheme_: str = "") -> str:
     )
 
     url_ = url_.split("</")[0]
-    pattern = "\\" + "|\\".join([*CONFIGS["CLEAN"]["CHARS"]])
-    url_ = re.sub(pattern, "", url_)
+    if COMPILED_CONFIGS["CLEAN_CHARS"]:
+        url_ = COMPILED_CONFIGS["CLEAN_CHARS"].sub("", url_)
     return url_
 
 
@@ -125,16 +136,84 @@ def rm_dir_tree(dir_path_: str = None, delete_root_: bool = False) -> None:
     if not dir_path_.exists():
         return
 
-    for _path in dir_path_.glob("**/*"):
-        if _path.is_file() and _path.stem not in [".gitignore", ".project"]:
-            _path.unlink()
-        elif _path.is_dir() and _path.stem != "_data":
-            shutil.rmtree(_path, onerror=rmtree_permission_error)
+    # scan level by level, removed folders are never walked
+    with os.scandir(dir_path_) as entries:
+        for entry in entries:
+            _path = Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                if _path.stem == "_data":
+                    rm_dir_tree(_path)
+                else:
+                    shutil.rmtree(_path, onerror=rmtree_permission_error)
+            elif _path.stem not in [".gitignore", ".project"]:
+                _path.unlink()
 
     if delete_root_:
         dir_path_.rmdir()
 
 
+def sync_dir_tree(
+    staging_dir_: Path,
+    output_dir_: Path,
+    unchanged_: list = None,
+    manifest_path_: Path = None,
+) -> dict:
+    """Apply the content of a staging folder to the output folder with minimal
+    changes. Staged files are moved over their output counterparts and files
+    of the previous sync which are not staged or listed as unchanged are
+    deleted. Files which were never synced (e.g. CNAME or .nojekyll) are
+    kept. Untouched output files keep their mtime and inode.
+
+    Args:
+        staging_dir_ (Path): Folder with new and changed files
+        output_dir_ (Path): Output folder
+        unchanged_ (list, optional): Relative paths of files which are current already.
+        manifest_path_ (Path, optional): Json file with the paths of the previous sync.
+        Without a previous manifest no files are deleted.
+
+    Returns:
+        dict: Relative paths which are "added", "replaced" and "deleted"
+    """
+    results = {"added": [], "replaced": [], "deleted": []}
+    current_paths = {PurePosixPath(Path(path)) for path in unchanged_ or []}
+
+    if staging_dir_.exists():
+        for root, _, files in os.walk(staging_dir_):
+            for name in files:
+                staged_path = Path(root, name)
+                relative_path = staged_path.relative_to(staging_dir_)
+                output_path = output_dir_ / relative_path
+                results["replaced" if output_path.exists() else "added"].append(
+                    relative_path
+                )
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staged_path, output_path)
+                current_paths.add(PurePosixPath(relative_path))
+        shutil.rmtree(staging_dir_, onerror=rmtree_permission_error)
+
+    previous_paths = set()
+    if manifest_path_ and manifest_path_.exists():
+        previous_paths = {
+            PurePosixPath(path) for path in json.loads(manifest_path_.read_text())
+        }
+
+    for relative_path in sorted(previous_paths - current_paths):
+        output_path = output_dir_ / relative_path
+        if output_path.is_file():
+            output_path.unlink()
+            results["deleted"].append(Path(relative_path))
+            for parent in output_path.parents:
+                if parent == output_dir_ or any(parent.iterdir()):
+                    break
+                parent.rmdir()
+
+    if manifest_path_:
+        manifest_path_.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path_.write_text(json.dumps(sorted(map(str, current_paths))))
+
+    return results
+
+
 def get_mock_response(url_: str = None) -> Response:
     """Genreate Mock HTTP Response
 
@@ -144,30 +223,135 @@ def get_mock_response(url_: str = None) -> Response:
     Returns:
         Response: Mock response with 9999 as status code
     """
+    from unittest.mock import Mock
+
     response = Mock(spec=Response)
     response.text = ""
+    response.content = b""
     response.history = []
+    response.headers = {}
     response.status_code = 9999
     response.url = url_
     return response
 
 
-@lru_cache
-def get_remote_content(url_: parse.ParseResult, max_retires: int = 5) -> Response:
-    """Get remote content using request library
+_SESSIONS = dict()
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_session(max_retries_: int = 5) -> requests.Session:
+    """Session shared by all workflows of this process, so connections to
+    the same origin are pooled and reused.
+
+    Args:
+        max_retries_ (int, optional): maximum tries to fetch the content. Defaults to 5.
+
+    Returns:
+        requests.Session: Shared session
+    """
+    with _SESSIONS_LOCK:
+        if max_retries_ not in _SESSIONS:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=CONFIGS["HTTP"]["POOL_CONNECTIONS"],
+                pool_maxsize=CONFIGS["HTTP"]["POOL_MAXSIZE"],
+                max_retries=max_retries_,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSIONS[max_retries_] = session
+        return _SESSIONS[max_retries_]
+
+
+_IN_FLIGHT = SingleFlight()
+_FETCH_STATE = threading.local()
+
+
+def get_in_flight() -> SingleFlight:
+    """Fetches of get_remote_content which are currently in flight, keyed
+    by the canonical url"""
+    return _IN_FLIGHT
+
+
+def is_reused_response() -> bool:
+    """Whether the last get_remote_content call of the current thread was
+    answered from the cache or by a concurrent fetch of the same url, i.e.
+    without a request of its own to the origin"""
+    return getattr(_FETCH_STATE, "reused", False)
+
+
+def response_cache(key_):
+    """Thread safe lru cache (like functools.lru_cache with maxsize 128) of a
+    function returning responses, entries are keyed by key_(*args, **kwargs).
+    Throttled responses (429, 503) are not kept, they are fetched again after
+    the rate controller's pause."""
+    maxsize = 128
+
+    def decorator(function_):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        def wrapper(*args, **kwargs):
+            key = key_(*args, **kwargs)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    _FETCH_STATE.reused = True
+                    return cache[key]
+
+            response = function_(*args, **kwargs)
+            if response.status_code not in CONFIGS["RATE_CONTROL"]["THROTTLE_STATUS"]:
+                with lock:
+                    cache[key] = response
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return response
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return update_wrapper(wrapper, function_)
+
+    return decorator
+
+
+def _remote_content_key(
+    url_: parse.ParseResult, max_retires: int = 5, backend_=None
+) -> tuple:
+    """Cache key of get_remote_content, urls are keyed by their canonical
+    form like the fetches in flight"""
+    return canonical_key(get_clean_url(url_=url_)), max_retires, backend_
+
+
+@response_cache(_remote_content_key)
+def get_remote_content(
+    url_: parse.ParseResult, max_retires: int = 5, backend_=None
+) -> Response:
+    """Get remote content using request library (or backend_). Concurrent
+    calls for the same canonical url share a single request.
 
     Args:
         url (str): url needed to be fetched
         max_retires (int, optional): maximum tries to fetch the content. Defaults to 5.
+        backend_ (FetchBackend, optional): Fetch backend of the project. Defaults to None.
     Returns:
         Response: request response object.
     """
     url = get_clean_url(url_=url_)
+    _FETCH_STATE.reused = False
     try:
-        s = requests.Session()
-        s.mount(url, HTTPAdapter(max_retries=max_retires))
-        default_user_agent = CONFIGS["DEFAULT_USER_AGENT"]
-        return s.get(url, headers=CONFIGS["HEADER"][default_user_agent])
+        headers = COMPILED_CONFIGS["HEADERS"][CONFIGS["DEFAULT_USER_AGENT"]]
+        key = canonical_key(url)
+        if backend_ is not None:
+            response = _IN_FLIGHT.do(key, backend_.get, url, headers_=headers)
+        else:
+            response = _IN_FLIGHT.do(
+                key, get_session(max_retires).get, url, headers=headers
+            )
+        _FETCH_STATE.reused = _IN_FLIGHT.was_shared
+        return response
     except:
         return get_mock_response(url_=url)
 
@@ -225,6 +409,258 @@ def extract_zip_file(zip_file_path_: Path, output_location_: Path) -> None:
             zf.extractall(output_location_)
 
 
+def _crc32_of_file(file_path_: Path, chunk_size_: int = 1 << 20) -> int:
+    crc = 0
+    with open(file_path_, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size_), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def stream_zip_file(
+    zip_file_path_: Path,
+    output_location_: Path,
+    archive_folder_: str = "",
+    max_workers_: int = None,
+    staging_location_: Path = None,
+) -> dict:
+    """Extract ZipFile members directly to their final location. Members are
+    extracted in parallel, the archive_folder_ prefix (and everything before
+    it) is removed from member paths and members which already exist with the
+    same CRC are skipped.
+
+    Args:
+        zip_file_path_ (Path): Zip File Path
+        output_location_ (Path): Ouput Folder Path
+        archive_folder_ (str, optional): Folder inside Zip File containing the website.
+        max_workers_ (int, optional): Number of parallel extraction threads.
+        staging_location_ (Path, optional): Write changed members here instead of output_location_.
+
+    Returns:
+        dict: Relative paths of "written" and "unchanged" members
+    """
+    results = {"written": [], "unchanged": []}
+    if not (output_location_.is_dir() and zip_file_path_.exists()):
+        return results
+
+    output_location_ = output_location_.resolve()
+    with ZipFile(zip_file_path_, "r") as zf:
+        infos = [info for info in zf.infolist() if not info.is_dir()]
+
+    members = []
+    has_archive_folder = any(
+        archive_folder_ in PurePosixPath(info.filename).parts for info in infos
+    )
+    for info in infos:
+        parts = PurePosixPath(info.filename).parts
+        if archive_folder_ and has_archive_folder:
+            if archive_folder_ not in parts:
+                continue
+            parts = parts[parts.index(archive_folder_) + 1 :]
+
+        target = output_location_.joinpath(*parts).resolve()
+        if parts and output_location_ in target.parents:
+            members.append((info, target))
+
+    thread_data = threading.local()
+    zip_files = []  # one handle per thread, ZipFile reads are not thread safe
+
+    def extract_member(member_):
+        info, target = member_
+        relative_path = target.relative_to(output_location_)
+        if (
+            target.is_file()
+            and target.stat().st_size == info.file_size
+            and _crc32_of_file(target) == info.CRC
+        ):
+            return "unchanged", relative_path
+
+        if staging_location_:
+            target = staging_location_ / relative_path
+
+        if not hasattr(thread_data, "zip_file"):
+            thread_data.zip_file = ZipFile(zip_file_path_, "r")
+            zip_files.append(thread_data.zip_file)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with thread_data.zip_file.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        return "written", relative_path
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers_) as executor:
+            for status, relative_path in executor.map(extract_member, members):
+                results[status].append(relative_path)
+    finally:
+        for zip_file in zip_files:
+            zip_file.close()
+
+    return results
+
+
+def download_file(
+    url_: str,
+    output_path_: Path,
+    chunk_size_: int = 1 << 20,
+    segments_: int = 1,
+    sha256_: str = "",
+    progress_callback_=None,
+    max_retries_: int = 5,
+) -> Path:
+    """Download a (large) file with resumable HTTP Range requests. Partial
+    downloads are kept in the temp folder and continued on the next call.
+    If the server supports ranges, the file is fetched as segments_ parallel
+    byte ranges.
+
+    Args:
+        url_ (str): Url of the file
+        output_path_ (Path): Destination of the downloaded file
+        chunk_size_ (int, optional): Read size of the response stream in bytes.
+        segments_ (int, optional): Number of parallel byte ranges.
+        sha256_ (str, optional): Expected sha256 hex digest of the file, taken
+        from the Repr-Digest or Digest header of the server if not given.
+        progress_callback_ (callable, optional): Called as progress_callback_(done_bytes, total_bytes).
+        max_retries_ (int, optional): Retries for interrupted segments.
+
+    Raises:
+        DownloadNotValid: Size or checksum of the downloaded file do not match.
+
+    Returns:
+        Path: Path of the downloaded file
+    """
+    output_path_ = Path(output_path_)
+    headers = COMPILED_CONFIGS["DOWNLOAD_HEADERS"][CONFIGS["DEFAULT_USER_AGENT"]]
+
+    session = requests.Session()
+    session.mount(url_, HTTPAdapter(max_retries=max_retries_))
+    head = session.head(url_, headers=headers, allow_redirects=True)
+    total = int(head.headers.get("Content-Length", 0)) if head.ok else 0
+    accept_ranges = head.ok and head.headers.get("Accept-Ranges", "") == "bytes"
+    if head.ok and not sha256_:
+        sha256_ = get_header_sha256(head.headers)
+    if not (accept_ranges and total):
+        segments_ = 1
+
+    # partial downloads are invalidated, when the remote file changes
+    partial_folder = Path(tempfile.gettempdir()) / "staticwordpress"
+    partial_folder.mkdir(parents=True, exist_ok=True)
+    partial_name = hashlib.sha256(url_.encode("utf-8")).hexdigest()[:32]
+    partial_info_path = partial_folder / f"{partial_name}.json"
+    partial_info = {
+        "url": url_,
+        "size": total,
+        "segments": segments_,
+        "etag": head.headers.get("ETag", ""),
+        "last-modified": head.headers.get("Last-Modified", ""),
+    }
+    partial_paths = [
+        partial_folder / f"{partial_name}.part{index}" for index in range(segments_)
+    ]
+    if not (
+        accept_ranges
+        and partial_info_path.exists()
+        and json.loads(partial_info_path.read_text()) == partial_info
+    ):
+        for partial_path in partial_folder.glob(f"{partial_name}.part*"):
+            partial_path.unlink()
+    partial_info_path.write_text(json.dumps(partial_info))
+
+    segment_size = -(-total // segments_) if total else 0
+    ranges = [
+        (index * segment_size, min((index + 1) * segment_size, total) - 1)
+        for index in range(segments_)
+    ]
+
+    lock = threading.Lock()
+    progress = {"done": sum(p.stat().st_size for p in partial_paths if p.exists())}
+
+    def download_segment(index_: int) -> None:
+        start, end = ranges[index_]
+        partial_path = partial_paths[index_]
+        for attempt in range(max_retries_ + 1):
+            offset = partial_path.stat().st_size if partial_path.exists() else 0
+            if total and offset >= end - start + 1:
+                return
+
+            segment_headers = dict(headers)
+            if accept_ranges and total:
+                segment_headers["Range"] = f"bytes={start + offset}-{end}"
+
+            try:
+                with session.get(url_, headers=segment_headers, stream=True) as r:
+                    if r.status_code >= 400:
+                        raise DownloadNotValid(f"{r.status_code} {url_}")
+                    mode = "ab" if r.status_code == 206 else "wb"
+                    if mode == "wb":
+                        with lock:
+                            progress["done"] -= offset
+                    with open(partial_path, mode) as f:
+                        for chunk in r.iter_content(chunk_size=chunk_size_):
+                            f.write(chunk)
+                            with lock:
+                                progress["done"] += len(chunk)
+                                if progress_callback_:
+                                    progress_callback_(progress["done"], total)
+                return
+            except requests.exceptions.RequestException:
+                if attempt == max_retries_:
+                    raise
+
+    with ThreadPoolExecutor(max_workers=segments_) as executor:
+        list(executor.map(download_segment, range(segments_)))
+
+    digest = hashlib.sha256()
+    output_path_.parent.mkdir(parents=True, exist_ok=True)
+    if segments_ == 1:
+        # a single segment is the complete file, it is moved instead of copied
+        shutil.move(str(partial_paths[0]), str(output_path_))
+        if sha256_:
+            with open(output_path_, "rb") as f:
+                for chunk in iter(lambda: f.read(chunk_size_), b""):
+                    digest.update(chunk)
+    else:
+        with open(output_path_, "wb") as f:
+            for partial_path in partial_paths:
+                with open(partial_path, "rb") as partial_file:
+                    for chunk in iter(lambda: partial_file.read(chunk_size_), b""):
+                        digest.update(chunk)
+                        f.write(chunk)
+                partial_path.unlink()
+    partial_info_path.unlink()
+    session.close()
+
+    if total and output_path_.stat().st_size != total:
+        raise DownloadNotValid(
+            f"Size mismatch {output_path_.stat().st_size} != {total}: {url_}"
+        )
+
+    if sha256_ and digest.hexdigest() != sha256_.lower():
+        raise DownloadNotValid(f"Checksum mismatch {digest.hexdigest()}: {url_}")
+
+    return output_path_
+
+
+def get_header_sha256(headers_: dict) -> str:
+    """sha256 hex digest announced in a Repr-Digest (RFC 9530) or Digest
+    (RFC 3230) header, empty if the server does not send one
+
+    Args:
+        headers_ (dict): Response headers
+
+    Returns:
+        str: sha256 hex digest or ""
+    """
+    for name in ["Repr-Digest", "Digest"]:
+        for item in headers_.get(name, "").split(","):
+            algorithm, _, value = item.strip().partition("=")
+            if algorithm.lower() == "sha-256" and value:
+                try:
+                    return base64.b64decode(value.strip(":"), validate=True).hex()
+                except (binascii.Error, ValueError):
+                    pass
+    return ""
+
+
 def is_url_valid(url_: str) -> bool:
     url_parsed_ = parse.urlparse(url_)
 
@@ -27,32 +27,54 @@ specific language governing rights and limitations under the License.
 # STANDARD LIBARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-import time
+import os
 import glob
 import shutil
 import codecs
 import logging
+import time
 import random
+import threading
 from pathlib import Path
+from contextlib import nullcontext
+from concurrent.futures import Executor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # 3rd PARTY LIBRARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 import requests
-from bs4 import BeautifulSoup
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+from ..core.stats import Stats
+from ..core.profiler import StageProfiler
+from ..core.ratecontrol import get_rate_controller
+from ..core.progress import CrawlProgress
 from ..core.search import Search
-from ..core.github import GitHub
+from ..core.deploy import get_deploy_backend
+from ..core.fetch import get_fetch_backend, FetchBackend, LimitedBackend
 from ..core.crawler import Crawler
+from ..core.canonical import canonical_key
+from ..core.scope import Scope
 from ..core.project import Project
-from ..core.redirects import Redirects
-from ..core.sitemaps import find_sitemap_location, extract_sitemap_paths
-from ..core.utils import extract_zip_file, rm_dir_tree, update_links
+from ..core.redirects import Redirects, Redirect
+from ..core.errors import DownloadNotValid, DeployFailed
+from ..core.sitemaps import (
+    find_sitemap_location,
+    extract_sitemap_paths,
+    count_sitemap_urls,
+)
+from ..core.utils import (
+    stream_zip_file,
+    sync_dir_tree,
+    rm_dir_tree,
+    update_links,
+    is_reused_response,
+)
 from ..core.constants import (
     CONFIGS,
     SHARE_FOLDER_PATH,
@@ -63,7 +85,6 @@ from ..core.constants import (
     REDIRECTS,
 )
 
-
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -77,6 +98,17 @@ class Workflow:
         self._crawler = Crawler(loc_="", typ_=URL.NONE)
         self._urls = dict()
         self._github = None
+        self._changed_paths = None
+        self._stats = Stats()
+        self._profiler = StageProfiler()
+        self._progress = CrawlProgress()
+        self._discovered = set()
+        self._scope = Scope()
+        self._frontier = 0
+        self._executor = None
+        self._fetch_slots = None
+        self._archive_pages = 0
+        self._lock = threading.RLock()
         self._keep_running = True
 
     @property
@@ -107,8 +139,110 @@ class Workflow:
     def github(self):
         return self._github
 
+    @property
+    def fetch_backend(self) -> FetchBackend:
+        backend = get_fetch_backend(self._project.fetch_backend)
+        if self._fetch_slots is not None:
+            return LimitedBackend(backend, self._fetch_slots)
+        return backend
+
+    @property
+    def executor(self) -> Executor:
+        """Worker threads for independent sub steps of a stage, kept by the
+        workflow. Never a pool of the application (e.g. the GUI), the calling
+        step waits for these threads and would block a shared pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="workflow"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker threads of the workflow, they are started again on
+        the next use"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def fetch_slots(self) -> threading.Semaphore:
+        """Semaphore limiting concurrent fetches of all workflows which share
+        it (e.g. of a batch export), None leaves the limit to the rate
+        controllers of the origins"""
+        return self._fetch_slots
+
+    @fetch_slots.setter
+    def fetch_slots(self, fetch_slots_: threading.Semaphore) -> None:
+        self._fetch_slots = fetch_slots_
+
+    @property
+    def pages(self) -> int:
+        """Number of exported urls, crawled urls or files of the ZIP archive"""
+        if self._project.src_type == SOURCE.ZIP:
+            return self._archive_pages
+        return len(self._urls)
+
+    @property
+    def scope(self) -> Scope:
+        return self._scope
+
+    @property
+    def changed_paths(self) -> set:
+        """Output relative paths written or deleted since the last commit,
+        None if changes are not tracked (e.g. after opening a project)"""
+        return self._changed_paths
+
+    @property
+    def stats(self) -> Stats:
+        return self._stats
+
+    @property
+    def profiler(self) -> StageProfiler:
+        return self._profiler
+
+    @property
+    def progress(self) -> CrawlProgress:
+        return self._progress
+
     def clear(self):
         self._urls = dict()
+        self._archive_pages = 0
+        self._discovered = set()
+        self._scope.reset()
+        self._frontier = 0
+        self._progress.reset()
+        self._profiler.reset()
+
+    def track_changes(self, *paths_) -> None:
+        """Record output files changed by the export, these are the only files
+        staged by the next commit. Paths are absolute or relative to the output
+        folder, folders are expanded to the files they contain."""
+        with self._lock:
+            if self._changed_paths is None:
+                self._changed_paths = set()
+            output = Path(self._project.output).resolve()
+            for path in paths_:
+                path = output / path
+                if path.is_dir():
+                    self.track_changes(*[p for p in path.rglob("*") if p.is_file()])
+                    continue
+                try:
+                    self._changed_paths.add(
+                        path.resolve().relative_to(output).as_posix()
+                    )
+                except ValueError:
+                    logging.warning(f"Not Tracked (outside of output folder): {path}")
+
+    # decorators
+    def record_stage(name_: str):
+        def decorator(func):
+            def inner(self, *args, **kwargs):
+                with self._stats.stage(name_), self._profiler.stage(name_):
+                    return func(self, *args, **kwargs)
+
+            return inner
+
+        return decorator
 
     def create_project(
         self,
@@ -146,24 +280,42 @@ class Workflow:
 
         # TODO: Add Support for GH Repo ??? Do We need it?
         # for now keep it like this.
-        if all(
-            [
-                self._project.gh_token != "",
-                self._project.output != "",
-                self._project.gh_repo != "",
-            ]
-        ):
-            self._github = GitHub(
-                gh_token_=self._project.gh_token,
-                repo_dir_=self._project.output,
-                gh_repo_=self._project.gh_repo,
-            )
+        self.setup_github()
 
         self._project.update_ss()
+        self.setup_stats()
+        self.setup_scope()
 
     def set_project(self, project_: Project) -> None:
         self._project = project_
+        self.setup_stats()
+        self.setup_profiler()
+        self.setup_scope()
+
+        self.setup_github()
+
+        if self._project.src_type == SOURCE.ZIP:
+            self._project.update_ss()
+
+    def start_calculations(self) -> None:
+        self._keep_running = True
+        logging.warn("Background Processings is Starting")
+
+    def stop_calculations(self) -> None:
+        self._keep_running = False
+        logging.warn("Background Processings will Stop. Please wait!")
+
+    def setup_stats(self) -> None:
+        """Write metrics of the project to _data/metrics.prom if enabled"""
+        self._stats.prometheus_path = (
+            Path(self._project.output) / "_data" / "metrics.prom"
+            if CONFIGS["STATS"]["PROMETHEUS"] and self._project.output
+            else None
+        )
 
+    def setup_github(self) -> None:
+        """Connect to the GitHub repository of the project if configured.
+        PyGithub and GitPython are only imported for projects which use them."""
         if all(
             [
                 self._project.gh_token != "",
@@ -171,70 +323,136 @@ class Workflow:
                 self._project.gh_repo != "",
             ]
         ):
+            from ..core.github import GitHub
+
             self._github = GitHub(
                 gh_token_=self._project.gh_token,
                 repo_dir_=self._project.output,
                 gh_repo_=self._project.gh_repo,
+                lfs_threshold_=self._project.gh_lfs_threshold,
             )
 
-        if self._project.src_type == SOURCE.ZIP:
-            self._project.update_ss()
-
-    def start_calculations(self) -> None:
-        self._keep_running = True
-        logging.warn("Background Processings is Starting")
+    def setup_profiler(self) -> None:
+        """Profile the workflow stages into _data/profiles if enabled"""
+        self._profiler.output_path = (
+            Path(self._project.output) / "_data" / CONFIGS["PROFILE"]["FOLDER"]
+            if CONFIGS["PROFILE"]["ENABLED"] and self._project.output
+            else None
+        )
 
-    def stop_calculations(self) -> None:
-        self._keep_running = False
-        logging.warn("Background Processings will Stop. Please wait!")
+    def setup_scope(self) -> None:
+        """Compile the crawl scope rules of the project"""
+        self._scope = Scope.from_configs(
+            exclude_=self._project.exclude, scope_=self._project.scope
+        )
 
-    def download_zip_file(self) -> None:
+    def export(self, callback_=None, progress_callback_=None) -> None:
+        """Run all steps of the static website export, used by the batch
+        processing of the GUI and the command line. The progress is finished
+        once all steps are done.
+
+        Args:
+            callback_ (callable, optional): Called as callback_(crawler, message)
+            after every crawled url.
+            progress_callback_ (callable, optional): Called as progress_callback_(done, total)
+            while the zip file is downloaded.
+        """
+        self.clear()
+        self._stats.reset()
+        self._keep_running = True
+        if self._project.src_type == SOURCE.ZIP:
+            self.download_zip_file(progress_callback_=progress_callback_)
+            self.setup_zip_folders()
+        else:
+            self.crawl_sitemap(callback_=callback_)
+            for additional_url in self._project.additional:
+                if additional_url and self._keep_running:
+                    self.crawl_url(loc_=additional_url, callback_=callback_)
+            self.crawl_url(loc_=self._project.src_url, callback_=callback_)
+
+        self.add_static_files()
+        self.add_search()
+        self._progress.finish()
+        self._stats.log(force_=True)
+        if self._profiler.is_enabled:
+            logging.info(f"Stage Profiles:\n{self._profiler.table()}")
+
+    @record_stage("download")
+    def download_zip_file(self, progress_callback_=None) -> None:
         if self._keep_running:
-            rm_dir_tree(self._project.output, delete_root_=False)
             self._crawler = Crawler(loc_=self._project.zip_file_url, typ_=URL.ZIP)
             self._crawler.fetch()
-            self._crawler.save(full_output_folder=self._project.output)
+            try:
+                self._crawler.save(
+                    full_output_folder=self._project.output,
+                    progress_callback_=progress_callback_,
+                )
+            except (DownloadNotValid, requests.exceptions.RequestException) as e:
+                logging.error(f"Downloading Zip File Failed: {e}")
 
+    @record_stage("extract")
     def setup_zip_folders(self) -> None:
+        """Extract changed zip members into a staging folder and apply them to
+        the output folder, files removed from the website are deleted."""
         if self._keep_running:
-            extract_zip_file(
+            output = Path(self._project.output)
+            extracted = stream_zip_file(
                 self._project.zip_file_path,
-                output_location_=Path(self._project.output),
+                output_location_=output,
+                archive_folder_=self._project.ss_archive,
+                staging_location_=output / "_data" / "staging",
+            )
+            self._archive_pages = len(extracted["written"]) + len(
+                extracted["unchanged"]
             )
             rm_dir_tree(Path(f"{self._project.output}/{self._project.ss_folder}"))
-            extracted_paths = glob.glob(
-                f"{self._project.output}/**/{self._project.ss_archive}", recursive=True
+            synced = sync_dir_tree(
+                staging_dir_=output / "_data" / "staging",
+                output_dir_=output,
+                unchanged_=extracted["unchanged"],
+                manifest_path_=output / "_data" / ".zip-manifest.json",
+            )
+            self.track_changes(
+                *synced["added"], *synced["replaced"], *synced["deleted"]
+            )
+            logging.info(
+                f"Synced Output Folder: {len(synced['added'])} added, "
+                f"{len(synced['replaced'])} replaced, "
+                f"{len(extracted['unchanged'])} unchanged, "
+                f"{len(synced['deleted'])} deleted"
             )
-            if extracted_paths:
-                archive_folder = Path(extracted_paths[0])
-                shutil.copytree(
-                    archive_folder, self._project.output, dirs_exist_ok=True
-                )
-                zip_download_folder = archive_folder.relative_to(self._project.output)
-                rm_dir_tree(
-                    Path(f"{self._project.output}/{zip_download_folder.parts[0]}"),
-                    delete_root_=True,
-                )
 
+    def add_static_files(self) -> None:
+        """Create 404 page, robots.txt and redirects concurrently, these steps
+        are independent of each other and write different files."""
+        futures = [
+            self.executor.submit(step)
+            for step in [self.add_robots_txt, self.add_redirects]
+        ]
+        try:
+            self.add_404_page()
+        finally:
+            for future in futures:
+                future.result()
+
+    @record_stage("search")
     def add_search(self) -> None:
         """Now Process all folders with content/index.html files
         only include html pages with content (blogs, pages)"""
         if self._project.search_path.exists():
+            from bs4 import BeautifulSoup
+
             self._search = Search(
                 search_page_=self._project.search_path, dst_url_=self._project.dst_url
             )
 
             for _path in glob.glob(f"{self._project.output}/**", recursive=True):
                 current_path = Path(_path)
-                if (
-                    all(
-                        [
-                            exclude not in current_path.parts
-                            for exclude in self._project.exclude
-                        ]
-                    )
-                    and current_path.parts[-1] == "index.html"
-                ):
+                if current_path.parts[-1] != "index.html":
+                    continue
+
+                url_path = current_path.parent.relative_to(self._project.output)
+                if self._scope.matches("/".join(("",) + url_path.parts + ("",))):
                     if self._keep_running:
                         with codecs.open(current_path, "r", "utf-8") as f:
                             content = f.read()
@@ -244,10 +462,6 @@ class Workflow:
                                 self._project.dst_url,
                             )
 
-                            url_path = current_path.parent.relative_to(
-                                self._project.output
-                            )
-
                             soup = BeautifulSoup(content, "lxml")
                             if str(url_path) == self._project.search:
                                 self._search.update(
@@ -261,23 +475,50 @@ class Workflow:
 
             self._search.copy_scripts()
             self._search.save()
+            self.track_changes(self._project.search_path)
 
+    @record_stage("redirects")
     def add_redirects(self) -> None:
         if self._keep_running:
             if self._project.redirects != REDIRECTS.NONE:
                 self._redirects.get_from_plugin(
                     redirects_api_path_=self._project.redirects_api_url,
                     wp_auth_token_=self._project.wp_auth_token,
+                    backend_=self.fetch_backend,
                 )
 
             if self._project.search_path.exists():
                 self._redirects.add_search(search_page_=self._project.search)
 
+            self._redirects.consolidate()
+
             redirect_ouputfile = f"{self._project.output}/{CONFIGS['REDIRECTS']['DESTINATION'][self._project.host.value]}"
-            self._redirects.save(
-                output_file_=redirect_ouputfile, host_=self._project.host
+            self.track_changes(
+                *self._redirects.save(
+                    output_file_=redirect_ouputfile,
+                    host_=self._project.host,
+                    known_paths_=self.get_output_paths(),
+                )
             )
 
+    def get_output_paths(self) -> list:
+        """Url paths of all pages and files in the output folder"""
+        output = Path(self._project.output)
+        output_paths = []
+        for root, folders, files in os.walk(output):
+            folders[:] = [
+                folder for folder in folders if folder not in [".git", "_data"]
+            ]
+            url_path = "/".join(("",) + Path(root).relative_to(output).parts)
+            for file_name in files:
+                output_paths.append(
+                    f"{url_path}/"
+                    if file_name == "index.html"
+                    else f"{url_path}/{file_name}"
+                )
+        return output_paths
+
+    @record_stage("robots")
     def add_robots_txt(self) -> None:
         if self._keep_running:
             src = Path(f"{SHARE_FOLDER_PATH}/robots.txt")
@@ -285,7 +526,9 @@ class Workflow:
 
             if src.exists():
                 shutil.copyfile(src, dst)
+                self.track_changes(dst)
 
+    @record_stage("404")
     def add_404_page(self) -> None:
         if self._keep_running:
             self._crawler = Crawler(
@@ -293,8 +536,10 @@ class Workflow:
                 typ_=URL.HTML,
                 scheme_=self._project.scheme,
             )
-            self._crawler.fetch()
+            self._crawler.fetch(backend_=self.fetch_backend)
             self._crawler.save(full_output_folder=self._project.output)
+            if self._crawler.output_path:
+                self.track_changes(self._crawler.output_path)
 
             if self._project.src_type == SOURCE.ZIP:
                 if self._project._404_path.exists():
@@ -303,41 +548,226 @@ class Workflow:
                         dst=f"{self._project.output}/404.html",
                     )
                     shutil.rmtree(self._project._404_path)
+                    self.track_changes(
+                        f"{self._project.output}/404.html",
+                        f"{self._project._404_path}/index.html",
+                    )
 
     # crawl Actions
     def find_sitemap(self) -> None:
-        self._project.sitemap = find_sitemap_location(self._project.src_url)
+        self._project.sitemap = find_sitemap_location(
+            self._project.src_url, backend_=self.fetch_backend
+        )
 
-    def crawl_sitemap(self) -> None:
+    @record_stage("crawl")
+    def crawl_sitemap(self, callback_=None) -> None:
         if self._project.sitemap:
             sitemap_paths = extract_sitemap_paths(
-                sitemap_url_=self._project.sitemap_url
+                sitemap_url_=self._project.sitemap_url, backend_=self.fetch_backend
+            )
+            self._progress.set_expected(
+                count_sitemap_urls(sitemap_paths, backend_=self.fetch_backend)
+                + len(sitemap_paths)
             )
             for sitemap_path in sitemap_paths:
                 if self._keep_running:
-                    self.crawl_url(loc_=sitemap_path)
-
-    def crawl_url(self, loc_: str) -> None:
+                    self.crawl_url(loc_=sitemap_path, callback_=callback_)
+
+    @record_stage("crawl")
+    def crawl_url(self, loc_: str, callback_=None) -> None:
+        """Crawl loc_ and all internal links found on it. Links are crawled depth
+        first from an explicit frontier, deep websites do not hit the recursion
+        limit. Up to the concurrency limit of the origin's rate controller
+        pages are fetched in parallel.
+
+        Args:
+            loc_ (str): Url to crawl
+            callback_ (callable, optional): Called as callback_(crawler, message)
+            after every processed url.
+        """
+        frontier = [loc_]
+        with self._lock:
+            self._discovered.add(canonical_key(loc_))
+            self._frontier += 1
+
+        rate_controller = get_rate_controller(urlparse(loc_).netloc)
+        pending = set()
+        with ThreadPoolExecutor(
+            max_workers=CONFIGS["RATE_CONTROL"]["MAX_CONCURRENCY"]
+        ) as executor:
+            while frontier or pending:
+                with self._lock:
+                    if not self._keep_running:
+                        self._frontier -= len(frontier)
+                        frontier.clear()
+
+                    while frontier and len(pending) < max(1, rate_controller.limit):
+                        self._frontier -= 1
+                        pending.add(
+                            executor.submit(
+                                self._profiler.run,
+                                self.crawl_page,
+                                frontier.pop(),
+                                frontier_=frontier,
+                                callback_=callback_,
+                            )
+                        )
+
+                if pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+
+    def crawl_page(self, loc_: str, frontier_: list, callback_=None) -> None:
+        """Fetch and save a single url, newly discovered internal links are
+        pushed to frontier_.
+
+        Args:
+            loc_ (str): Url to crawl
+            frontier_ (list): Stack of urls waiting to be crawled
+            callback_ (callable, optional): Called as callback_(crawler, message).
+        """
         current_crawler = Crawler(loc_=loc_, scheme_=self._project.scheme)
-        if current_crawler.hash not in self._urls:
-            time.sleep(self._project.delay + random.random() / 100)
-            current_crawler.fetch()
-            full_output_path = current_crawler.save(
-                self._project.output, dst_url=self._project.dst_url
+        with self._lock:
+            if current_crawler.hash in self._urls:
+                return
+
+            self._urls[current_crawler.hash] = current_crawler
+            known_redirect = self._redirects.match(current_crawler.path)
+
+        if known_redirect:
+            logging.info(f"Redirect: {current_crawler.path} -> {known_redirect.to_url}")
+            self.update_progress()
+            if callback_:
+                callback_(current_crawler, "Redirect")
+            return
+
+        self.fetch_page(current_crawler)
+
+        with self._lock:
+            redirects_count = (
+                current_crawler.is_redirected
+                and self.add_crawl_redirects(current_crawler)
+            )
+        if redirects_count:
+            self.push_links([current_crawler.url], frontier_)
+            if callback_:
+                callback_(current_crawler, "Redirect")
+            return
+
+        save_start = time.perf_counter()
+        full_output_path = current_crawler.save(
+            self._project.output, dst_url=self._project.dst_url
+        )
+        if current_crawler.output_path:
+            self._stats.record_write(
+                seconds_=time.perf_counter() - save_start,
+                bytes_=current_crawler.output_path.stat().st_size,
             )
-            self._urls[current_crawler._hash] = current_crawler
 
-            custom_message = "Saved"
-            if current_crawler.status_code >= 400 or current_crawler._typ == URL.NONE:
-                custom_message = "Ignored"
+        custom_message = "Saved"
+        if current_crawler.status_code >= 400 or current_crawler._typ == URL.NONE:
+            custom_message = "Ignored"
+        if current_crawler.output_path:
+            self.track_changes(current_crawler.output_path)
 
-            logging.info(
-                f"{custom_message}: {current_crawler.status_code} {current_crawler._typ} {full_output_path}"
+        logging.info(
+            f"{custom_message}: {current_crawler.status_code} {current_crawler._typ} {full_output_path}"
+        )
+        self.push_links(current_crawler.internal_links, frontier_)
+        if callback_:
+            callback_(current_crawler, custom_message)
+
+    def fetch_page(self, crawler_: Crawler) -> None:
+        """Fetch a url within the rate limits of its origin, throttled responses
+        (429, 503) are fetched again after the rate controller's pause."""
+        if not crawler_.is_valid or crawler_.typ == URL.ZIP:
+            return
+
+        rate_controller = get_rate_controller(crawler_.netloc)
+        for attempt in range(CONFIGS["RATE_CONTROL"]["RETRIES"] + 1):
+            rate_controller.acquire(self._project.delay + random.random() / 100)
+            # a fetch slot is taken before timing, waiting is no origin latency
+            with self._fetch_slots or nullcontext():
+                fetch_start = time.perf_counter()
+                try:
+                    crawler_.fetch(
+                        cached_=attempt == 0,
+                        backend_=get_fetch_backend(self._project.fetch_backend),
+                    )
+                finally:
+                    fetch_seconds = time.perf_counter() - fetch_start
+                    # cached and shared responses say nothing about the origin
+                    reused = is_reused_response()
+                    rate_controller.release(
+                        status_code_=crawler_.status_code,
+                        seconds_=None if reused else fetch_seconds,
+                        retry_after_=crawler_.headers.get("Retry-After"),
+                    )
+            self._stats.record_fetch(
+                typ_=crawler_.typ.value,
+                seconds_=fetch_seconds,
+                bytes_=crawler_.size,
+                cached_=reused,
             )
+            if crawler_.status_code not in CONFIGS["RATE_CONTROL"]["THROTTLE_STATUS"]:
+                break
+            logging.warning(f"Throttled: {crawler_.status_code} {crawler_.url}")
+
+    def push_links(self, links_: list, frontier_: list) -> None:
+        """Queue links which were not discovered before and are in the crawl
+        scope, in page order"""
+        with self._lock:
+            new_links = []
+            for link in links_:
+                key = canonical_key(link)
+                if key not in self._discovered:
+                    self._discovered.add(key)
+                    if self._scope.admit(link):
+                        new_links.append(link)
+            frontier_.extend(reversed(new_links))
+            self._frontier += len(new_links)
+            self._stats.set_gauge("out_of_scope", self._scope.rejected_count)
+            self.update_progress()
+
+    def update_progress(self) -> None:
+        self._progress.update(completed_=len(self._urls), frontier_=self._frontier)
+        self._stats.set_gauge("frontier", self._frontier)
+        self._stats.set_gauge("urls", len(self._urls))
+
+    def add_crawl_redirects(self, crawler_: Crawler) -> int:
+        """Turn redirects followed while fetching crawler_ into redirect rules.
+        Only redirects to another path on the same host are considered, scheme
+        or trailing slash changes are not redirect rules.
+
+        Args:
+            crawler_ (Crawler): Fetched crawler with redirect history
+
+        Returns:
+            int: Number of redirect rules added
+        """
+        final_url = urlparse(crawler_.url)
+        if final_url.netloc != crawler_.netloc:
+            return 0
+
+        redirects_count = 0
+        for response in crawler_.history:
+            source = urlparse(response.url)
+            if source.path.rstrip("/") != final_url.path.rstrip("/"):
+                self._redirects.add_redirect(
+                    Redirect(
+                        from_=source.path,
+                        to_=final_url.path,
+                        query_=None,
+                        status_=response.status_code,
+                        force_=True,
+                        source_=REDIRECTS.CRAWL.value,
+                    )
+                )
+                redirects_count += 1
+                logging.info(f"Redirect: {source.path} -> {final_url.path}")
 
-            for internal_link in current_crawler.internal_links:
-                if self._keep_running:
-                    self.crawl_url(internal_link)
+        return redirects_count
 
     # Project Verifications
     def verify_project_name(self) -> bool:
@@ -348,7 +778,7 @@ class Workflow:
         logging.info("Verifying Source Url!")
         # TODO: replace with urllib implementation ???
         current_url = Crawler(loc_=self._project.src_url, scheme_=self._project.scheme)
-        current_url.fetch()
+        current_url.fetch(backend_=self.fetch_backend)
         return current_url.status_code < 399  # non error status codes
 
     def verify_output(self) -> bool:
@@ -358,18 +788,18 @@ class Workflow:
     def verify_wp_user(self) -> bool:
         logging.info("Verifying WordPress User Name!")
 
-        response = requests.get(
+        response = self.fetch_backend.get(
             self._project.redirects_api_url,
-            headers={"Authorization": "Basic " + self._project.wp_auth_token},
+            headers_={"Authorization": "Basic " + self._project.wp_auth_token},
         )
         return response.status_code < 399
 
     def verify_sitemap(self) -> bool:
         logging.info("Verifying Sitemap!")
 
-        response = requests.get(
+        response = self.fetch_backend.get(
             self._project.sitemap_url,
-            headers={"Authorization": "Basic " + self._project.wp_auth_token},
+            headers_={"Authorization": "Basic " + self._project.wp_auth_token},
         )
         return response.status_code < 399
 
@@ -382,9 +812,9 @@ class Workflow:
     def verify_simply_static(self):
         logging.info("Verifying simply static plugin!")
 
-        response = requests.get(
+        response = self.fetch_backend.get(
             self._project.src_url + CONFIGS["SIMPLYSTATIC"]["API"],
-            headers={"Authorization": "Basic " + self._project.wp_auth_token},
+            headers_={"Authorization": "Basic " + self._project.wp_auth_token},
         )
 
         ss_found = response.status_code < 399
@@ -405,10 +835,35 @@ class Workflow:
         if self._keep_running:
             self._github.initialize()
 
+    @record_stage("commit")
     def commit_git_repositoy(self) -> None:
         if self._keep_running:
-            self._github.commit()
+            self._github.commit(changed_paths_=self._changed_paths)
+            self._changed_paths = None
 
-    def publish_github_repositoy(self) -> None:
+    @record_stage("publish")
+    def publish_github_repositoy(self, progress_callback_=None) -> None:
         if self._keep_running:
-            self._github.publish()
+            self._github.publish(progress_callback_=progress_callback_)
+
+    # Deploy Actions
+    @record_stage("deploy")
+    def deploy_to_host(self, progress_callback_=None) -> None:
+        """Upload changed files directly to the host, bypassing git"""
+        if self._keep_running and self._project.has_deploy():
+            backend = get_deploy_backend(self._project.host)
+            if backend is None:
+                logging.error(
+                    f"Direct Deploy is not Supported for {self._project.host.value}"
+                )
+                return
+
+            try:
+                backend(
+                    token_=self._project.deploy_token, site_=self._project.deploy_site
+                ).deploy(
+                    output_dir_=self._project.output,
+                    progress_callback_=progress_callback_,
+                )
+            except (DeployFailed, requests.exceptions.RequestException) as e:
+                logging.error(f"Deploy Failed: {e}")
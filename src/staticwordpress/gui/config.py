@@ -249,7 +249,7 @@ class SWConfigDialog(QDialog):
         self.combobox_redirects_plugin = QComboBox()
         self.combobox_redirects_plugin.setFixedWidth(120)
         self.combobox_redirects_plugin.addItems(
-            [item.value for item in list(REDIRECTS)]
+            [item.value for item in list(REDIRECTS) if item != REDIRECTS.CRAWL]
         )
         vbox_layout_redirects_plugins.addWidget(self.combobox_redirects_plugin)
         vbox_layout_redirects_plugins.addStretch()
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    src/staticwordpress/gui/executor.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+_THREAD_POOL = None
+_THREAD_POOL_LOCK = threading.Lock()
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """Worker threads shared by all task executors of the application,
+    created on first use and kept until the application exits."""
+    global _THREAD_POOL
+    with _THREAD_POOL_LOCK:
+        if _THREAD_POOL is None:
+            _THREAD_POOL = ThreadPoolExecutor(
+                max_workers=CONFIGS["GUI"]["EXECUTOR"]["WORKERS"],
+                thread_name_prefix="staticwordpress",
+            )
+        return _THREAD_POOL
+
+
+class CancelToken:
+    """Cancellation request for a task. Queued tasks are skipped, running
+    tasks are asked to stop through the registered callbacks. Tokens of
+    tasks which must not be skipped ignore cancel()."""
+
+    def __init__(self, cancellable_: bool = True) -> None:
+        self._event = threading.Event()
+        self._callbacks = []
+        self._cancellable = cancellable_
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def is_cancellable(self) -> bool:
+        return self._cancellable
+
+    def add_callback(self, callback_) -> None:
+        self._callbacks.append(callback_)
+
+    def cancel(self) -> None:
+        if self._cancellable and not self._event.is_set():
+            self._event.set()
+            for callback in self._callbacks:
+                callback()
+
+
+class SWTaskExecutor(QObject):
+    """Job queue running tasks one after another on the shared worker pool.
+
+    Tasks of one executor usually work on the same Workflow, so they never
+    run concurrently. Progress is reported by the tasks themselves through
+    their own signals, the executor reports start, end and failure.
+    """
+
+    emit_task_started = pyqtSignal(str)
+    emit_task_finished = pyqtSignal(str)
+    emit_task_failed = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._jobs = deque()
+        self._current = None
+
+    @property
+    def is_busy(self) -> bool:
+        with self._lock:
+            return self._current is not None or bool(self._jobs)
+
+    def submit(
+        self, name_: str, task_, on_cancel_=None, cancellable_: bool = True
+    ) -> CancelToken:
+        """Queue a task
+
+        Args:
+            name_ (str): Name shown in logs and signals
+            task_ (callable): Function without arguments
+            on_cancel_ (callable, optional): Called if the task is cancelled while running.
+            cancellable_ (bool, optional): False for tasks which keep state consistent,
+            e.g. loading a project, they run even if the queue is cancelled.
+
+        Returns:
+            CancelToken: Token to cancel this task
+        """
+        token = CancelToken(cancellable_=cancellable_)
+        with self._lock:
+            self._jobs.append((name_, task_, token, on_cancel_))
+            is_idle = self._current is None
+        if is_idle:
+            self._start_next()
+        return token
+
+    def cancel(self) -> None:
+        """Cancel the running task and all queued tasks which are cancellable"""
+        with self._lock:
+            jobs = list(self._jobs)
+            self._jobs = deque(job for job in jobs if not job[2].is_cancellable)
+            current = self._current
+        for _, _, token, _ in jobs:
+            token.cancel()
+        if current:
+            current.cancel()
+
+    def _start_next(self) -> None:
+        with self._lock:
+            if self._current is not None:
+                return
+            while self._jobs:
+                name, task, token, on_cancel = self._jobs.popleft()
+                if not token.is_cancelled:
+                    if on_cancel:
+                        token.add_callback(on_cancel)
+                    self._current = token
+                    break
+            else:
+                return
+        get_thread_pool().submit(self._run, name, task, token)
+
+    def _run(self, name_: str, task_, token_: CancelToken) -> None:
+        try:
+            self._emit("emit_task_started", name_)
+            task_()
+        except Exception as e:
+            logging.exception(f"Task Failed: {name_}")
+            self._emit("emit_task_failed", name_, str(e))
+        finally:
+            with self._lock:
+                self._current = None
+            self._emit("emit_task_finished", name_)
+            self._start_next()
+
+    def _emit(self, signal_: str, *args) -> None:
+        try:
+            getattr(self, signal_).emit(*args)
+        except RuntimeError:
+            pass  # executor deleted while the application is closing
@@ -27,14 +27,24 @@ specific language governing rights and limitations under the License.
 # STANDARD LIBARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+import os
 import logging
+import tempfile
+from pathlib import Path
+from collections import Counter, deque
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # 3rd PARTY LIBRARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from PyQt5.QtWidgets import QPlainTextEdit
-from PyQt5.QtCore import QObject, QSize, pyqtSignal
+from PyQt5.QtCore import QObject, QSize, QTimer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -47,17 +57,153 @@ class SWPlainTextEdit(QPlainTextEdit):
 
 
 class SWLoggerWidget(logging.Handler, QObject):
-    append_text_message = pyqtSignal(str)
-
-    def __init__(self, parent):
+    """Log handler showing records in a text widget.
+
+    emit() only queues the record, so logging never waits for the GUI. A
+    timer formats queued records every GUI.LOGGER.FLUSH_INTERVAL ms and shows
+    them with a single appendPlainText. The widget keeps the last
+    GUI.LOGGER.MAX_LINES lines. If more than GUI.LOGGER.SUMMARY_THRESHOLD
+    records arrive within one interval, only warnings, errors and the latest
+    GUI.LOGGER.SUMMARY_LINES records are shown together with a count of the
+    skipped ones.
+
+    Lines which are skipped or evicted from the widget are written to the
+    spill file in their original order, the remaining lines follow on close.
+    The spill file is rotated to <name>.1 at GUI.LOGGER.SPILL_MAX_BYTES.
+    """
+
+    def __init__(self, parent, spill_path_: Path = None):
         super().__init__()
         QObject.__init__(self)
+        settings = CONFIGS["GUI"]["LOGGER"]
+        self._records = deque(maxlen=settings["MAX_PENDING"])
+        self._received = 0
+        self._flushed = 0
+        self._spill_path = Path(
+            spill_path_ or Path(tempfile.gettempdir()) / settings["SPILL_FILE"]
+        )
+        self._spill_file = None
+        # (line, blocks in the widget), summaries are shown but not spilled (None)
+        self._unspilled = deque()
+        self._shown_blocks = 0
+
         self.plaintext_edit = SWPlainTextEdit(parent)
         self.plaintext_edit.setReadOnly(True)
-        self.append_text_message.connect(self.plaintext_edit.appendPlainText)
+        self.plaintext_edit.setMaximumBlockCount(settings["MAX_LINES"])
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(settings["FLUSH_INTERVAL"])
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    @property
+    def spill_path(self) -> Path:
+        return self._spill_path
+
+    def emit(self, record):
+        # called with the handler lock held, formatting is done by flush()
+        self._received += 1
+        self._records.append(record)
+
+    def flush(self):
+        """Show queued records, called by the timer in the GUI thread"""
+        with self.lock:
+            records = list(self._records)
+            self._records.clear()
+            dropped = self._received - self._flushed - len(records)
+            self._flushed = self._received
+        if not records:
+            return
+
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+                lines.append(str(record.msg))
+
+        settings = CONFIGS["GUI"]["LOGGER"]
+        shown = [True] * len(records)
+        kept = []  # (line to spill or None, line shown in the widget or None)
+        if len(records) + dropped > settings["SUMMARY_THRESHOLD"]:
+            latest = len(records) - settings["SUMMARY_LINES"]
+            shown = [
+                index >= latest or record.levelno >= logging.WARNING
+                for index, record in enumerate(records)
+            ]
+            skipped = Counter(
+                record.levelname
+                for record, is_shown in zip(records, shown)
+                if not is_shown
+            )
+            summary = ", ".join(f"{count} {level}" for level, count in skipped.items())
+            if dropped:
+                summary += f"{', ' if summary else ''}{dropped} DROPPED"
+            kept.append(
+                (None, f"... {summary} records not shown, see {self._spill_path}")
+            )
+        kept += [
+            (line, line if is_shown else None) for line, is_shown in zip(lines, shown)
+        ]
+
+        for line, shown_line in kept:
+            blocks = 0 if shown_line is None else shown_line.count("\n") + 1
+            self._unspilled.append((line, blocks))
+            self._shown_blocks += blocks
+        self._evict()
 
-    def emit(self, msg):
         try:
-            self.append_text_message.emit(self.format(msg))
-        except:
-            pass  # TODO: raise exception if append_text_message is not available
+            self.plaintext_edit.appendPlainText(
+                "\n".join(
+                    shown_line for _, shown_line in kept if shown_line is not None
+                )
+            )
+        except RuntimeError:
+            pass  # widget already deleted, e.g. flush by logging.shutdown
+
+    def _evict(self, all_: bool = False) -> None:
+        """Spill lines in order until the widget holds all remaining lines"""
+        settings = CONFIGS["GUI"]["LOGGER"]
+        lines = []
+        while self._unspilled and (
+            all_
+            or self._unspilled[0][1] == 0
+            or self._shown_blocks > settings["MAX_LINES"]
+            or len(self._unspilled) > settings["MAX_PENDING"]
+        ):
+            line, blocks = self._unspilled.popleft()
+            self._shown_blocks -= blocks
+            if line is not None:
+                lines.append(line)
+        if lines:
+            self._spill(lines)
+
+    def _spill(self, lines_: list) -> None:
+        try:
+            if self._spill_file is None:
+                self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill_file = open(self._spill_path, "a", encoding="utf-8")
+            self._spill_file.write("\n".join(lines_) + "\n")
+            self._spill_file.flush()
+            if self._spill_file.tell() >= CONFIGS["GUI"]["LOGGER"]["SPILL_MAX_BYTES"]:
+                self._spill_file.close()
+                self._spill_file = None
+                os.replace(
+                    self._spill_path,
+                    self._spill_path.with_name(f"{self._spill_path.name}.1"),
+                )
+        except OSError:
+            pass  # the log file is best effort, the widget keeps working
+
+    def close(self):
+        try:
+            self._timer.stop()
+            self.flush()
+        except RuntimeError:
+            pass  # Qt objects already deleted, e.g. close by logging.shutdown
+        self._evict(all_=True)
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+        super().close()
@@ -54,7 +54,7 @@ from PyQt5.QtWidgets import (
     QMessageBox,
 )
 from PyQt5.QtGui import QIcon, QDesktopServices
-from PyQt5.QtCore import Qt, QThread, QSize, QSettings, QUrl, QSortFilterProxyModel
+from PyQt5.QtCore import Qt, QSize, QSettings, QUrl
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
@@ -67,14 +67,15 @@ from ..core.constants import (
     SOURCE,
 )
 from ..core.project import Project
+from ..core.workflow import Workflow
 from ..core.utils import (
     rm_dir_tree,
     get_remote_content,
     extract_urls_from_raw_text,
 )
 from ..gui.workflow import SWWorkflowObject
+from ..gui.executor import SWTaskExecutor
 from ..gui.logger import SWLoggerWidget
-from ..gui.editor import SWIPythonWidget
 from ..gui.rawtext import SWRawTextDialog
 from ..gui.config import SWConfigDialog
 from ..gui.project import SWProjectDialog
@@ -95,8 +96,15 @@ class SWMainWindow(QMainWindow):
         )
 
         self._project = Project()
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
+        self._bg_worker = SWWorkflowObject(parent=self)
+        self._bg_worker.emit_progress.connect(self.update_statusbar)
+        self._bg_worker.emit_tabulate_crawl_data.connect(self.update_table)
+        self._bg_executor = SWTaskExecutor(parent=self)
+        self._bg_executor.emit_task_failed.connect(
+            lambda name_, error_: self.statusBar().showMessage(
+                f"{name_} Failed: {error_}"
+            )
+        )
 
         # docked widgets
         self.dockwidget_ipython = QDockWidget("IPython Console", self)
@@ -175,7 +183,7 @@ class SWMainWindow(QMainWindow):
         self.tableview_crawl_data = QTableView()
         self.tableview_crawl_data.clicked.connect(
             lambda val: self.statusBar().showMessage(
-                f"Total Urls Crawled: {self.model_crawl_data.rowCount()}"
+                f"Total Urls Crawled: {self.model_crawl_data.size}"
             )
         )
         self.model_crawl_data = SWDataTable(
@@ -203,12 +211,12 @@ class SWMainWindow(QMainWindow):
             QSizePolicy.Expanding, QSizePolicy.Minimum
         )
         self.tableview_crawl_data.horizontalHeader().setDefaultAlignment(Qt.AlignLeft)
-
-        self.proxy_model_crawl_data = QSortFilterProxyModel(self.model_crawl_data)
-        self.proxy_model_crawl_data.setFilterKeyColumn(0)
-        self.proxy_model_crawl_data.setSourceModel(self.model_crawl_data)
-        self.tableview_crawl_data.setModel(self.proxy_model_crawl_data)
+        self.tableview_crawl_data.verticalHeader().setSectionResizeMode(
+            QHeaderView.Fixed
+        )
         self.tableview_crawl_data.setSortingEnabled(True)
+        self.tableview_crawl_data.sortByColumn(-1, Qt.AscendingOrder)
+        self.model_crawl_data.rowsFlushed.connect(self.scroll_table)
 
         self.setCentralWidget(self.tableview_crawl_data)
 
@@ -313,10 +321,8 @@ class SWMainWindow(QMainWindow):
         message_box.exec()
 
         if message_box.clickedButton() == message_box.pushbutton_ok:
-            if self._bg_thread.isRunning():
-                self._bg_thread.quit()
-                del self._bg_thread
-                del self._bg_worker
+            if self._bg_executor.is_busy:
+                self._bg_executor.cancel()
                 super(SWMainWindow, self).closeEvent(event)
 
             event.accept()
@@ -372,6 +378,9 @@ class SWMainWindow(QMainWindow):
         """ """
         if self.findChild(QAction, "action_start_ipython_console").isChecked():
             if self.ipython_console is None:
+                # qtconsole/IPython take longer to import than the rest of the GUI
+                from ..gui.editor import SWIPythonWidget
+
                 self.ipython_console = SWIPythonWidget(
                     interface_={
                         "self": self,  # TODO: Remove
@@ -401,6 +410,7 @@ class SWMainWindow(QMainWindow):
             "create_robots_txt": self.create_robots_txt,
             "create_search_index": self.create_search_index,
             "delete_github_repository": self.delete_github_repository,
+            "deploy_website": self.deploy_website,
             "extract_url_from_raw_text": self.extract_url_from_raw_text,
             "help": self.help,
             "initialize_repository": self.initialize_repository,
@@ -465,6 +475,7 @@ class SWMainWindow(QMainWindow):
             self.update_widgets()
             logging.info("Saved/Update Project")
             self._project.save()
+            self.update_worker_project()
 
     @logging_decorator
     def open_project(self):
@@ -502,6 +513,7 @@ class SWMainWindow(QMainWindow):
                             f"Your Project was saved with an older version : {self._project.version}."
                         )
 
+                    self.update_worker_project()
                     logging.info(f"Open Project {self._project.path} Successfully")
                     self.app_configurations.setValue("last-project", project_folder)
             else:
@@ -529,6 +541,7 @@ class SWMainWindow(QMainWindow):
             )
             if project_dialog.exec_():
                 self._project = project_dialog._project
+                self.update_worker_project()
             self._project.save()
             self.update_widgets()
         else:
@@ -576,14 +589,10 @@ class SWMainWindow(QMainWindow):
             else:
                 return
         else:
-            if self._bg_thread.isRunning():
-                self._bg_thread.quit()
-
-            self._bg_worker = SWWorkflowObject()
-            self._bg_worker.set_project(project_=self._project)
-
             if self._project.src_type == SOURCE.ZIP:
-                if not self._bg_worker._work_flow.verify_simply_static():
+                workflow = Workflow()
+                workflow.set_project(project_=self._project)
+                if not workflow.verify_simply_static():
                     message_box = SWMessageBox(
                         parent=self,
                         title_="ZIP File Missing",
@@ -593,18 +602,37 @@ class SWMainWindow(QMainWindow):
                     if message_box.clickedButton() == message_box.pushbutton_ok:
                         return
 
-            self._bg_thread = QThread(parent=self)
-            self._bg_worker.moveToThread(self._bg_thread)
-            self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-            self._bg_worker.emit_progress.connect(self.update_statusbar)
-            self._bg_worker.emit_tabulate_crawl_data.connect(self.update_table)
-            self._bg_thread.started.connect(self._bg_worker.batch_processing)
-            self._bg_thread.start()
-            self.statusBar().showMessage("Batch Processing in Progress")
+            self.run_in_background(
+                self._bg_worker.batch_processing, "Batch Processing in Progress"
+            )
+
+    def run_in_background(self, task_, message_: str) -> None:
+        """Queue task_ of the background worker for the current project, tasks
+        run one after another on the shared worker threads."""
+
+        def run():
+            self._bg_worker.start_calculations()
+            task_()
+
+        self._bg_executor.submit(
+            message_, run, on_cancel_=self._bg_worker.stop_calcualations
+        )
+        self.statusBar().showMessage(message_)
+
+    def update_worker_project(self) -> None:
+        """Pass the current project to the background worker once it is opened
+        or its settings changed. Queued behind running tasks, the workflow
+        connects to GitHub again only here."""
+        project = self._project
+        self._bg_executor.submit(
+            "Loading Project",
+            lambda: self._bg_worker.set_project(project_=project),
+            cancellable_=False,
+        )
 
     @is_project_open
     def stop_process(self) -> None:
-        if self._bg_worker.is_running():
+        if self._bg_executor.is_busy:
             message_box = SWMessageBox(
                 parent=self,
                 title_="Stop Crawling Process",
@@ -613,116 +641,45 @@ class SWMainWindow(QMainWindow):
             message_box.exec()
 
             if message_box.clickedButton() == message_box.pushbutton_ok:
-                self._bg_worker.stop_calcualations()
+                self._bg_executor.cancel()
                 self.statusBar().showMessage("Stoping Processing", 100)
 
     @is_project_open
     def crawl_webpages(self) -> None:
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_worker.emit_tabulate_crawl_data.connect(self.update_table)
-        self._bg_thread.started.connect(self._bg_worker.batch_processing)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Crawling WebPages in Progress")
+        self.run_in_background(
+            self._bg_worker.batch_processing, "Crawling WebPages in Progress"
+        )
 
     @is_project_open
     def crawl_additional_files(self) -> None:
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_worker.emit_tabulate_crawl_data.connect(self.update_table)
-        self._bg_thread.started.connect(self._bg_worker.crawl_additional_files)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Crwaling Additional Progress")
+        self.run_in_background(
+            self._bg_worker.crawl_additional_files, "Crwaling Additional Progress"
+        )
 
     @is_project_open
     def create_search_index(self) -> None:
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.add_search)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Creating Search Index")
+        self.run_in_background(self._bg_worker.add_search, "Creating Search Index")
 
     @is_project_open
     def create_404_page(self) -> None:
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.add_404_page)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Creating 404 Page")
+        self.run_in_background(self._bg_worker.add_404_page, "Creating 404 Page")
 
     @is_project_open
     def create_redirects(self) -> None:
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.add_redirects)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Creating Redirects")
+        self.run_in_background(self._bg_worker.add_redirects, "Creating Redirects")
 
     @is_project_open
     def create_robots_txt(self) -> None:
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.add_robots_txt)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Creating Robots.txt File")
+        self.run_in_background(
+            self._bg_worker.add_robots_txt, "Creating Robots.txt File"
+        )
 
     @is_project_open
     def create_github_repositoy(self) -> None:
         """"""
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.create_github_repositoy)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Creating GitHub Repository")
+        self.run_in_background(
+            self._bg_worker.create_github_repositoy, "Creating GitHub Repository"
+        )
 
     @is_project_open
     def delete_github_repository(self) -> None:
@@ -735,72 +692,44 @@ class SWMainWindow(QMainWindow):
         message_box.exec()
 
         if message_box.clickedButton() == message_box.pushbutton_ok:
-            if self._bg_thread.isRunning():
-                self._bg_thread.quit()
-
-            self._bg_worker = SWWorkflowObject()
-            self._bg_worker.set_project(project_=self._project)
-            self._bg_worker.set_project(project_=self._project)
-            self._bg_worker.moveToThread(self._bg_thread)
-            self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-            self._bg_worker.emit_progress.connect(self.update_statusbar)
-            self._bg_thread.started.connect(self._bg_worker.delete_github_repositoy)
-            self._bg_thread.start()
-            self.statusBar().showMessage("Deleting GitHub Repository")
+            self.run_in_background(
+                self._bg_worker.delete_github_repositoy, "Deleting GitHub Repository"
+            )
 
     @is_project_open
     def initialize_repository(self) -> None:
         """"""
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.init_git_repositoy)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Intializing Git Repository")
+        self.run_in_background(
+            self._bg_worker.init_git_repositoy, "Intializing Git Repository"
+        )
 
     @is_project_open
     def commit_repository(self) -> None:
         """"""
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.commit_git_repositoy)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Updating Git Repository")
+        self.run_in_background(
+            self._bg_worker.commit_git_repositoy, "Updating Git Repository"
+        )
 
     @is_project_open
     def publish_repository(self) -> None:
         """ """
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_worker.emit_progress.connect(self.update_statusbar)
-        self._bg_thread.started.connect(self._bg_worker.publish_github_repositoy)
-        self._bg_thread.start()
-        self.statusBar().showMessage("Publishing GitHub Repository")
+        self.run_in_background(
+            self._bg_worker.publish_github_repositoy, "Publishing GitHub Repository"
+        )
+
+    @is_project_open
+    def deploy_website(self) -> None:
+        """Upload changed files directly to the host"""
+        if not self._project.has_deploy():
+            logging.warning("Deploy Site and Token are Missing in Project Settings")
+            return
+
+        self.run_in_background(self._bg_worker.deploy_to_host, "Deploying Website")
 
     def update_table(self, table_row_):
-        self.model_crawl_data.insertRow(
-            data=table_row_, row=self.model_crawl_data.rowCount()
-        )
+        self.model_crawl_data.appendRow(table_row_)
 
+    def scroll_table(self, rows_count_: int) -> None:
         tableview_crawl_data_scrollbar = self.tableview_crawl_data.verticalScrollBar()
         tableview_crawl_data_scrollbar.setSliderPosition(
             tableview_crawl_data_scrollbar.maximum() + 1
@@ -50,12 +50,13 @@ from PyQt5.QtWidgets import (
     QButtonGroup,
     QRadioButton,
     QDoubleSpinBox,
+    QSpinBox,
     QMessageBox,
     QFileDialog,
     QPushButton,
     QProgressBar,
 )
-from PyQt5.QtCore import Qt, QSettings, QSize, QThread
+from PyQt5.QtCore import Qt, QSettings, QSize
 from PyQt5.QtGui import QIcon
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -65,6 +66,7 @@ from PyQt5.QtGui import QIcon
 from ..core.constants import (
     REDIRECTS,
     USER_AGENT,
+    FETCH,
     SOURCE,
     HOST,
     CONFIGS,
@@ -74,6 +76,7 @@ from ..core.constants import (
 from ..core.project import Project
 from ..core.utils import is_url_valid
 from ..gui.workflow import SWWorkflowObject
+from ..gui.executor import SWTaskExecutor
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -88,8 +91,10 @@ class SWProjectDialog(QDialog):
         )
 
         self._project = project_
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
+        self._bg_worker = SWWorkflowObject(parent=self)
+        self._bg_worker.emit_progress.connect(self.update_sitemap_progress)
+        self._bg_worker.emit_sitemap_location.connect(self.update_sitemap_location)
+        self._bg_executor = SWTaskExecutor(parent=self)
 
         vertical_layout_project = QVBoxLayout()
         groupbox_general_settings = QGroupBox("General Settings")
@@ -138,6 +143,14 @@ class SWProjectDialog(QDialog):
         horizontal_layout_crawl_delay_user_agent.addWidget(QLabel("User Agent"))
         horizontal_layout_crawl_delay_user_agent.addWidget(self.combobox_user_agent)
 
+        self.combobox_fetch_backend = QComboBox()
+        self.combobox_fetch_backend.setObjectName("fetch-backend")
+        self.combobox_fetch_backend.setMinimumWidth(120)
+        self.combobox_fetch_backend.addItems([item.value for item in list(FETCH)])
+        self.combobox_fetch_backend.setCurrentText(self._project.fetch_backend.value)
+        horizontal_layout_crawl_delay_user_agent.addWidget(QLabel("Fetch"))
+        horizontal_layout_crawl_delay_user_agent.addWidget(self.combobox_fetch_backend)
+
         form_layout_general_settings.addRow(
             QLabel("Crawl Delay(sec)"), horizontal_layout_crawl_delay_user_agent
         )
@@ -187,7 +200,9 @@ class SWProjectDialog(QDialog):
         self.combobox_redirects = QComboBox()
         self.combobox_redirects.setObjectName("redirects")
         self.combobox_redirects.setMinimumWidth(120)
-        self.combobox_redirects.addItems([item.value for item in list(REDIRECTS)])
+        self.combobox_redirects.addItems(
+            [item.value for item in list(REDIRECTS) if item != REDIRECTS.CRAWL]
+        )
         self.combobox_redirects.setCurrentText(self._project.redirects.value)
 
         horizontal_layout_project_redirects.addWidget(self.combobox_redirects)
@@ -250,6 +265,11 @@ class SWProjectDialog(QDialog):
         self.textedit_exclude_patterns = QTextEdit()
         self.textedit_exclude_patterns.setText("\n".join(self._project.exclude))
         self.textedit_exclude_patterns.setObjectName("exclude")
+        self.textedit_include_patterns = QTextEdit()
+        self.textedit_include_patterns.setText(
+            "\n".join(self._project.scope["include"])
+        )
+        self.textedit_include_patterns.setObjectName("include")
 
         widget_project_api_tab = QWidget()
         vertical_layout_project_api = QVBoxLayout()
@@ -302,9 +322,53 @@ class SWProjectDialog(QDialog):
         horizontal_layout_gh_token.addWidget(toolbutton_show_gh_token)
         form_layout_gh_api.addRow(QLabel("API Token"), horizontal_layout_gh_token)
 
+        self.spinbox_gh_lfs_threshold = QSpinBox()
+        self.spinbox_gh_lfs_threshold.setObjectName("github-lfs-threshold")
+        self.spinbox_gh_lfs_threshold.setMinimum(0)
+        self.spinbox_gh_lfs_threshold.setMaximum(2048)
+        self.spinbox_gh_lfs_threshold.setSuffix(" MB")
+        self.spinbox_gh_lfs_threshold.setSpecialValueText("Disabled")
+        self.spinbox_gh_lfs_threshold.setToolTip(
+            "Publish images, pdfs and media files of at least this size through Git LFS"
+        )
+        self.spinbox_gh_lfs_threshold.setValue(
+            self._project.gh_lfs_threshold // (1 << 20)
+        )
+        form_layout_gh_api.addRow(
+            QLabel("LFS Threshold"), self.spinbox_gh_lfs_threshold
+        )
+
         groupbox_gh_api.setLayout(form_layout_gh_api)
+
+        groupbox_deploy_api = QGroupBox("Direct Deploy")
+        form_layout_deploy_api = QFormLayout()
+
+        self.lineedit_deploy_site = QLineEdit(self._project.deploy_site)
+        self.lineedit_deploy_site.setObjectName("deploy-site")
+        form_layout_deploy_api.addRow(QLabel("Site ID"), self.lineedit_deploy_site)
+
+        self.lineedit_deploy_token = QLineEdit(self._project.deploy_token)
+        self.lineedit_deploy_token.setEchoMode(QLineEdit.Password)
+        self.lineedit_deploy_token.setObjectName("deploy-token")
+        horizontal_layout_deploy_token = QHBoxLayout()
+        horizontal_layout_deploy_token.addWidget(self.lineedit_deploy_token)
+
+        toolbutton_show_deploy_token = QToolButton()
+        toolbutton_show_deploy_token.setObjectName("toolbutton_show_deploy_token")
+        toolbutton_show_deploy_token.setIcon(
+            QIcon(f"{SHARE_FOLDER_PATH}/icons/visibility.svg")
+        )
+        toolbutton_show_deploy_token.setCheckable(True)
+        toolbutton_show_deploy_token.clicked.connect(self.change_password_visiblity)
+        horizontal_layout_deploy_token.addWidget(toolbutton_show_deploy_token)
+        form_layout_deploy_api.addRow(
+            QLabel("API Token"), horizontal_layout_deploy_token
+        )
+        groupbox_deploy_api.setLayout(form_layout_deploy_api)
+
         vertical_layout_project_api.addWidget(groupbox_wp_api)
         vertical_layout_project_api.addWidget(groupbox_gh_api)
+        vertical_layout_project_api.addWidget(groupbox_deploy_api)
 
         widget_project_api_tab.setLayout(vertical_layout_project_api)
 
@@ -315,6 +379,9 @@ class SWProjectDialog(QDialog):
         self.tabwidget_dialog.addTab(
             self.textedit_exclude_patterns, "Exclude &Patterns"
         )
+        self.tabwidget_dialog.addTab(
+            self.textedit_include_patterns, "&Include Patterns"
+        )
 
         vertical_layout_project.addWidget(groupbox_general_settings)
         vertical_layout_project.addWidget(self.tabwidget_dialog)
@@ -362,6 +429,8 @@ class SWProjectDialog(QDialog):
                 self.lineedit_gh_token.setEchoMode(QLineEdit.Password)
             elif self.sender().objectName() == "toolbutton_show_wp_api_token":
                 self.lineedit_wp_api_token.setEchoMode(QLineEdit.Password)
+            elif self.sender().objectName() == "toolbutton_show_deploy_token":
+                self.lineedit_deploy_token.setEchoMode(QLineEdit.Password)
 
         else:
             self.sender().setIcon(
@@ -372,6 +441,8 @@ class SWProjectDialog(QDialog):
                 self.lineedit_gh_token.setEchoMode(QLineEdit.Normal)
             elif self.sender().objectName() == "toolbutton_show_wp_api_token":
                 self.lineedit_wp_api_token.setEchoMode(QLineEdit.Normal)
+            elif self.sender().objectName() == "toolbutton_show_deploy_token":
+                self.lineedit_deploy_token.setEchoMode(QLineEdit.Normal)
 
     def update_widgets(self):
         if self.sender().objectName() == "radio-static-website":
@@ -395,18 +466,13 @@ class SWProjectDialog(QDialog):
             self.appConfigurations.setValue("last-project", output_directory)
 
     def get_sitemap_location(self):
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-
-        self._bg_thread = QThread(parent=self)
-        self._bg_worker = SWWorkflowObject()
-        self._bg_worker.set_project(project_=self._project)
-        self._bg_worker.moveToThread(self._bg_thread)
-        self._bg_thread.finished.connect(self._bg_worker.deleteLater)
-        self._bg_thread.started.connect(self._bg_worker.find_sitemap)
-        self._bg_worker.emit_progress.connect(self.update_sitemap_progress)
-        self._bg_worker.emit_sitemap_location.connect(self.update_sitemap_location)
-        self._bg_thread.start()
+        project = self._project
+
+        def find_sitemap():
+            self._bg_worker.set_project(project_=project)
+            self._bg_worker.find_sitemap()
+
+        self._bg_executor.submit("Finding Sitemap", find_sitemap)
         self.progressbar.show()
 
     def update_sitemap_location(self, sitemap_location_: str = "/sitemap.xml"):
@@ -457,20 +523,14 @@ class SWProjectDialog(QDialog):
         self.progressbar.setValue(100)
 
     def reject(self) -> None:
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-            del self._bg_thread
-            del self._bg_worker
+        self._bg_executor.cancel()
 
         return super().reject()
 
     def accept(self) -> None:
         """"""
 
-        if self._bg_thread.isRunning():
-            self._bg_thread.quit()
-            del self._bg_thread
-            del self._bg_worker
+        self._bg_executor.cancel()
 
         if all(
             [
@@ -504,16 +564,27 @@ class SWProjectDialog(QDialog):
             self._project.user_agent = USER_AGENT[
                 self.combobox_user_agent.currentText()
             ]
+            self._project.fetch_backend = FETCH(
+                self.combobox_fetch_backend.currentText()
+            )
             self._project.host = HOST[self.combobox_project_destination.currentText()]
             self._project.dst_url = self.lineedit_dest_url.text()
             self._project.gh_token = self.lineedit_gh_token.text()
             self._project.gh_repo = self.lineedit_gh_repo.text()
+            self._project.deploy_site = self.lineedit_deploy_site.text()
+            self._project.deploy_token = self.lineedit_deploy_token.text()
+            self._project.gh_lfs_threshold = self.spinbox_gh_lfs_threshold.value() * (
+                1 << 20
+            )
             self._project.additional = (
                 self.textedit_additional_urls.toPlainText().split("\n")
             )
             self._project.exclude = self.textedit_exclude_patterns.toPlainText().split(
                 "\n"
             )
+            self._project.scope = {
+                "include": self.textedit_include_patterns.toPlainText().split("\n")
+            }
 
             # Create _data folder
             import os
@@ -24,6 +24,12 @@ specific language governing rights and limitations under the License.
 """
 
 
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import sys
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # 3rd PARTY LIBRARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -34,8 +40,15 @@ from PyQt5.QtCore import (
     QModelIndex,
     QVariant,
     QSortFilterProxyModel,
+    QTimer,
+    pyqtSignal,
 )
 
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from ..core.constants import CONFIGS
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -43,10 +56,34 @@ from PyQt5.QtCore import (
 
 
 class SWDataTable(QAbstractTableModel):
+    """Append-only table model for the crawl results.
+
+    Rows are kept column wise (repeated strings are interned) and appended in
+    batches: appendRow() only buffers the row, a timer inserts all buffered
+    rows every GUI.TABLE.FLUSH_INTERVAL ms with a single beginInsertRows.
+    Sorting and filtering keep a list of row numbers instead of copying rows,
+    new rows are merged into a sorted view once per batch.
+    Rows must be appended from the GUI thread (e.g. through a signal).
+    """
+
+    ValueRole = Qt.UserRole + 1  # unformatted cell value, used for sorting
+    rowsFlushed = pyqtSignal(int)
+
     def __init__(self, data_: list = [], header_: list = []):
         super(SWDataTable, self).__init__()
-        self._data = data_
         self._header = header_
+        self._columns = [[] for _ in header_]
+        self._pending = []
+        self._view = None  # row numbers in view order, None shows all rows
+        self._sort_column, self._sort_order = None, Qt.AscendingOrder
+        self._filter, self._filter_column = "", None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(CONFIGS["GUI"]["TABLE"]["FLUSH_INTERVAL"])
+        self._timer.timeout.connect(self.flush)
+
+        self.extend(data_)
 
     def headerData(self, section, orientation, role):
         if role == Qt.DisplayRole:
@@ -56,27 +93,158 @@ class SWDataTable(QAbstractTableModel):
         return QVariant()
 
     def data(self, index, role):
-        if role == Qt.DisplayRole:
-            value = self._data[index.row()][index.column()]
-            return str(value)
+        if role in [Qt.DisplayRole, SWDataTable.ValueRole]:
+            row = index.row() if self._view is None else self._view[index.row()]
+            value = self._columns[index.column()][row]
+            return str(value) if role == Qt.DisplayRole else value
 
     def rowCount(self, index=QModelIndex()):
-        return len(self._data)
+        return len(self._columns[0]) if self._view is None else len(self._view)
 
     def columnCount(self, index=QModelIndex()):
         return len(self._header)
 
+    @property
+    def size(self) -> int:
+        """Number of stored rows, including filtered ones"""
+        return len(self._columns[0]) if self._columns else 0
+
+    def appendRow(self, data_: list) -> None:
+        """Buffer a row, it is shown with the next batch"""
+        self._pending.append(data_)
+        if not self._timer.isActive():
+            self._timer.start()
+
     def insertRow(self, data, row=0, index=QModelIndex()):
-        self.beginInsertRows(QModelIndex(), row, row)
-        self._data.insert(0, data)
-        self.endInsertRows()
+        # rows are always appended, kept for compatibility
+        self.appendRow(data)
         return True
 
+    def flush(self) -> None:
+        """Insert all buffered rows"""
+        self._timer.stop()
+        rows, self._pending = self._pending, []
+        if rows:
+            self.extend(rows)
+            self.rowsFlushed.emit(len(rows))
+
+    def extend(self, rows_: list) -> None:
+        """Append rows, a sorted or filtered view gets the matching rows
+        merged in at their sorted positions instead of a model reset."""
+        if not rows_:
+            return
+
+        first = self.size
+        if self._view is None:
+            self.beginInsertRows(QModelIndex(), first, first + len(rows_) - 1)
+
+        for column, values in enumerate(zip(*rows_)):
+            self._columns[column].extend(
+                sys.intern(value) if isinstance(value, str) else value
+                for value in values
+            )
+
+        if self._view is None:
+            self.endInsertRows()
+        elif self._sort_column is None:
+            matching = self._matching(range(first, self.size))
+            if matching:
+                start = len(self._view)
+                self.beginInsertRows(QModelIndex(), start, start + len(matching) - 1)
+                self._view.extend(matching)
+                self.endInsertRows()
+        else:
+            self._merge_view(self._matching(range(first, self.size)))
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows by column, a negative column restores the append order"""
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column if column >= 0 else None
+        self._sort_order = order
+        if self._filter or self._sort_column is not None:
+            self._view = self._matching(range(self.size))
+            self._sort_view()
+        else:
+            self._view = None
+        self.layoutChanged.emit()
+
+    def setFilter(self, text_: str, column_: int = None) -> None:
+        """Show only rows containing text_ (case insensitive) in column_ or
+        in any column if column_ is None. An empty text_ shows all rows."""
+        self.beginResetModel()
+        self._filter, self._filter_column = text_.lower(), column_
+        if self._filter or self._sort_column is not None:
+            self._view = self._matching(range(self.size))
+            self._sort_view()
+        else:
+            self._view = None
+        self.endResetModel()
+
     def clear(self):
         self.beginResetModel()
-        self._data = []
+        self._timer.stop()
+        self._columns = [[] for _ in self._header]
+        self._pending = []
+        self._view = None if not self._filter and self._sort_column is None else []
         self.endResetModel()
 
+    def _matching(self, rows_) -> list:
+        if not self._filter:
+            return list(rows_)
+        columns = (
+            self._columns
+            if self._filter_column is None
+            else [self._columns[self._filter_column]]
+        )
+        return [
+            row
+            for row in rows_
+            if any(self._filter in str(column[row]).lower() for column in columns)
+        ]
+
+    def _sort_key(self, row_: int) -> tuple:
+        value = self._columns[self._sort_column][row_]
+        return type(value).__name__, value
+
+    def _sort_view(self) -> None:
+        if self._sort_column is not None:
+            self._view.sort(
+                key=self._sort_key,
+                reverse=self._sort_order == Qt.DescendingOrder,
+            )
+
+    def _merge_view(self, rows_: list) -> None:
+        """Merge new rows into the sorted view in one pass, after rows with
+        equal values like a stable sort. Rows which end up next to each other
+        are a single insert, otherwise the layout changes once."""
+        if not rows_:
+            return
+
+        descending = self._sort_order == Qt.DescendingOrder
+        rows_ = sorted(rows_, key=self._sort_key, reverse=descending)
+        merged, positions, index = [], set(), 0
+        for row in rows_:
+            key = self._sort_key(row)
+            while index < len(self._view):
+                other = self._sort_key(self._view[index])
+                if (key > other) if descending else (key < other):
+                    break
+                merged.append(self._view[index])
+                index += 1
+            merged.append(row)
+            positions.add(index)
+        merged.extend(self._view[index:])
+
+        if len(positions) == 1:
+            position = positions.pop()
+            self.beginInsertRows(QModelIndex(), position, position + len(rows_) - 1)
+            self._view[position:position] = rows_
+            self.endInsertRows()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            self._view = merged
+            self.layoutChanged.emit()
+
 
 class DataframeQSortFilterProxyModel(QSortFilterProxyModel):
     def __init__(self):
@@ -24,14 +24,6 @@ specific language governing rights and limitations under the License.
 """
 
 
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-# STANDARD LIBARY IMPORTS
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-
-from time import sleep
-from random import random
-import logging
-
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # 3rd PARTY LIBRARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -43,7 +35,7 @@ from PyQt5.QtCore import QObject, pyqtSignal
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from ..core.project import Project
-from ..core.constants import SOURCE, URL
+from ..core.constants import SOURCE
 from ..core.workflow import Workflow
 from ..core.crawler import Crawler
 from ..gui.utils import logging_decorator
@@ -60,8 +52,9 @@ class SWWorkflowObject(QObject):
     emit_verification = pyqtSignal(dict)
     emit_tabulate_crawl_data = pyqtSignal(list)
 
-    _work_flow = Workflow()
-    _approximate_crawl_count = 1
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._work_flow = Workflow()
 
     @property
     def work_flow(self) -> Workflow():
@@ -86,6 +79,9 @@ class SWWorkflowObject(QObject):
         )
         self.emit_progress.emit("Verifyied Project Settings", 100)
 
+    def start_calculations(self):
+        self._work_flow.start_calculations()
+
     @logging_decorator
     def stop_calcualations(self):
         self._work_flow.stop_calculations()
@@ -93,18 +89,17 @@ class SWWorkflowObject(QObject):
     def is_running(self):
         return self._work_flow._keep_running
 
+    @logging_decorator
     def batch_processing(self):
-        self._work_flow.clear()
-        self._work_flow._keep_running = True
-        if self._work_flow._project.src_type == SOURCE.CRAWL:
-            self.crawl_sitemap()
-            self.crawl_additional_files()
-
-        self.start_crawling()
-        self.add_404_page()
-        self.add_robots_txt()
-        self.add_redirects()
-        self.add_search()
+        self._work_flow.export(
+            callback_=self.tabulate_crawl_data,
+            progress_callback_=lambda done_, total_: self.emit_progress.emit(
+                "Downloading Zip File", int(100 * done_ / total_) if total_ else 0
+            ),
+        )
+        self.emit_progress.emit(
+            "Exported Static Website", self._work_flow.progress.percent
+        )
 
     @logging_decorator
     def start_crawling(self):
@@ -118,7 +113,11 @@ class SWWorkflowObject(QObject):
 
     @logging_decorator
     def download_zip_file(self) -> None:
-        self._work_flow.download_zip_file()
+        self._work_flow.download_zip_file(
+            progress_callback_=lambda done_, total_: self.emit_progress.emit(
+                "Downloading Zip File", int(100 * done_ / total_) if total_ else 0
+            )
+        )
         self.emit_progress.emit("Downloaded Zip File", 100)
 
     def setup_zip_folders(self) -> None:
@@ -140,6 +139,11 @@ class SWWorkflowObject(QObject):
         self._work_flow.add_redirects()
         self.emit_progress.emit("Written Redirects File", 100)
 
+    @logging_decorator
+    def add_static_files(self) -> None:
+        self._work_flow.add_static_files()
+        self.emit_progress.emit("Saved 404 Page, robots.txt and Redirects", 100)
+
     @logging_decorator
     def add_search(self) -> None:
         self._work_flow.add_search()
@@ -154,46 +158,26 @@ class SWWorkflowObject(QObject):
     @logging_decorator
     def crawl_sitemap(self) -> None:
         self.emit_progress.emit("Crawling Sitemap", 50)
-        self._work_flow.crawl_sitemap()
+        self._work_flow.crawl_sitemap(callback_=self.tabulate_crawl_data)
         self.emit_progress.emit("Crawled Sitemap", 100)
 
     def crawl_url(self, loc_: str):
-        current_crawler = Crawler(loc_=loc_, scheme_=self._work_flow._project.scheme)
-        if current_crawler.hash not in self._work_flow._urls:
-            sleep(self._work_flow._project.delay + random() / 100)
-            current_crawler.fetch()
-            full_output_path = current_crawler.save(
-                self._work_flow._project.output,
-                dst_url=self._work_flow._project.dst_url,
-            )
-            self._work_flow._urls[current_crawler._hash] = current_crawler
-            custom_message = "Saved"
-            if current_crawler.status_code >= 400 or current_crawler._typ == URL.NONE:
-                custom_message = "Ignored"
-
-            logging.info(
-                f"{custom_message}: {current_crawler.status_code} {current_crawler._typ} {full_output_path}"
-            )
-
-            table_row = [
-                len(self._work_flow._urls),  # current_url.hash,
-                current_crawler.url,
-                current_crawler.path,
-                current_crawler.typ.value,
-                current_crawler.status_code,
-                custom_message,
-            ]
-            self._approximate_crawl_count += len(current_crawler.internal_links) / 5
-
-            self.emit_tabulate_crawl_data.emit(table_row)
-            self.emit_progress.emit(
-                "Crawling Pages",
-                int(100 * len(self._work_flow._urls) / self._approximate_crawl_count),
-            )
-
-            for internal_link in current_crawler.internal_links:
-                if self._work_flow._keep_running:
-                    self.crawl_url(loc_=internal_link)
+        self._work_flow.crawl_url(loc_=loc_, callback_=self.tabulate_crawl_data)
+
+    def tabulate_crawl_data(self, crawler_: Crawler, message_: str) -> None:
+        table_row = [
+            len(self._work_flow._urls),  # current_url.hash,
+            crawler_.url,
+            crawler_.path,
+            crawler_.typ.value,
+            crawler_.status_code,
+            message_,
+        ]
+
+        self.emit_tabulate_crawl_data.emit(table_row)
+        self.emit_progress.emit(
+            self._work_flow.progress.message, self._work_flow.progress.percent
+        )
 
     @logging_decorator
     def crawl_additional_files(self) -> None:
@@ -221,7 +205,20 @@ class SWWorkflowObject(QObject):
         self._work_flow.commit_git_repositoy()
         self.emit_progress.emit("Committed Website to Repo", 100)
 
+    @logging_decorator
+    def deploy_to_host(self):
+        self._work_flow.deploy_to_host(
+            progress_callback_=lambda percent_: self.emit_progress.emit(
+                "Deploying Website", percent_
+            )
+        )
+        self.emit_progress.emit("Deployed Website", 100)
+
     @logging_decorator
     def publish_github_repositoy(self):
-        self._work_flow.publish_github_repositoy()
+        self._work_flow.publish_github_repositoy(
+            progress_callback_=lambda message_, percent_: self.emit_progress.emit(
+                f"Pushing to GitHub ({message_})", percent_
+            )
+        )
         self.emit_progress.emit("Pushed Website to GitHub", 100)
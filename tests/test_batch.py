@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_batch.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.batch import BatchExporter
+from staticwordpress.core.workflow import Workflow
+from staticwordpress.core.utils import get_remote_content
+from staticwordpress.core.project import Project
+from staticwordpress.core.constants import PROJECT, SOURCE
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class WebsiteRequestHandler(BaseHTTPRequestHandler):
+    """Website with a home page linking to two pages"""
+
+    requests = []
+
+    def do_GET(self):
+        host = f"http://{self.headers['Host']}"
+        pages = {
+            "/": f'<a href="{host}/a/">a</a><a href="{host}/b/">b</a>',
+            "/a/": f'<a href="{host}/">home</a>',
+            "/b/": "b",
+        }
+        if self.path in pages:
+            self.requests.append((self.path, time.monotonic()))
+        content = pages.get(self.path, "not found").encode()
+        self.send_response(200 if self.path in pages else 404)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SlowWebsiteRequestHandler(WebsiteRequestHandler):
+    """Same website, counts the requests which are served at the same time"""
+
+    requests = []
+    active, max_active = 0, 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = SlowWebsiteRequestHandler
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+        super().do_GET()
+
+
+def test_batch_exporter(tmp_path):
+    get_remote_content.cache_clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebsiteRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    project_paths = []
+    for name in ["first", "second"]:
+        (tmp_path / name / "_data").mkdir(parents=True)
+        project = Project(tmp_path / name / "_data" / ".project.json")
+        project.status = PROJECT.NEW
+        project.name = name
+        project.src_type = SOURCE.CRAWL
+        project.src_url = f"http://127.0.0.1:{server.server_port}"
+        project.output = tmp_path / name
+        project.delay = 0.2
+        project.save()
+        project_paths.append(project.path)
+    project_paths.append(tmp_path / "missing" / "_data" / ".project.json")
+
+    report = BatchExporter(project_paths, max_workers_=3).run()
+
+    assert [project["status"] for project in report["projects"]] == [
+        "done",
+        "done",
+        "failed",
+    ]
+    assert (tmp_path / "second" / "b" / "index.html").read_text() == "b"
+    first, second, missing = report["projects"]
+    assert first["pages"] == second["pages"] == 3
+    assert first["requests"] == second["requests"] > 0
+    assert first["bytes"] == second["bytes"] > 0
+    assert missing["pages"] == missing["requests"] == missing["bytes"] == 0
+    assert report["pages"] == 6
+
+    # exports without changes report the same totals
+    get_remote_content.cache_clear()
+    unchanged_report = BatchExporter(project_paths[:1]).run()
+    server.shutdown()
+    assert unchanged_report["projects"][0]["pages"] == first["pages"]
+    assert unchanged_report["projects"][0]["requests"] == first["requests"]
+    assert unchanged_report["projects"][0]["bytes"] == first["bytes"]
+
+    # all projects crawl the same origin, requests are spaced by the delay
+    assert set(path for path, _ in WebsiteRequestHandler.requests) == {
+        "/",
+        "/a/",
+        "/b/",
+    }
+    request_times = sorted(
+        request_time for _, request_time in WebsiteRequestHandler.requests
+    )
+    assert all(
+        later - earlier >= 0.15
+        for earlier, later in zip(request_times, request_times[1:])
+    )
+
+
+def test_batch_exporter_limits_fetches_of_all_projects(tmp_path, monkeypatch):
+    get_remote_content.cache_clear()
+    shutdowns = []
+    shutdown = Workflow.shutdown
+    monkeypatch.setattr(
+        Workflow, "shutdown", lambda self: shutdowns.append(shutdown(self))
+    )
+    project_paths = []
+    servers = []
+    for name in ["first", "second"]:
+        # one website per project, the rate controllers do not limit them
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowWebsiteRequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+        (tmp_path / name / "_data").mkdir(parents=True)
+        project = Project(tmp_path / name / "_data" / ".project.json")
+        project.status = PROJECT.NEW
+        project.name = name
+        project.src_type = SOURCE.CRAWL
+        project.src_url = f"http://127.0.0.1:{server.server_port}"
+        project.output = tmp_path / name
+        project.delay = 0
+        project.save()
+        project_paths.append(project.path)
+
+    report = BatchExporter(project_paths, max_workers_=2, max_fetches_=1).run()
+    for server in servers:
+        server.shutdown()
+
+    assert [project["pages"] for project in report["projects"]] == [3, 3]
+    assert SlowWebsiteRequestHandler.max_active == 1
+    # the worker threads of every workflow are stopped after its export
+    assert len(shutdowns) == 2
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_canonical.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.crawler import Crawler
+from staticwordpress.core.constants import URL
+from staticwordpress.core.canonical import (
+    canonical_url,
+    canonical_key,
+    url_hash,
+    remove_dot_segments,
+)
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("HTTP://Example.COM:80/about", "https://example.com/about/"),
+        ("https://example.com:443/about/#team", "https://example.com/about/"),
+        ("https://example.com", "https://example.com/"),
+        ("https://example.com/blog/index.html", "https://example.com/blog/"),
+        ("https://example.com/a/./b/../c/", "https://example.com/a/c/"),
+        ("https://example.com/style.css?ver=6.4.2", "https://example.com/style.css"),
+        (
+            "https://example.com/?utm_source=x&p=12&fbclid=y&cat=3",
+            "https://example.com/?cat=3&p=12",
+        ),
+        (
+            "https://example.com/%7euser/caf%C3%A9",
+            "https://example.com/~user/caf%C3%A9/",
+        ),
+        ("https://example.com:8080/feed", "https://example.com:8080/feed/"),
+    ],
+)
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+
+
+def test_remove_dot_segments():
+    assert remove_dot_segments("/a/b/c/./../../g") == "/a/g"
+    assert remove_dot_segments("/../a") == "/a"
+    assert remove_dot_segments("/a/..") == "/"
+
+
+def test_url_hash_is_stable_64_bit():
+    assert url_hash("https://example.com/") == url_hash("https://example.com/")
+    assert url_hash("https://example.com/") != url_hash("https://example.com/a/")
+    assert 0 <= url_hash("https://example.com/") < 1 << 64
+    assert url_hash("https://example.com/") == 0x14BA2EB79C27555B
+    assert canonical_key("http://example.com/a") == canonical_key(
+        "https://EXAMPLE.com/a/?utm_medium=mail"
+    )
+
+
+def test_crawler_hash_uses_canonical_url():
+    first = Crawler(loc_="http://staticwp.local/about", typ_=URL.FOLDER)
+    second = Crawler(loc_="https://staticwp.local:443/about/", typ_=URL.FOLDER)
+    assert first.canonical == "https://staticwp.local/about/"
+    assert first.hash == second.hash
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_deploy.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.deploy import NetlifyDeploy
+from staticwordpress.core.errors import DeployFailed
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class NetlifyRequestHandler(BaseHTTPRequestHandler):
+    """Mock of the Netlify file digest deploy API, the first upload fails
+    with 503 to exercise retries"""
+
+    files = dict()
+    manifests = []
+    uploads = []
+    failures = 1
+
+    def do_POST(self):
+        manifest = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.manifests.append(manifest["files"])
+        required = sorted(
+            set(digest for digest in manifest["files"].values())
+            - set(self.files.keys())
+        )
+        self.reply(200, {"id": "deploy1", "required": required})
+
+    def do_PUT(self):
+        content = self.rfile.read(int(self.headers["Content-Length"]))
+        if NetlifyRequestHandler.failures:
+            NetlifyRequestHandler.failures -= 1
+            self.reply(503, {})
+            return
+
+        self.uploads.append(self.path)
+        self.files[hashlib.sha1(content).hexdigest()] = content
+        self.reply(200, {})
+
+    def reply(self, status_, data_):
+        content = json.dumps(data_).encode()
+        self.send_response(status_)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UnavailableRequestHandler(NetlifyRequestHandler):
+    """Netlify is unavailable when a deploy is created"""
+
+    posts = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        UnavailableRequestHandler.posts += 1
+        self.reply(503, {})
+
+
+def test_netlify_deploy(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), NetlifyRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    (tmp_path / "about").mkdir()
+    (tmp_path / "_data").mkdir()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "index.html").write_text("home")
+    (tmp_path / "about" / "index.html").write_text("about")
+    (tmp_path / "about" / "copy.html").write_text("about")
+    (tmp_path / "_data" / "project.json").write_text("{}")
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main")
+
+    netlify = NetlifyDeploy(
+        token_="token",
+        site_="site",
+        api_url_=f"http://127.0.0.1:{server.server_port}",
+    )
+    progress = []
+    netlify.deploy(tmp_path, progress_callback_=progress.append)
+
+    (tmp_path / "index.html").write_text("new home")
+    netlify.deploy(tmp_path)
+    server.shutdown()
+
+    assert sorted(NetlifyRequestHandler.manifests[0]) == [
+        "/about/copy.html",
+        "/about/index.html",
+        "/index.html",
+    ]
+    # identical files are uploaded once
+    assert sorted(NetlifyRequestHandler.uploads[:2]) == [
+        "/deploys/deploy1/files/about/copy.html",
+        "/deploys/deploy1/files/index.html",
+    ]
+    assert NetlifyRequestHandler.uploads[2:] == ["/deploys/deploy1/files/index.html"]
+    assert progress[-1] == 100
+
+
+def test_netlify_deploy_creation_is_not_retried(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UnavailableRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    (tmp_path / "index.html").write_text("home")
+
+    netlify = NetlifyDeploy(
+        token_="token",
+        site_="site",
+        api_url_=f"http://127.0.0.1:{server.server_port}",
+    )
+    with pytest.raises(DeployFailed):
+        netlify.deploy(tmp_path)
+    server.shutdown()
+
+    assert UnavailableRequestHandler.posts == 1
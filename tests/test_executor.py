@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_executor.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import time
+import threading
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.gui.executor import SWTaskExecutor
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def wait_until_idle(application_, executor_, timeout_=5):
+    deadline = time.monotonic() + timeout_
+    while executor_.is_busy and time.monotonic() < deadline:
+        application_.processEvents()
+        time.sleep(0.01)
+    application_.processEvents()
+
+
+def test_task_executor_runs_tasks_in_order():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    executor = SWTaskExecutor()
+    started, failed, calls = [], [], []
+    executor.emit_task_started.connect(started.append)
+    executor.emit_task_failed.connect(lambda name_, error_: failed.append(name_))
+
+    def task(name_):
+        def run():
+            time.sleep(0.02)
+            calls.append((name_, threading.current_thread().name))
+            if name_ == "second":
+                raise ValueError("broken")
+
+        return run
+
+    for name in ["first", "second", "third"]:
+        executor.submit(name, task(name))
+    assert executor.is_busy
+    wait_until_idle(application, executor)
+
+    assert [name for name, _ in calls] == ["first", "second", "third"]
+    assert all(thread.startswith("staticwordpress") for _, thread in calls)
+    assert started == ["first", "second", "third"]
+    assert failed == ["second"]
+
+
+def test_task_executor_cancel():
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    executor = SWTaskExecutor()
+    running, stop, calls = threading.Event(), threading.Event(), []
+
+    def long_task():
+        running.set()
+        stop.wait(5)
+        calls.append("long")
+
+    executor.submit("long", long_task, on_cancel_=stop.set)
+    queued = executor.submit("queued", lambda: calls.append("queued"))
+    running.wait(5)
+    executor.cancel()
+    wait_until_idle(application, executor)
+
+    assert queued.is_cancelled
+    assert calls == ["long"]
+    assert not executor.is_busy
+
+
+def test_task_executor_keeps_tasks_which_are_not_cancellable():
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    executor = SWTaskExecutor()
+    running, stop, calls = threading.Event(), threading.Event(), []
+
+    def long_task():
+        running.set()
+        stop.wait(5)
+        calls.append("long")
+
+    executor.submit("long", long_task, on_cancel_=stop.set)
+    executor.submit("queued", lambda: calls.append("queued"))
+    loading = executor.submit(
+        "project", lambda: calls.append("project"), cancellable_=False
+    )
+    running.wait(5)
+    executor.cancel()
+    wait_until_idle(application, executor)
+
+    assert not loading.is_cancelled
+    assert calls == ["long", "project"]
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_fetch.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import threading
+from types import SimpleNamespace
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core import fetch
+from staticwordpress.core.constants import FETCH, URL
+from staticwordpress.core.crawler import Crawler
+from staticwordpress.core.project import Project
+from staticwordpress.core.fetch import (
+    FetchBackend,
+    RequestsBackend,
+    HttpxBackend,
+    get_fetch_backend,
+    as_requests_response,
+)
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves a page at /page/, /old/ redirects to it"""
+
+    def do_GET(self):
+        if self.path == "/old/":
+            self.send_response(301)
+            self.send_header("Location", "/page/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = f"<html><a href='http://127.0.0.1:{self.server.server_port}/next/'></a>{self.headers.get('X-Test', '')}</html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class CountingBackend(RequestsBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.urls = []
+
+    def get(self, url_: str, headers_: dict = None):
+        self.urls.append(url_)
+        return super().get(url_, headers_=headers_)
+
+
+def check_backend(backend_: FetchBackend, url_: str) -> None:
+    response = backend_.get(f"{url_}/old/", headers_={"X-Test": "header"})
+    assert response.status_code == 200
+    assert response.url == f"{url_}/page/"
+    assert [item.status_code for item in response.history] == [301]
+    assert [item.url for item in response.history] == [f"{url_}/old/"]
+    assert "header" in response.text
+
+
+def test_requests_backend(server_url):
+    check_backend(RequestsBackend(), server_url)
+
+
+def test_httpx_backend(server_url):
+    pytest.importorskip("httpx")
+    backend = HttpxBackend()
+    try:
+        check_backend(backend, server_url)
+    finally:
+        backend.close()
+
+
+def test_httpx_response_is_saved_by_crawler(tmp_path):
+    """Responses converted from httpx are read already, streaming them (as
+    fonts are saved) must not touch the missing raw stream"""
+    url = "https://example.com/fonts/font.woff2"
+    content = bytes(range(256)) * 10
+    request = SimpleNamespace(method="GET", url=url, headers={"User-Agent": "test"})
+    response = as_requests_response(
+        SimpleNamespace(
+            status_code=200,
+            reason_phrase="OK",
+            url=url,
+            headers={"Content-Type": "font/woff2"},
+            encoding=None,
+            content=content,
+            history=[],
+            elapsed=timedelta(milliseconds=5),
+            request=request,
+        )
+    )
+    assert response.request.url == url
+    assert response.elapsed == timedelta(milliseconds=5)
+
+    crawler = Crawler(loc_=url)
+    assert crawler.typ == URL.FONTS
+    crawler._response = response
+    crawler.save(tmp_path)
+
+    assert (tmp_path / "fonts" / "font.woff2").read_bytes() == content
+
+
+def test_crawler_fetch_uses_backend(server_url):
+    backend = CountingBackend()
+    crawler = Crawler(loc_=f"{server_url}/page/", typ_=URL.FOLDER)
+    crawler.fetch(cached_=False, backend_=backend)
+
+    assert backend.urls == [f"{server_url}/page/"]
+    assert crawler.status_code == 200
+    assert crawler.internal_links == [f"{server_url}/next/"]
+
+
+def test_unavailable_backend_falls_back_to_requests(monkeypatch):
+    class MissingBackend(FetchBackend):
+        def __init__(self) -> None:
+            raise ImportError("No module named 'missing'")
+
+    monkeypatch.setattr(fetch, "_FETCHERS", dict())
+    monkeypatch.setitem(fetch.FETCH_BACKENDS, FETCH.HTTPX, MissingBackend)
+
+    backend = get_fetch_backend(FETCH.HTTPX)
+    assert isinstance(backend, RequestsBackend)
+    assert get_fetch_backend(FETCH.REQUESTS) is backend
+
+
+def test_project_fetch_backend(tmp_path):
+    project = Project(tmp_path / ".project.json")
+    assert project.fetch_backend == FETCH.REQUESTS
+
+    project.create()
+    project.fetch_backend = FETCH.HTTPX
+    project.save()
+
+    reopened = Project()
+    reopened.open(tmp_path / ".project.json")
+    assert reopened.fetch_backend == FETCH.HTTPX
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_github.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import hashlib
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import git
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.constants import CONFIGS
+from staticwordpress.core.github import GitHub
+from staticwordpress.core.lfs import (
+    LFSObjects,
+    lfs_attribute_path,
+    lfs_attribute_pattern_path,
+)
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_incremental_commit_and_publish(tmp_path):
+    remote = git.Repo.init(tmp_path / "remote.git", bare=True)
+    output = tmp_path / "output"
+    output.mkdir()
+    (output / "index.html").write_text("home")
+    (output / "about").mkdir()
+    (output / "about" / "index.html").write_text("about")
+    (output / "old.html").write_text("old")
+
+    gh = GitHub(gh_token_="token", gh_repo_="website", repo_dir_=str(output))
+    gh._repo.create_remote("origin", url=str(tmp_path / "remote.git"))
+    gh._repo.config_writer().set_value("user", "name", "test").release()
+    gh._repo.config_writer().set_value("user", "email", "test@test").release()
+
+    gh.commit()
+    progress = []
+    gh.publish(progress_callback_=lambda message_, percent_: progress.append(percent_))
+    assert remote.commit("main").tree / "old.html"
+
+    (output / "about" / "index.html").write_text("about us")
+    (output / "old.html").unlink()
+    (output / "untracked.html").write_text("written before the repository")
+
+    gh.commit(changed_paths_=["about/index.html", "old.html"])
+    gh.publish()
+
+    tree = remote.commit("main").tree
+    assert (tree / "about/index.html").data_stream.read() == b"about us"
+    assert "old.html" not in [blob.path for blob in tree.traverse()]
+    assert (
+        tree / "untracked.html"
+    ).data_stream.read() == b"written before the repository"
+    assert len(list(remote.iter_commits("main"))) == 2
+
+
+def test_first_commit_stages_all_files(tmp_path):
+    output = tmp_path / "output"
+    output.mkdir()
+    (output / "index.html").write_text("home")
+    (output / "CNAME").write_text("example.com")
+
+    gh = GitHub(gh_token_="token", gh_repo_="website", repo_dir_=str(output))
+    gh._repo.config_writer().set_value("user", "name", "test").release()
+    gh._repo.config_writer().set_value("user", "email", "test@test").release()
+
+    gh.commit(changed_paths_=["index.html"])
+
+    tree = gh._repo.head.commit.tree
+    assert sorted(blob.path for blob in tree.traverse()) == ["CNAME", "index.html"]
+
+
+class LFSRequestHandler(BaseHTTPRequestHandler):
+    """Minimal Git LFS server using the basic transfer adapter"""
+
+    objects = dict()
+
+    def do_POST(self):
+        content = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.endswith("/objects/batch"):
+            host = f"http://{self.headers['Host']}"
+            response = {"transfer": "basic", "objects": []}
+            for lfs_object in json.loads(content)["objects"]:
+                if lfs_object["oid"] not in self.objects:
+                    lfs_object["actions"] = {
+                        "upload": {"href": f"{host}/objects/{lfs_object['oid']}"},
+                        "verify": {"href": f"{host}/verify"},
+                    }
+                response["objects"].append(lfs_object)
+            self.reply(200, json.dumps(response).encode())
+        else:
+            self.reply(200 if json.loads(content)["oid"] in self.objects else 404)
+
+    def do_PUT(self):
+        content = self.rfile.read(int(self.headers["Content-Length"]))
+        self.objects[self.path.split("/")[-1]] = content
+        self.reply(200)
+
+    def reply(self, status_, content_=b""):
+        self.send_response(status_)
+        self.send_header("Content-Type", "application/vnd.git-lfs+json")
+        self.send_header("Content-Length", str(len(content_)))
+        self.end_headers()
+        self.wfile.write(content_)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_lfs_offload(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LFSRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    output = tmp_path / "output"
+    output.mkdir()
+    large_image = bytes(range(256)) * 16
+    (output / "large.png").write_bytes(large_image)
+    (output / "small.png").write_bytes(b"small")
+    (output / "index.html").write_bytes(bytes(range(256)) * 16)
+
+    gh = GitHub(
+        gh_token_="token",
+        gh_repo_="website",
+        repo_dir_=str(output),
+        lfs_threshold_=1024,
+    )
+    with gh._repo.config_writer() as config:
+        config.set_value("lfs", "url", f"http://127.0.0.1:{server.server_port}")
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@test")
+
+    gh.commit()
+    server.shutdown()
+
+    oid = hashlib.sha256(large_image).hexdigest()
+    tree = gh._repo.head.commit.tree
+    assert LFSRequestHandler.objects == {oid: large_image}
+    assert (tree / "large.png").data_stream.read() == (
+        f"version https://git-lfs.github.com/spec/v1\noid sha256:{oid}\n"
+        f"size {len(large_image)}\n"
+    ).encode()
+    assert (tree / "small.png").data_stream.read() == b"small"
+    assert len((tree / "index.html").data_stream.read()) == 4096
+    assert (tree / ".gitattributes").data_stream.read() == (
+        b"/large.png filter=lfs diff=lfs merge=lfs -text\n"
+    )
+
+    (output / "large.png").unlink()
+    gh.commit()
+
+    assert ".gitattributes" not in gh._repo.head.commit.tree
+    assert not (output / ".gitattributes").exists()
+
+
+def test_lfs_attributes_follow_offloaded_paths(tmp_path):
+    (tmp_path / ".git").mkdir()
+    attributes_path = tmp_path / ".gitattributes"
+    attributes_path.write_text("*.html text\n", encoding="utf-8")
+    (tmp_path / "a b.png").write_bytes(b"image")
+    (tmp_path / "b.mp4").write_bytes(b"video")
+    lfs_objects = LFSObjects(
+        repo_dir_=str(tmp_path), git_dir_=str(tmp_path / ".git"), threshold_=1024
+    )
+
+    for path in ["a b.png", "[x]#?.png", "a\\b*.png"]:
+        assert lfs_attribute_pattern_path(lfs_attribute_path(path)) == path
+
+    assert lfs_objects.update_attributes(["b.mp4", "a b.png"])
+    assert not lfs_objects.update_attributes(["b.mp4"], changed_paths_=["b.mp4"])
+    assert attributes_path.read_text(encoding="utf-8") == (
+        "*.html text\n"
+        "/a[[:space:]]b.png filter=lfs diff=lfs merge=lfs -text\n"
+        "/b.mp4 filter=lfs diff=lfs merge=lfs -text\n"
+    )
+
+    # committed as regular file and deleted
+    (tmp_path / "b.mp4").unlink()
+    assert lfs_objects.update_attributes([], changed_paths_=["a b.png"])
+    assert attributes_path.read_text(encoding="utf-8") == "*.html text\n"
+
+
+class GitHubAPIRequestHandler(BaseHTTPRequestHandler):
+    """Fake GitHub REST API with a single user and an optional repository"""
+
+    requests = []
+    repository = None
+    rate_limited = 0
+
+    def do_GET(self):
+        self.requests.append(f"GET {self.path}")
+        if self.rate_limited:
+            GitHubAPIRequestHandler.rate_limited -= 1
+            self.reply(
+                403,
+                {"message": "API rate limit exceeded"},
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"},
+            )
+        elif self.path == "/user":
+            self.reply(200, {"login": "tester", "name": "Tester"})
+        elif self.path == "/repos/tester/website" and self.repository:
+            self.reply(200, self.repository)
+        else:
+            self.reply(404, {"message": "Not Found"})
+
+    def do_POST(self):
+        self.requests.append(f"POST {self.path}")
+        self.rfile.read(int(self.headers["Content-Length"]))
+        GitHubAPIRequestHandler.repository = {
+            "name": "website",
+            "full_name": "tester/website",
+            "url": f"http://{self.headers['Host']}/repos/tester/website",
+        }
+        self.reply(201, self.repository)
+
+    def do_DELETE(self):
+        self.requests.append(f"DELETE {self.path}")
+        GitHubAPIRequestHandler.repository = None
+        self.send_response(204)
+        self.end_headers()
+
+    def reply(self, status_, data_, headers_={}):
+        content = json.dumps(data_).encode()
+        self.send_response(status_)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in headers_.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_cached_api_lookups(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GitHubAPIRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setitem(
+        CONFIGS["GITHUB"], "API_URL", f"http://127.0.0.1:{server.server_port}"
+    )
+
+    gh = GitHub(gh_token_="token", gh_repo_="website", repo_dir_=str(tmp_path))
+    GitHubAPIRequestHandler.rate_limited = 1
+    assert gh.is_token_valid()
+    assert not gh.is_repo_valid()
+    gh.create()
+    assert gh.is_repo_valid()
+    gh.create()
+    gh.delete()
+    assert not gh.is_repo_valid()
+    server.shutdown()
+
+    assert GitHubAPIRequestHandler.requests == [
+        "GET /user",
+        "GET /user",
+        "GET /repos/tester/website",
+        "POST /user/repos",
+        "DELETE /repos/tester/website",
+        "GET /repos/tester/website",
+    ]
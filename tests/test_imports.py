@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_imports.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+HEAVY_MODULES = ["github", "git", "bs4", "yaml", "unittest.mock", "IPython"]
+MAX_IMPORT_SECONDS = 1.0
+
+
+def import_in_subprocess(module_: str) -> dict:
+    """Import module_ in a fresh interpreter and report the import time and
+    which heavy modules were loaded along the way"""
+    code = (
+        "import sys, time, json\n"
+        "start = time.perf_counter()\n"
+        f"import {module_}\n"
+        "print(json.dumps({\n"
+        "    'seconds': time.perf_counter() - start,\n"
+        f"    'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules],\n"
+        "}))\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(SRC_PATH), env.get("PYTHONPATH", "")]
+    ).rstrip(os.pathsep)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_workflow_import_is_lazy():
+    result = import_in_subprocess("staticwordpress.core.workflow")
+    assert result["loaded"] == []
+    assert result["seconds"] < MAX_IMPORT_SECONDS
+
+
+def test_cli_import_is_lazy():
+    result = import_in_subprocess("staticwordpress.cli.batch")
+    assert result["loaded"] == []
+    assert result["seconds"] < MAX_IMPORT_SECONDS
+
+
+def test_translations_load_on_first_lookup():
+    code = (
+        "from staticwordpress.core.i18n import tr\n"
+        "assert not tr.is_loaded\n"
+        "assert tr('Close')\n"
+        "assert tr.is_loaded\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_logger.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import logging
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.constants import CONFIGS
+from staticwordpress.gui.logger import SWLoggerWidget
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_logger_widget_batches_records(tmp_path):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    handler = SWLoggerWidget(None, spill_path_=tmp_path / "gui.log")
+    handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    logger = logging.getLogger("test_logger_widget")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+
+    # few records are shown as they are
+    logger.info("first")
+    logger.debug("second")
+    assert handler.plaintext_edit.toPlainText() == ""
+    handler.flush()
+    assert handler.plaintext_edit.toPlainText() == "INFO - first\nDEBUG - second"
+
+    # under load only warnings and the latest records are shown
+    handler.plaintext_edit.clear()
+    for index in range(1000):
+        logger.debug(f"page {index}")
+    logger.warning("throttled")
+    for index in range(1000, 1010):
+        logger.info(f"page {index}")
+    handler.flush()
+
+    shown = handler.plaintext_edit.toPlainText().splitlines()
+    assert shown[0].startswith("... 991 DEBUG records not shown")
+    assert shown[1:3] == ["DEBUG - page 991", "DEBUG - page 992"]
+    assert "WARNING - throttled" in shown
+    assert shown[-1] == "INFO - page 1009"
+    assert len(shown) == 21
+    # skipped lines wait for the older lines which are still shown
+    assert not (tmp_path / "gui.log").exists()
+
+    logger.removeHandler(handler)
+    handler.close()
+    spilled = (tmp_path / "gui.log").read_text().splitlines()
+    assert len(spilled) == 1013
+    assert spilled[:3] == ["INFO - first", "DEBUG - second", "DEBUG - page 0"]
+
+
+def test_logger_widget_spills_evicted_lines(tmp_path, monkeypatch):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setitem(CONFIGS["GUI"]["LOGGER"], "MAX_LINES", 3)
+    monkeypatch.setitem(CONFIGS["GUI"]["LOGGER"], "SPILL_MAX_BYTES", 25)
+
+    handler = SWLoggerWidget(None, spill_path_=tmp_path / "gui.log")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("test_logger_widget_spill")
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    for index in range(5):
+        logger.warning(f"line {index}")
+    handler.flush()
+    assert handler.plaintext_edit.toPlainText() == "line 2\nline 3\nline 4"
+    assert (tmp_path / "gui.log").read_text() == "line 0\nline 1\n"
+
+    # the spill file is rotated when it reaches SPILL_MAX_BYTES
+    for index in range(5, 8):
+        logger.warning(f"line {index}")
+    handler.flush()
+    assert (
+        tmp_path / "gui.log.1"
+    ).read_text() == "line 0\nline 1\nline 2\nline 3\nline 4\n"
+    assert not (tmp_path / "gui.log").exists()
+
+    logger.removeHandler(handler)
+    handler.close()
+    assert (tmp_path / "gui.log").read_text() == "line 5\nline 6\nline 7\n"
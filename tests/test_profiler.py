@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_profiler.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.profiler import StageProfiler
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def allocate_pages():
+    return ["<p>page</p>" * 1000 for _ in range(100)]
+
+
+def test_stage_profiler(tmp_path):
+    profiler = StageProfiler(output_path_=tmp_path / "profiles")
+    kept = []
+    for _ in range(2):
+        with profiler.stage("crawl"):
+            with profiler.stage("search"):  # nested, counted in crawl
+                kept.append(allocate_pages())
+
+    rows = profiler.rows
+    assert list(rows) == ["crawl"]
+    assert rows["crawl"]["calls"] == 2
+    assert rows["crawl"]["retained"] > 2 * 100 * 11000
+
+    stats = pstats.Stats(str(tmp_path / "profiles" / "crawl.prof"))
+    assert any(function == "allocate_pages" for _, _, function in stats.stats)
+    assert (
+        "test_profiler.py" in (tmp_path / "profiles" / "crawl.memory.txt").read_text()
+    )
+
+    summary = (tmp_path / "profiles" / "summary.txt").read_text().splitlines()
+    assert summary[0].split()[:3] == ["stage", "calls", "seconds"]
+    assert summary[1].split()[:2] == ["crawl", "2"]
+
+
+def parse_pages():
+    return [page.split("<p>") for page in allocate_pages()]
+
+
+def test_stage_profiler_worker_threads(tmp_path):
+    profiler = StageProfiler(output_path_=tmp_path / "profiles")
+    with profiler.stage("crawl"):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(profiler.run, parse_pages) for _ in range(2)]
+            assert all(len(future.result()) == 100 for future in futures)
+
+    stats = pstats.Stats(str(tmp_path / "profiles" / "crawl.prof"))
+    assert [
+        stat[0] for key, stat in stats.stats.items() if key[2] == "parse_pages"
+    ] == [2]
+
+
+def test_stage_profiler_disabled(tmp_path):
+    profiler = StageProfiler()
+    with profiler.stage("crawl"):
+        pass
+    assert not profiler.is_enabled
+    assert profiler.rows == {}
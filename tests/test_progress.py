@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_progress.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.progress import CrawlProgress, format_duration
+from staticwordpress.core.project import Project
+from staticwordpress.core.workflow import Workflow
+from staticwordpress.core.constants import PROJECT, SOURCE
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class SitemapRequestHandler(BaseHTTPRequestHandler):
+    """Website with a sitemap index listing four pages, one page is only
+    reachable through a link"""
+
+    def do_GET(self):
+        host = f"http://{self.headers['Host']}"
+        pages = {
+            "/sitemap_index.xml": (
+                "<?xml version='1.0'?><sitemapindex><sitemap>"
+                f"<loc>{host}/page-sitemap.xml</loc></sitemap></sitemapindex>"
+            ),
+            "/page-sitemap.xml": "<?xml version='1.0'?><urlset>"
+            + "".join(f"<url><loc>{host}/{page}/</loc></url>" for page in "abcd")
+            + "</urlset>",
+            "/": f'<a href="{host}/a/">a</a>',
+            "/a/": f'<a href="{host}/b/">b</a><a href="{host}/e/">e</a>',
+            "/b/": "b",
+            "/c/": "c",
+            "/d/": "d",
+            "/e/": "e",
+        }
+        content = pages.get(self.path, "not found").encode()
+        self.send_response(200 if self.path in pages else 404)
+        self.send_header(
+            "Content-Type", "text/xml" if self.path.endswith(".xml") else "text/html"
+        )
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_crawl_progress():
+    progress = CrawlProgress()
+    assert progress.percent == 0
+    assert progress.eta is None
+
+    progress.set_expected(100)
+    progress.update(completed_=25, frontier_=10)
+    assert progress.total == 100
+    assert progress.percent == 25
+    assert progress.eta > 0
+
+    progress.update(completed_=100, frontier_=50)
+    assert progress.total == 150
+    assert progress.percent == 66
+
+    progress.update(completed_=150, frontier_=0)
+    assert progress.percent == 99
+    progress.finish()
+    assert progress.percent == 100
+    assert progress.eta == 0.0
+
+    assert format_duration(59) == "59s"
+    assert format_duration(200) == "3m 20s"
+    assert format_duration(3720) == "1h 02m"
+
+
+def test_workflow_progress(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SitemapRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    project = Project(tmp_path / "_data" / ".project.json")
+    project.status = PROJECT.NEW
+    project.name = "progress"
+    project.src_type = SOURCE.CRAWL
+    project.src_url = f"http://127.0.0.1:{server.server_port}"
+    project.output = tmp_path
+    project.delay = 0
+
+    workflow = Workflow()
+    workflow.set_project(project)
+    totals = []
+    workflow.export(
+        callback_=lambda crawler_, message_: totals.append(workflow.progress.total)
+    )
+    server.shutdown()
+
+    # sitemap file and its four pages are known before crawling
+    assert totals[0] == 5
+    assert workflow.progress.completed == 7
+    assert workflow.progress.percent == 100
+    assert (tmp_path / "e" / "index.html").read_text() == "e"
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_ratecontrol.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.constants import PROJECT, SOURCE
+from staticwordpress.core.project import Project
+from staticwordpress.core.ratecontrol import RateController, parse_retry_after
+from staticwordpress.core.workflow import Workflow
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("3600") == 60
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") == 0.0
+    assert parse_retry_after(None) == 0.0
+
+
+def test_rate_controller_aimd():
+    rate_controller = RateController()
+    assert rate_controller.limit == 1
+
+    # additive increase: one more request per round of healthy responses
+    for _ in range(30):
+        rate_controller.acquire()
+        rate_controller.release(status_code_=200, seconds_=0.01)
+    assert rate_controller.limit == 7
+    assert rate_controller.baseline == 0.01
+
+    # multiplicative decrease on rising latency (p95 above twice the baseline)
+    for _ in range(2):
+        rate_controller.acquire()
+        rate_controller.release(status_code_=200, seconds_=0.05)
+    assert rate_controller.limit == 4
+
+    # no further change within the round after a decrease
+    for _ in range(3):
+        rate_controller.acquire()
+        rate_controller.release(status_code_=200, seconds_=0.01)
+    assert rate_controller.limit == 4
+
+    # throttling pauses all requests for Retry-After seconds
+    rate_controller.acquire()
+    rate_controller.release(status_code_=429, seconds_=0.01, retry_after_="0.2")
+    assert rate_controller.limit == 2
+    start = time.monotonic()
+    rate_controller.acquire()
+    assert time.monotonic() - start >= 0.19
+    rate_controller.release(status_code_=200, seconds_=0.01)
+    assert rate_controller.in_flight == 0
+
+
+def test_rate_controller_ignores_reused_responses():
+    rate_controller = RateController()
+    for _ in range(30):
+        rate_controller.acquire()
+        rate_controller.release(status_code_=429, seconds_=None)
+    assert rate_controller.limit == 1
+    assert rate_controller.baseline is None
+    assert rate_controller.in_flight == 0
+
+
+class ThrottlingRequestHandler(BaseHTTPRequestHandler):
+    """Website answering the first request of each page with 429"""
+
+    requests = []
+    active, max_active = 0, 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        host = f"http://{self.headers['Host']}"
+        cls = self.__class__
+        with cls.lock:
+            throttled = self.path not in cls.requests
+            cls.requests.append(self.path)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(0.02)
+
+        if self.path == "/":
+            content = "".join(
+                f'<a href="{host}/{page}/">{page}</a>' for page in range(20)
+            )
+        else:
+            content = f"page {self.path}"
+        if throttled and self.path == "/3/":
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            content = "slow down"
+        else:
+            self.send_response(200)
+        content = content.encode()
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+        with cls.lock:
+            cls.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_crawl_adapts_concurrency(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    (tmp_path / "_data").mkdir()
+    project = Project(tmp_path / "_data" / ".project.json")
+    project.status = PROJECT.NEW
+    project.src_type = SOURCE.CRAWL
+    project.src_url = f"http://127.0.0.1:{server.server_port}"
+    project.output = tmp_path
+    project.sitemap = ""
+    project.delay = 0
+
+    workflow = Workflow()
+    workflow.set_project(project)
+    workflow.clear()
+    workflow.crawl_url(loc_=project.src_url)
+    server.shutdown()
+
+    assert ThrottlingRequestHandler.max_active > 1
+    assert ThrottlingRequestHandler.requests.count("/3/") == 2
+    assert (tmp_path / "3" / "index.html").read_text() == "page /3/"
+    assert len(workflow.urls) == 21
@@ -23,12 +23,19 @@ specific language governing rights and limitations under the License.
 </LICENSE_BLOCK>
 """
 
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from staticwordpress.core.redirects import Redirects, Redirect
-from staticwordpress.core.constants import REDIRECTS
+from staticwordpress.core.emitters import merge_to_wildcards
+from staticwordpress.core.constants import REDIRECTS, HOST
 
 
 def test_redirect():
@@ -43,3 +50,192 @@ def test_redirect():
 
     assert red.as_line() == "/\thttps://seowings.org\t200"
     assert red.as_json() == {"from": "/", "status": 200, "to": "https://seowings.org"}
+
+
+def test_redirects_consolidate_chain():
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect("/a/", "/b/", None, 301, True, REDIRECTS.REDIRECTION.value),
+            Redirect("/b/", "/c/", None, 301, True, REDIRECTS.REDIRECTION.value),
+            Redirect("/c/", "/d/", None, 301, True, REDIRECTS.REDIRECTION.value),
+        ]
+    )
+
+    assert redirects.consolidate() == []
+    assert [r.to_url for r in redirects.items.values()] == ["/d/", "/d/", "/d/"]
+
+
+def test_redirects_consolidate_loop():
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect("/x", "/a", None, 301, True, REDIRECTS.REDIRECTION.value),
+            Redirect("/a", "/b", None, 301, True, REDIRECTS.REDIRECTION.value),
+            Redirect("/b", "/a", None, 301, True, REDIRECTS.REDIRECTION.value),
+            Redirect("/c", "/d", None, 301, True, REDIRECTS.REDIRECTION.value),
+        ]
+    )
+
+    assert redirects.consolidate() == [["/a", "/b"]]
+    assert [r.from_url for r in redirects.items.values()] == ["/c"]
+
+
+def test_redirects_consolidate_trailing_slash(caplog):
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect("/x", "/a", None, 301, True, REDIRECTS.REDIRECTION.value),
+            Redirect("/a", "/a/", None, 301, True, REDIRECTS.REDIRECTION.value),
+        ]
+    )
+
+    assert redirects.consolidate() == []
+    assert "Redirect Loop" not in caplog.text
+    assert [(r.from_url, r.to_url) for r in redirects.items.values()] == [("/x", "/a/")]
+
+
+def test_redirects_consolidate_wildcard():
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect("/old/*", "/new/:splat", None, 301, True, REDIRECTS.NONE.value),
+            Redirect("/old/a", "/new/a", None, 301, True, REDIRECTS.NONE.value),
+            Redirect("/old/b", "/other", None, 301, True, REDIRECTS.NONE.value),
+        ]
+    )
+    redirects.add_search(search_page_="search")
+    redirects.consolidate()
+
+    assert [r.from_url for r in redirects.items.values()] == ["/old/*", "/old/b", "/*"]
+
+
+def test_redirects_save_netlify_redirects(tmp_path):
+    redirects = Redirects()
+    redirects.add_redirect(
+        Redirect("/old/", "/new/", None, 301, True, REDIRECTS.REDIRECTION.value)
+    )
+    redirects.add_search(search_page_="search")
+    redirects.save(tmp_path / "_redirects", HOST.LOCALHOST)
+
+    assert (tmp_path / "_redirects").read_text().splitlines() == [
+        "/old/  /new/  301!",
+        "/*  s=:s  /search/  301!",
+    ]
+
+
+def test_redirects_save_cloudflare_limits(tmp_path):
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect(f"/old/{i}", f"/new/{i}", None, 301, True, REDIRECTS.NONE.value)
+            for i in range(2500)
+        ]
+    )
+    redirects.save(tmp_path / "_redirects", HOST.CLOUDFLARE)
+
+    assert (tmp_path / "_redirects").read_text() == "/old/* /new/:splat 301\n"
+
+
+def test_redirects_save_cloudflare_keeps_partial_folder_moves(tmp_path, caplog):
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect(f"/old/{i}", f"/new/{i}", None, 301, True, REDIRECTS.NONE.value)
+            for i in range(2500)
+        ]
+        + [
+            Redirect("/old/c", "/elsewhere/c", None, 301, True, REDIRECTS.NONE.value),
+            Redirect("/a", "/b", "{s = ':s'}", 301, True, REDIRECTS.NONE.value),
+        ]
+    )
+    files = redirects.save(tmp_path / "_redirects", HOST.CLOUDFLARE)
+
+    # cloudflare reads a single file, redirects beyond its limits are reported
+    assert [f.name for f in files] == ["_redirects"]
+    lines = files[0].read_text().splitlines()
+    assert len(lines) == 2000
+    assert "/old/* /new/:splat 301" not in lines
+    assert "Dropped: /a -> /b" in caplog.text
+    assert "501 redirects exceed limits" in caplog.text
+    assert "/old/c -> /elsewhere/c" in caplog.text
+
+
+def test_redirects_save_cloudflare_keeps_live_pages(tmp_path, caplog):
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect(f"/old/{i}", f"/new/{i}", None, 301, True, REDIRECTS.NONE.value)
+            for i in range(2500)
+        ]
+    )
+    files = redirects.save(
+        tmp_path / "_redirects", HOST.CLOUDFLARE, known_paths_=["/old/live/"]
+    )
+
+    assert len(files) == 1
+    assert "/old/*" not in files[0].read_text()
+    assert "500 redirects exceed limits" in caplog.text
+
+
+def test_merge_to_wildcards_skips_root_without_known_paths():
+    redirects = [
+        Redirect(f"/{i}", f"/new/{i}", None, 301, True, REDIRECTS.NONE.value)
+        for i in range(3)
+    ]
+    assert merge_to_wildcards(redirects) == redirects
+    assert [r.from_url for r in merge_to_wildcards(redirects, known_paths_=[])] == [
+        "/*"
+    ]
+
+
+def test_redirects_save_apache_exact_rules(tmp_path):
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect("/a/", "/b/", None, 301, True, REDIRECTS.NONE.value),
+            Redirect("/blog/*", "/news/:splat", None, 301, True, REDIRECTS.NONE.value),
+        ]
+    )
+    redirects.save(tmp_path / ".htaccess", HOST.APACHE)
+
+    lines = (tmp_path / ".htaccess").read_text().splitlines()
+    assert lines == [
+        "RedirectMatch 301 ^/a/?$ /b/",
+        "RedirectMatch 301 ^/blog/(.*)$ /news/$1",
+    ]
+    pattern = re.compile(lines[0].split()[2])
+    assert pattern.match("/a") and pattern.match("/a/")
+    assert not pattern.match("/a/anything")
+
+
+def test_redirects_save_nginx_split(tmp_path, caplog):
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect(f"/a{i}", f"/b{i}", None, 301, True, REDIRECTS.NONE.value)
+            for i in range(15000)
+        ]
+    )
+    files = redirects.save(tmp_path / "redirects.map", HOST.NGINX)
+    assert "written to 1 additional files" in caplog.text
+
+    assert [f.name for f in files] == ["redirects.map", "redirects.1.map"]
+    assert (tmp_path / "redirects.1.map").read_text().startswith("/a10000 /b10000;")
+
+
+def test_redirects_match():
+    redirects = Redirects()
+    redirects.add_redirects(
+        [
+            Redirect("/old-page/", "/new-page/", None, 301, True, REDIRECTS.NONE.value),
+            Redirect("/blog/*", "/news/:splat", None, 301, True, REDIRECTS.NONE.value),
+            Redirect("/blog/2020/*", "/archive", None, 301, True, REDIRECTS.NONE.value),
+        ]
+    )
+    redirects.add_search(search_page_="search")
+
+    assert redirects.match("/old-page").to_url == "/new-page/"
+    assert redirects.match("/blog/2020/post/").to_url == "/news/:splat"
+    assert redirects.match("/blog/").to_url == "/news/:splat"
+    assert redirects.match("/about/") is None
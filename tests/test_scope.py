@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_scope.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.scope import Scope, compile_scope
+from staticwordpress.core.project import Project
+from staticwordpress.core.workflow import Workflow
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.com/", True),
+        ("https://example.com/about/", True),
+        ("https://example.com/blog/feed/", False),
+        ("https://example.com/feedback/", False),
+        ("https://example.com/tag/news/", False),
+        ("https://example.com/blog/page/2/", False),
+        ("https://example.com/blog/page/two/", True),
+        ("https://example.com/wp-admin/", False),
+        ("https://example.com/wp-admin-guide/", True),
+        ("https://example.com/xmlrpc.php", False),
+    ],
+)
+def test_scope_patterns(url, expected):
+    scope = Scope(
+        exclude_=["feed", "glob:/tag/*", r"re:/page/\d+/", "prefix:/wp-admin/", ".php"]
+    )
+    assert scope.matches(url) == expected
+
+
+def test_scope_include_patterns_apply_to_pages_only():
+    scope = Scope(include_=["prefix:/blog/"], exclude_=["feed"])
+    assert scope.matches("https://example.com/blog/hello/")
+    assert not scope.matches("https://example.com/about/")
+    assert scope.matches("https://example.com/wp-content/themes/style.css")
+    assert not scope.matches("https://example.com/blog/feed/")
+
+
+def test_scope_max_depth():
+    scope = Scope(max_depth_=2)
+    assert scope.matches("https://example.com/2024/hello/")
+    assert scope.matches("https://example.com/2024/hello/index.html")
+    assert not scope.matches("https://example.com/2024/01/hello/")
+    assert scope.matches("https://example.com/wp-content/uploads/2024/01/a.jpg")
+
+
+def test_scope_query_policy():
+    assert Scope().matches("https://example.com/?p=12")
+    assert not Scope(query_="SKIP").matches("https://example.com/?p=12")
+    assert Scope(query_="SKIP").matches("https://example.com/style.css?ver=6.4")
+    with pytest.raises(ValueError):
+        compile_scope(query_="DROP")
+
+
+def test_scope_max_section_pages():
+    scope = Scope(max_section_pages_=2)
+    admitted = [
+        scope.admit(f"https://example.com/tag/{index}/") for index in range(4)
+    ] + [scope.admit("https://example.com/about/")]
+
+    assert admitted == [True, True, False, False, True]
+    assert scope.sections == {"tag": 2, "about": 1}
+    assert scope.rejected_count == 2
+    assert scope.admit("https://example.com/tag/style.css")
+
+    scope.reset()
+    assert scope.admit("https://example.com/tag/4/")
+    assert scope.rejected_count == 0
+
+
+def test_workflow_queues_links_in_scope():
+    project = Project()
+    project.exclude = ["feed"]
+    project.scope = {"max-depth": 1}
+    workflow = Workflow()
+    workflow.set_project(project_=project)
+
+    frontier = []
+    workflow.push_links(
+        [
+            "https://example.com/about/",
+            "https://example.com/feed/",
+            "https://example.com/2024/hello/",
+            "https://example.com/about",
+        ],
+        frontier,
+    )
+
+    assert frontier == ["https://example.com/about/"]
+    assert workflow.scope.rejected_count == 2
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_singleflight.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.singleflight import SingleFlight
+from staticwordpress.core.utils import (
+    get_remote_content,
+    get_in_flight,
+    is_reused_response,
+)
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class SlowAssetHandler(BaseHTTPRequestHandler):
+    """Serves a stylesheet once release is set and counts the requests"""
+
+    requests_count = 0
+    release = threading.Event()
+
+    def do_GET(self):
+        SlowAssetHandler.requests_count += 1
+        self.release.wait(5)
+        body = b"body { color: black; }"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThrottledAssetHandler(BaseHTTPRequestHandler):
+    """Answers the first request with 429"""
+
+    requests_count = 0
+
+    def do_GET(self):
+        ThrottledAssetHandler.requests_count += 1
+        body = b"body { color: black; }"
+        self.send_response(429 if ThrottledAssetHandler.requests_count == 1 else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def wait_for(condition_, timeout_: float = 5) -> None:
+    deadline = time.monotonic() + timeout_
+    while not condition_() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_concurrent_calls_share_result():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    def call():
+        return single_flight.do("key", fetch), single_flight.was_shared
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(call) for _ in range(8)]
+        wait_for(lambda: single_flight.shared_count == 7)
+        release.set()
+        results, shared = zip(*[future.result() for future in futures])
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert sorted(shared) == [False] + [True] * 7
+    assert single_flight.in_flight == 0
+
+    # completed calls are not cached, the next call runs again
+    single_flight.do("key", fetch)
+    assert len(calls) == 2
+
+
+def test_exception_is_shared_and_cleared():
+    single_flight = SingleFlight()
+
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+    assert single_flight.in_flight == 0
+    assert single_flight.do("key", lambda: 42) == 42
+
+
+def test_remote_content_is_fetched_once():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowAssetHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/style.css"
+
+    shared_count = get_in_flight().shared_count
+
+    # bypass the lru cache, only in-flight coalescing applies
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(get_remote_content.__wrapped__, url) for _ in range(8)
+        ]
+        wait_for(lambda: get_in_flight().shared_count == shared_count + 7)
+        SlowAssetHandler.release.set()
+        responses = [future.result() for future in futures]
+    server.shutdown()
+
+    assert SlowAssetHandler.requests_count == 1
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_throttled_response_is_not_cached():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledAssetHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/throttled.css"
+
+    assert get_remote_content(url, max_retires=0).status_code == 429
+    assert not is_reused_response()
+    assert get_remote_content(url, max_retires=0).status_code == 200
+    assert not is_reused_response()
+    assert get_remote_content(url, max_retires=0).status_code == 200
+    assert is_reused_response()
+    # the cache is keyed by the canonical url like the fetches in flight
+    url = f"http://127.0.0.1:{server.server_port}/./throttled.css"
+    assert get_remote_content(url, max_retires=0).status_code == 200
+    assert is_reused_response()
+    server.shutdown()
+
+    assert ThrottledAssetHandler.requests_count == 2
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_snapshot.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import json
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.constants import CONFIGS, COMPILED_CONFIGS
+from staticwordpress.core.snapshot import (
+    load_snapshot,
+    snapshot_path,
+    compile_configs,
+)
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_snapshot_rebuilds_when_source_changes(tmp_path):
+    source = tmp_path / "source.json"
+    source.write_text(json.dumps({"value": 1}))
+    builds = []
+
+    def build():
+        builds.append(1)
+        with source.open("r") as f:
+            return json.load(f)
+
+    folder = tmp_path / "snapshots"
+    assert load_snapshot("test", [source], build, folder) == {"value": 1}
+    assert load_snapshot("test", [source], build, folder) == {"value": 1}
+    assert len(builds) == 1
+
+    source.write_text(json.dumps({"value": 22}))
+    stat_result = source.stat()
+    os.utime(source, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+    assert load_snapshot("test", [source], build, folder) == {"value": 22}
+    assert len(builds) == 2
+
+
+def test_snapshot_ignores_corrupt_file(tmp_path):
+    source = tmp_path / "source.json"
+    source.write_text("{}")
+    folder = tmp_path / "snapshots"
+    folder.mkdir()
+    snapshot_path("test", [source], folder).write_bytes(b"not a pickle")
+
+    assert load_snapshot("test", [source], lambda: {"rebuilt": True}, folder) == {
+        "rebuilt": True
+    }
+    assert load_snapshot("test", [source], lambda: {}, folder) == {"rebuilt": True}
+
+
+def test_compiled_configs_match_configs():
+    compiled = compile_configs(CONFIGS)
+    assert compiled["EXTENSIONS"] == COMPILED_CONFIGS["EXTENSIONS"]
+    for url_type, formats in CONFIGS["FORMATS"].items():
+        for file_ext in formats:
+            assert file_ext in compiled["EXTENSIONS"]
+    assert compiled["EXTENSIONS"]["PNG"] == "IMAGE"
+    assert compiled["EXCLUDE"].search("/wp-admin/options.php")
+    assert not compiled["EXCLUDE"].search("/blog/hello-world/")
+    assert compiled["CLEAN_CHARS"].sub("", "https://example.com/(page)/") == (
+        "https://example.com/page/"
+    )
+    assert compiled["DOWNLOAD_HEADERS"]["CUSTOM"]["Pragma"] == "no-cache"
+
+
+def test_compiled_configs_with_empty_lists():
+    configs = {
+        "FORMATS": {"IMAGE": ["PNG", ""]},
+        "EXCLUDE": [],
+        "CLEAN": {"CHARS": ""},
+        "HEADER": {"CUSTOM": {"User-Agent": "ua"}, "Access-Control-Max-Age": "1"},
+        "CANONICAL": {"DROP_PARAMS": []},
+    }
+    compiled = compile_configs(configs)
+    assert compiled["EXTENSIONS"] == {"PNG": "IMAGE"}
+    assert not compiled["EXCLUDE"].search("/any/path/")
+    assert compiled["CLEAN_CHARS"] is None
+    assert not compiled["DROP_PARAMS"].match("ver")
+    assert compiled["HEADERS"] == {"CUSTOM": {"User-Agent": "ua"}}
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_stats.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.constants import CONFIGS
+from staticwordpress.core.stats import Stats, percentile
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_percentile():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+def test_stats_summary(tmp_path):
+    stats = Stats(prometheus_path_=tmp_path / "metrics.prom")
+    for index in range(100):
+        stats.record_fetch("HTML", seconds_=(index + 1) / 1000, bytes_=1000)
+    stats.record_fetch("IMAGE", seconds_=0.5, bytes_=5000)
+    stats.record_fetch("HTML", seconds_=0.0, bytes_=1000, cached_=True)
+    stats.record_write(seconds_=0.25, bytes_=2000)
+    stats.set_gauge("frontier", 7)
+
+    with stats.stage("crawl"):
+        with stats.stage("crawl"):
+            pass
+
+    summary = stats.summary()
+    assert summary["requests"] == 102
+    assert summary["bytes"] == 106000
+    assert summary["cache_hit_rate"] == round(1 / 102, 3)
+    assert summary["latency"]["HTML"]["count"] == 100
+    assert summary["latency"]["HTML"]["p95"] == 0.095
+    assert summary["latency"]["IMAGE"]["p50"] == 0.5
+    assert summary["disk_write"] == {"count": 1, "seconds": 0.25, "bytes": 2000}
+    assert summary["gauges"] == {"frontier": 7}
+    assert list(summary["stages"]) == ["crawl"]
+
+    stats.log(force_=True)
+    metrics = (tmp_path / "metrics.prom").read_text().splitlines()
+    assert "staticwordpress_requests_total 102" in metrics
+    assert (
+        'staticwordpress_fetch_latency_seconds{type="HTML",quantile="0.99"} 0.099'
+        in metrics
+    )
+    assert 'staticwordpress_fetch_latency_seconds_count{type="IMAGE"} 1' in metrics
+    assert 'staticwordpress_queue{name="frontier"} 7' in metrics
+
+
+def test_stats_latency_totals_exceed_samples(tmp_path, monkeypatch):
+    monkeypatch.setitem(CONFIGS["STATS"], "MAX_SAMPLES", 10)
+    stats = Stats()
+    for index in range(100):
+        stats.record_fetch("HTML", seconds_=(index + 1) / 1000, bytes_=1000)
+
+    latency = stats.summary()["latency"]["HTML"]
+    assert latency["count"] == 100
+    assert latency["sum"] == 5.05
+    assert latency["p50"] == 0.095
+
+    stats.write_prometheus(tmp_path / "metrics.prom")
+    metrics = (tmp_path / "metrics.prom").read_text().splitlines()
+    assert 'staticwordpress_fetch_latency_seconds_count{type="HTML"} 100' in metrics
+    assert 'staticwordpress_fetch_latency_seconds_sum{type="HTML"} 5.05' in metrics
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_table.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.gui.table import SWDataTable
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_data_table_batches_rows():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    table = SWDataTable(header_=["Hash", "URL", "Code"])
+    inserted, flushed = [], []
+    table.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+    table.rowsFlushed.connect(flushed.append)
+
+    for index in range(1000):
+        table.appendRow([index, f"https://example.com/{index}/", 200 + index % 3])
+    assert table.rowCount() == 0
+
+    QtCore.QTimer.singleShot(500, application.quit)
+    application.exec_()
+    assert inserted == [(0, 999)]
+    assert flushed == [1000]
+    assert table.rowCount() == 1000
+    assert (
+        table.data(table.index(999, 1), QtCore.Qt.DisplayRole)
+        == "https://example.com/999/"
+    )
+
+
+def test_data_table_sort_and_filter():
+    table = SWDataTable(
+        data_=[[3, "/c/", 404], [1, "/a/", 200], [2, "/b/", 301]],
+        header_=["Hash", "Path", "Code"],
+    )
+    table.sort(0)
+    assert [
+        table.data(table.index(row, 1), QtCore.Qt.DisplayRole) for row in range(3)
+    ] == ["/a/", "/b/", "/c/"]
+    assert table.data(table.index(0, 2), SWDataTable.ValueRole) == 200
+
+    table.sort(2, QtCore.Qt.DescendingOrder)
+    table.setFilter("4", column_=2)
+    assert table.rowCount() == 1
+    assert table.data(table.index(0, 2), SWDataTable.ValueRole) == 404
+
+    table.extend([[4, "/d/", 500], [5, "/e/", 204]])
+    assert [
+        table.data(table.index(row, 2), SWDataTable.ValueRole) for row in range(2)
+    ] == [404, 204]
+    assert table.size == 5
+
+    table.setFilter("")
+    table.sort(-1)
+    assert [
+        table.data(table.index(row, 0), SWDataTable.ValueRole) for row in range(5)
+    ] == [3, 1, 2, 4, 5]
+
+
+def test_data_table_merges_into_sorted_view():
+    table = SWDataTable(
+        data_=[[1, "/a/", 200], [2, "/b/", 404], [3, "/c/", 301]],
+        header_=["Hash", "Path", "Code"],
+    )
+    table.sort(2, QtCore.Qt.DescendingOrder)
+    inserted, resets, layouts = [], [], []
+    table.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+    table.modelReset.connect(lambda: resets.append(1))
+    table.layoutChanged.connect(lambda: layouts.append(1))
+
+    table.extend([[4, "/d/", 301], [5, "/e/", 500], [6, "/f/", 100]])
+
+    assert resets == [] and inserted == []
+    assert layouts == [1]
+    assert [
+        table.data(table.index(row, 0), SWDataTable.ValueRole) for row in range(6)
+    ] == [5, 2, 3, 4, 1, 6]
+
+    # rows which stay together are inserted at once
+    table.sort(0)
+    table.setFilter("/", column_=1)
+    table.extend([[8, "/h/", 200], [7, "/g/", 200]])
+    assert inserted == [(6, 7)]
+    assert [
+        table.data(table.index(row, 0), SWDataTable.ValueRole) for row in range(8)
+    ] == [1, 2, 3, 4, 5, 6, 7, 8]
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_utils.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import base64
+import hashlib
+import threading
+from zipfile import ZipFile
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core.errors import DownloadNotValid
+from staticwordpress.core.utils import stream_zip_file, download_file, sync_dir_tree
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+ARCHIVE = bytes(range(256)) * 4096
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves ARCHIVE with Range support, the first GET is cut off halfway"""
+
+    requested_ranges = []
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(ARCHIVE)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        start, end = 0, len(ARCHIVE) - 1
+        if "Range" in self.headers:
+            start, end = map(int, self.headers["Range"][6:].split("-"))
+        self.requested_ranges.append((start, end))
+
+        body = ARCHIVE[start : end + 1]
+        self.send_response(206 if "Range" in self.headers else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if len(self.requested_ranges) == 1:
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+        else:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DigestRequestHandler(RangeRequestHandler):
+    """Serves ARCHIVE and announces its sha256 digest"""
+
+    requested_ranges = []
+    digest = hashlib.sha256(ARCHIVE).digest()
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(ARCHIVE)))
+        self.send_header(
+            "Repr-Digest", f"sha-256=:{base64.b64encode(self.digest).decode()}:"
+        )
+        self.end_headers()
+
+
+def test_stream_zip_file(tmp_path):
+    zip_file_path = tmp_path / "archive.zip"
+    with ZipFile(zip_file_path, "w") as zf:
+        zf.writestr("tmp/simply-static-1/index.html", "home")
+        zf.writestr("tmp/simply-static-1/about/index.html", "about")
+        zf.writestr("tmp/other.txt", "outside archive folder")
+
+    output = tmp_path / "output"
+    output.mkdir()
+    (output / "about").mkdir()
+    (output / "about" / "index.html").write_text("about")
+
+    extracted = stream_zip_file(zip_file_path, output, "simply-static-1")
+
+    assert extracted["written"] == [Path("index.html")]
+    assert extracted["unchanged"] == [Path("about/index.html")]
+    assert (output / "index.html").read_text() == "home"
+    assert not (output / "tmp").exists()
+
+
+def test_download_file_resume(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    progress = []
+
+    output_path = download_file(
+        url_=f"http://127.0.0.1:{server.server_port}/archive.zip",
+        output_path_=tmp_path / "archive.zip",
+        chunk_size_=1 << 16,
+        sha256_=hashlib.sha256(ARCHIVE).hexdigest(),
+        progress_callback_=lambda done, total: progress.append((done, total)),
+    )
+    server.shutdown()
+
+    assert output_path.read_bytes() == ARCHIVE
+    assert RangeRequestHandler.requested_ranges == [
+        (0, len(ARCHIVE) - 1),
+        (len(ARCHIVE) // 2, len(ARCHIVE) - 1),
+    ]
+    assert progress[-1] == (len(ARCHIVE), len(ARCHIVE))
+
+
+def test_download_file_checks_server_digest(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DigestRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/archive.zip"
+
+    output_path = download_file(url_=url, output_path_=tmp_path / "archive.zip")
+    assert output_path.read_bytes() == ARCHIVE
+
+    DigestRequestHandler.digest = hashlib.sha256(b"other").digest()
+    with pytest.raises(DownloadNotValid):
+        download_file(url_=url, output_path_=tmp_path / "other.zip")
+    server.shutdown()
+
+
+def test_sync_dir_tree(tmp_path):
+    output = tmp_path / "output"
+    staging = tmp_path / "staging"
+    for folder, name, content in [
+        (output, "index.html", "old"),
+        (output, "unchanged.html", "same"),
+        (output / "removed", "index.html", "removed"),
+        (output / "_data", ".project.json", "{}"),
+        (output, "CNAME", "example.com"),
+        (staging, "index.html", "new"),
+        (staging / "added", "index.html", "added"),
+    ]:
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / name).write_text(content)
+    inode = (output / "unchanged.html").stat().st_ino
+    manifest = output / "_data" / ".zip-manifest.json"
+    manifest.write_text(
+        json.dumps(["index.html", "unchanged.html", "removed/index.html"])
+    )
+
+    synced = sync_dir_tree(
+        staging, output, unchanged_=[Path("unchanged.html")], manifest_path_=manifest
+    )
+
+    assert synced == {
+        "added": [Path("added/index.html")],
+        "replaced": [Path("index.html")],
+        "deleted": [Path("removed/index.html")],
+    }
+    assert (output / "index.html").read_text() == "new"
+    assert (output / "unchanged.html").stat().st_ino == inode
+    assert (output / "_data" / ".project.json").exists()
+    assert (output / "CNAME").exists()
+    assert not (output / "removed").exists()
+    assert not staging.exists()
+    assert json.loads(manifest.read_text()) == [
+        "added/index.html",
+        "index.html",
+        "unchanged.html",
+    ]
+
+
+def test_sync_dir_tree_without_manifest_keeps_files(tmp_path):
+    output = tmp_path / "output"
+    staging = tmp_path / "staging"
+    for folder, name, content in [
+        (output, "CNAME", "example.com"),
+        (output, ".nojekyll", ""),
+        (output, "old.html", "old"),
+        (staging, "index.html", "new"),
+    ]:
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / name).write_text(content)
+
+    synced = sync_dir_tree(staging, output)
+
+    assert synced["deleted"] == []
+    assert (output / "CNAME").exists()
+    assert (output / ".nojekyll").exists()
+    assert (output / "old.html").exists()
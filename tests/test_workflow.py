@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+STATIC WORDPRESS: WordPress as Static Site Generator
+A Python Package for Converting WordPress Installation to a Static Website
+https://github.com/serpwings/static-wordpress
+
+    tests\test_workflow.py
+    
+    Copyright (C) 2020-2025 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to version 3 of the 
+GNU General Public License (GPL-3.0). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/gpl-3.0.txt
+https://github.com/serpwings/static-wordpress/blob/master/LICENSE
+
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from urllib.parse import urlparse
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from requests.models import Response
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from staticwordpress.core import fetch
+from staticwordpress.core.constants import FETCH, PROJECT, REDIRECTS, SOURCE
+from staticwordpress.core.fetch import FetchBackend
+from staticwordpress.core.project import Project
+from staticwordpress.core.redirects import Redirect
+from staticwordpress.core.utils import get_remote_content
+from staticwordpress.core.workflow import Workflow
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+SITE_URL = "http://example.com"
+
+
+def make_response(url_: str, status_code_: int, text_: str = "") -> Response:
+    response = Response()
+    response.url = url_
+    response.status_code = status_code_
+    response.headers["Content-Type"] = "text/html"
+    response.encoding = "utf-8"
+    response._content = text_.encode("utf-8")
+    return response
+
+
+class FakeBackend(FetchBackend):
+    """Serves pages and redirects from dicts and records the requested paths"""
+
+    def __init__(self, pages_: dict, redirects_: dict = None) -> None:
+        self.pages = pages_
+        self.redirects = redirects_ or dict()
+        self.paths = []
+
+    def get(self, url_: str, headers_: dict = None) -> Response:
+        path = urlparse(url_).path
+        self.paths.append(path)
+        if path in self.redirects:
+            target = self.redirects[path]
+            response = make_response(f"{SITE_URL}{target}", 200, self.pages[target])
+            response.history = [make_response(url_, 301)]
+            return response
+        if path in self.pages:
+            return make_response(url_, 200, self.pages[path])
+        return make_response(url_, 404)
+
+
+def crawl(tmp_path_, monkeypatch_, backend_: FetchBackend, redirects_=()) -> Workflow:
+    monkeypatch_.setattr(fetch, "_FETCHERS", {FETCH.REQUESTS: backend_})
+    get_remote_content.cache_clear()
+
+    (tmp_path_ / "_data").mkdir()
+    project = Project(tmp_path_ / "_data" / ".project.json")
+    project.status = PROJECT.NEW
+    project.src_type = SOURCE.CRAWL
+    project.src_url = SITE_URL
+    project.output = tmp_path_
+    project.sitemap = ""
+    project.delay = 0
+
+    workflow = Workflow()
+    workflow.set_project(project)
+    workflow.clear()
+    for redirect in redirects_:
+        workflow.redirects.add_redirect(redirect)
+    workflow.crawl_url(loc_=project.src_url)
+    workflow.shutdown()
+    return workflow
+
+
+def test_crawl_turns_followed_redirects_into_rules(tmp_path, monkeypatch):
+    backend = FakeBackend(
+        pages_={
+            "/": f'<a href="{SITE_URL}/old/">old</a>',
+            "/new/": "new page",
+        },
+        redirects_={"/old/": "/new/"},
+    )
+    workflow = crawl(tmp_path, monkeypatch, backend)
+
+    redirect = workflow.redirects.match("/old/")
+    assert redirect is not None
+    assert redirect.to_url == "/new/"
+    assert redirect.status == 301
+    assert redirect.source == REDIRECTS.CRAWL.value
+    assert (tmp_path / "new" / "index.html").read_text() == "new page"
+    assert not (tmp_path / "old" / "index.html").exists()
+
+
+def test_crawl_skips_known_redirect_sources(tmp_path, monkeypatch):
+    backend = FakeBackend(
+        pages_={
+            "/": f'<a href="{SITE_URL}/skip/">skip</a>',
+            "/new/": "new page",
+        },
+        redirects_={"/skip/": "/new/"},
+    )
+    known = Redirect("/skip/", "/new/", None, 301, True, REDIRECTS.NONE.value)
+    workflow = crawl(tmp_path, monkeypatch, backend, redirects_=[known])
+
+    assert "/" in backend.paths
+    assert "/skip/" not in backend.paths
+    assert workflow.redirects.match("/skip/").source == REDIRECTS.NONE.value